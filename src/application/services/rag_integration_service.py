@@ -1,7 +1,7 @@
 """RAG integration service for story generation pipeline."""
 
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 
 from application.services.rag_service import RAGService
@@ -58,6 +58,18 @@ class RAGIntegrationService:
         
         return await self.initialize_story(identifier)
     
+    async def count_content_by_type_and_metadata(
+        self,
+        content_type: str,
+        metadata_filters: Optional[Dict[str, Any]] = None,
+        story_identifier: Optional[str] = None
+    ) -> int:
+        """Count indexed content chunks by type and metadata, e.g. to see whether something is already indexed."""
+        story_id = await self._get_or_create_story_id(story_identifier)
+        return await self.rag_service.count_content_by_type_and_metadata(
+            story_id, content_type, metadata_filters
+        )
+    
     async def cleanup_content_by_type_and_metadata(
         self,
         content_type: str,
@@ -184,6 +196,35 @@ class RAGIntegrationService:
         logger.info(f"Indexed {len(chunks)} character chunks for '{character_name}' in story {story_id}")
         return chunk_ids
     
+    async def index_character_batch(
+        self,
+        character_name: str,
+        contents: List[Tuple[str, Dict[str, Any]]],
+        story_identifier: Optional[str] = None
+    ) -> List[int]:
+        """Index several pieces of one character's information, given as (content, metadata) pairs, in one batch."""
+        story_id = await self._get_or_create_story_id(story_identifier)
+        
+        chunks = [
+            chunk
+            for character_content, metadata in contents
+            for chunk in self.content_chunker.chunk_character_sheet(character_content, character_name, metadata or {})
+        ]
+        
+        chunk_ids = await self.rag_service.index_contents(story_id, [
+            {
+                "content_type": chunk.chunk_type,
+                "content": chunk.content,
+                "metadata": chunk.metadata,
+                "title": chunk.title,
+                "content_subtype": chunk.chunk_subtype
+            }
+            for chunk in chunks
+        ])
+        
+        logger.info(f"Indexed {len(chunks)} character chunks for '{character_name}' in story {story_id}")
+        return chunk_ids
+    
     async def index_setting(
         self,
         setting_content: str,
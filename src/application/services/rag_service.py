@@ -105,6 +105,28 @@ class RAGService:
             logger.error(f"Failed to index content: {e}")
             raise StorageError(f"Failed to index content: {e}")
     
+    async def index_contents(self, story_id: int, items: List[Dict[str, Any]]) -> List[int]:
+        """Index several pieces of content with one embedding request batch and one store transaction.
+        
+        Each item holds the keyword arguments of ``index_content`` other than ``story_id``.
+        Returns the chunk IDs in item order.
+        """
+        if not items:
+            return []
+        try:
+            embeddings = await self.embedding_provider.get_embeddings([item["content"] for item in items])
+            rows = [
+                {**item, "story_id": story_id, "embedding": embedding.tolist() if hasattr(embedding, 'tolist') else embedding}
+                for item, embedding in zip(items, embeddings)
+            ]
+            chunk_ids = await self.vector_store.store_embeddings(rows)
+            logger.debug(f"Indexed {len(chunk_ids)} content items in one batch")
+            return chunk_ids
+            
+        except Exception as e:
+            logger.error(f"Failed to index content batch: {e}")
+            raise StorageError(f"Failed to index content batch: {e}")
+    
     async def search_similar(
         self,
         story_id: int,
@@ -415,6 +437,17 @@ class RAGService:
             logger.error(f"Failed to get story summary: {e}")
             return {}
     
+    async def count_content_by_type_and_metadata(
+        self,
+        story_id: int,
+        content_type: str,
+        metadata_filters: Optional[Dict[str, Any]] = None
+    ) -> int:
+        """Count content chunks by type and optional metadata filters."""
+        return await self.vector_store.count_content_by_type_and_metadata(
+            story_id, content_type, metadata_filters
+        )
+    
     async def delete_content_by_type_and_metadata(
         self,
         story_id: int,
@@ -0,0 +1,80 @@
+"""Similarity cache for extraction results keyed by their input text."""
+
+import hashlib
+import logging
+import math
+from typing import Any, Dict, List, Optional, Tuple
+
+from infrastructure.providers.ollama_embedding_provider import OllamaEmbeddingProvider
+
+logger = logging.getLogger(__name__)
+
+
+class SemanticCache:
+    """In-memory cache returning a stored result for identical or near-identical input text.
+
+    Exact matches are found by SHA-256 of the text. When an embedding provider is
+    available, a miss falls back to the stored entry with the highest cosine
+    similarity, returned only if it clears ``similarity_threshold``.
+    """
+
+    def __init__(
+        self,
+        embedding_provider: Optional[OllamaEmbeddingProvider] = None,
+        similarity_threshold: float = 0.95
+    ):
+        self.embedding_provider = embedding_provider
+        self.similarity_threshold = similarity_threshold
+        self._exact: Dict[str, Any] = {}
+        self._vectors: List[Tuple[List[float], float, Any]] = []
+
+    @staticmethod
+    def _digest(text: str) -> str:
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    async def _embed(self, text: str) -> Optional[List[float]]:
+        if not self.embedding_provider:
+            return None
+        try:
+            embedding = await self.embedding_provider.get_single_embedding(text)
+        except Exception as e:
+            logger.debug(f"Semantic cache embedding failed, using exact match only: {e}")
+            return None
+        if hasattr(embedding, "tolist"):
+            embedding = embedding.tolist()
+        return embedding
+
+    async def get(self, text: str) -> Tuple[Optional[Any], Optional[List[float]]]:
+        """Return (cached result or None, embedding of text) for a lookup.
+
+        The embedding is handed back so a subsequent ``put`` does not embed twice.
+        """
+        digest = self._digest(text)
+        if digest in self._exact:
+            return self._exact[digest], None
+
+        embedding = await self._embed(text)
+        if not embedding or not self._vectors:
+            return None, embedding
+
+        norm = math.sqrt(sum(x * x for x in embedding))
+        if norm == 0:
+            return None, embedding
+
+        best_score, best_result = 0.0, None
+        for vector, vector_norm, result in self._vectors:
+            if len(vector) != len(embedding) or vector_norm == 0:
+                continue
+            score = sum(a * b for a, b in zip(embedding, vector)) / (norm * vector_norm)
+            if score > best_score:
+                best_score, best_result = score, result
+
+        if best_score >= self.similarity_threshold:
+            return best_result, embedding
+        return None, embedding
+
+    def put(self, text: str, result: Any, embedding: Optional[List[float]] = None) -> None:
+        """Store a result for text, indexing its embedding when one is supplied."""
+        self._exact[self._digest(text)] = result
+        if embedding:
+            self._vectors.append((embedding, math.sqrt(sum(x * x for x in embedding)), result))
@@ -1,17 +1,23 @@
 """Chapter generation functionality for the outline-chapter strategy."""
 
+import asyncio
 import json
+import logging
 import os
 import re
-from typing import List, Optional, Dict, Any
+from collections import ChainMap
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import List, Optional, Dict, Any, Mapping, Set, Tuple
 from domain.entities.story import Outline, Chapter, Scene
 from domain.value_objects.generation_settings import GenerationSettings
 from domain.value_objects.model_config import ModelConfig
-from domain.exceptions import StoryGenerationError
+from domain.exceptions import StoryGenerationError, StorageError
 
 from application.interfaces.model_provider import ModelProvider
 from infrastructure.prompts.prompt_handler import PromptHandler
-from infrastructure.prompts.prompt_wrapper import execute_prompt_with_savepoint
+from infrastructure.prompts.prompt_wrapper import execute_prompt_with_savepoint, execute_messages_with_savepoint
 from infrastructure.savepoints import SavepointManager
 from application.services.rag_service import RAGService
 from application.services.rag_integration_service import RAGIntegrationService
@@ -22,6 +28,85 @@ from .recap_manager import RecapManager
 from .scene_generator import SceneGenerator
 from .story_state_manager import StoryStateManager
 
+logger = logging.getLogger(__name__)
+
+# orjson parses savepointed JSON (scene definitions can be large) noticeably faster
+# than the stdlib; both raise ValueError subclasses on malformed input.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+# Chapter headings recognised when the chapter list has to be parsed from plain text
+_CHAPTER_HEADING_RE = re.compile(r"(?:## )?Chapter")
+
+# Structured output of the fused disambiguate-and-clean outline prompt
+_POLISHED_OUTLINE_SCHEMA = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "disambiguated": {"type": "string"},
+        "cleaned": {"type": "string"}
+    },
+    "required": ["disambiguated", "cleaned"]
+})
+
+
+@dataclass(frozen=True)
+class _ChapterItem:
+    """One entry of the chapter list extracted from the combined outline."""
+    number: int
+    title: str
+    description: str
+
+
+def _parse_chapter_list(content: str) -> List[_ChapterItem]:
+    """Parse the extracted chapter list JSON, raising ValueError if it is not a list of chapters.
+    
+    A missing number falls back to the entry's position and a missing title to "Chapter N".
+    """
+    entries = _json_loads(content)
+    if not isinstance(entries, list):
+        raise ValueError("Response is not a list")
+    
+    chapters = []
+    for position, entry in enumerate(entries, 1):
+        if not isinstance(entry, dict):
+            raise ValueError(f"Chapter entry {position} is not an object")
+        try:
+            number = int(entry.get("number") or position)
+        except (TypeError, ValueError):
+            raise ValueError(f"Chapter entry {position} has an invalid number: {entry.get('number')!r}")
+        chapters.append(_ChapterItem(
+            number=number,
+            title=str(entry.get("title") or f"Chapter {number}"),
+            description=str(entry.get("description") or "")
+        ))
+    return chapters
+
+
+def _scan_chapter_dirs(story_dir: Path) -> int:
+    """Return the highest N among "chapter_N" subdirectories of story_dir (0 if none)."""
+    chapter_count = 0
+    try:
+        with os.scandir(story_dir) as entries:
+            for entry in entries:
+                # Match directories like "chapter_1", "chapter_42", etc.
+                if not entry.name.startswith("chapter_") or not entry.is_dir(follow_symlinks=False):
+                    continue
+                suffix = entry.name[len("chapter_"):]
+                if suffix.isdigit():
+                    chapter_count = max(chapter_count, int(suffix))
+    except FileNotFoundError:
+        return 0
+    return chapter_count
+
+
+def _assemble_chapter_content(scenes: List[Scene]) -> str:
+    """Join scenes into chapter text, one "## title" section per scene."""
+    return "\n\n".join(f"## {scene.title}\n\n{scene.content}" for scene in scenes)
+
 
 class ChapterGenerator:
     """Handles chapter generation functionality."""
@@ -45,6 +130,30 @@ class ChapterGenerator:
         # RAG integration service will be set by the strategy after story initialization
         self.rag_integration = None
         
+        self._model_configs = ModelConfig.from_mapping(self.config.get("models", {}))
+        
+        # Chapter synopses produced or loaded during this run, keyed by chapter number
+        self._synopsis_cache: Dict[int, str] = {}
+        
+        # Characters and settings extracted from each synopsis, reused for the content pass
+        self._synopsis_chars: Dict[int, List[str]] = {}
+        self._synopsis_settings: Dict[int, List[str]] = {}
+        
+        # Bounds the chapter-synopsis enrichment calls in flight across all chapters
+        self._enrichment_semaphore = asyncio.Semaphore(self.config.get("enrichment_concurrency", 5))
+        
+        # Story-wide character and setting enrichment prompts shared by every chapter
+        self._entity_prompts_task: Optional[asyncio.Task] = None
+        self._entity_prompts_for: Optional[str] = None
+        
+        # Recaps written or read this run, and the story start date once it has been read
+        self._recap_by_chapter: Dict[int, str] = {}
+        self._story_start_date: Optional[str] = None
+        
+        # Story-wide prompt variables, built once per outline (see _story_context)
+        self._story_ctx: Optional[Mapping[str, Any]] = None
+        self._story_ctx_outline: Optional[Outline] = None
+        
         # Initialize managers
         self.character_manager = CharacterManager(
             model_provider=model_provider,
@@ -104,313 +213,462 @@ class ChapterGenerator:
             chapter_count = 0
             story_dir = self.savepoint_manager.savepoint_repo._current_story_dir
             
-            if story_dir and os.path.exists(story_dir):
-                for item in os.listdir(story_dir):
-                    # Match pattern like "chapter_1", "chapter_42", etc.
-                    match = re.match(r'chapter_(\d+)$', item)
-                    if match:
-                        chapter_num = int(match.group(1))
-                        chapter_count = max(chapter_count, chapter_num)
+            if story_dir:
+                # Directory scan runs off the event loop; slow filesystems shouldn't stall other tasks
+                chapter_count = await asyncio.to_thread(_scan_chapter_dirs, story_dir)
             
             if chapter_count == 0:
-                print(f"No chapter directories found in {story_dir}. Returning empty list.")
+                logger.info("No chapter directories found in %s. Returning empty list.", story_dir)
                 return []
             
-            print(f"Found {chapter_count} chapter directories in {story_dir}.")
+            logger.info("Found %s chapter directories in %s.", chapter_count, story_dir)
             
-            # Single loop: process each chapter through all steps
-            chapters = []
-            for chapter_num in range(1, chapter_count + 1):
-                try:
-                    print(f"\nProcessing Chapter {chapter_num}...")
-                    
-                    # Step 1: Generate/load chapter outline
-                    print(f"  Step 1: Checking outline for Chapter {chapter_num}...")
-                    chapter_outline = None
-                    try:
-                        if await self.savepoint_manager.has_step(f"chapter_{chapter_num}/outline"):
-                            print(f"  Chapter {chapter_num} outline already exists, loading...")
-                            chapter_outline = await self.savepoint_manager.load_step(f"chapter_{chapter_num}/outline")
-                        else:
-                            # Verify that this chapter has a synopsis
-                            try:
-                                synopsis = await self.savepoint_manager.load_step(f"chapter_{chapter_num}/synopsis")
-                                if not synopsis or synopsis.strip() == "":
-                                    print(f"  Chapter {chapter_num} has no synopsis, skipping...")
-                                    continue
-                            except:
-                                print(f"  Chapter {chapter_num} synopsis not found, skipping...")
-                                continue
-                            
-                            print(f"  Generating outline for Chapter {chapter_num}...")
-
-
-
-                            chapter_outline = await self._generate_chapter_outline(
-                                chapter_num=chapter_num,
-                                chapter_synopsis=synopsis,
-                                outline=outline,
-                                settings=settings
-                            )
-                    except Exception as e:
-                        print(f"  Error processing outline for Chapter {chapter_num}: {e}")
-                        continue
+            chapter_concurrency = max(1, int(self.config.get("chapter_concurrency", 1)))
+            pipeline_depth = max(0, int(self.config.get("pipeline_depth", 0)))
+            if chapter_concurrency == 1 and pipeline_depth > 0:
+                # Opt-in: outline upcoming chapters while the current chapter's scenes are written
+                chapters = await self._generate_chapters_pipelined(chapter_count, outline, settings, pipeline_depth)
+            elif chapter_concurrency == 1:
+                # Each chapter builds on the previous chapter's recap, so process in order
+                chapters = []
+                for chapter_num in range(1, chapter_count + 1):
+                    chapter = await self._process_one_chapter(chapter_num, chapter_count, outline, settings)
+                    if chapter is not None:
+                        chapters.append(chapter)
+            else:
+                # Opt-in: overlap chapters, trading recap continuity for throughput
+                semaphore = asyncio.Semaphore(chapter_concurrency)
+                slots: List[Optional[Chapter]] = [None] * chapter_count
+                
+                async def _run(chapter_num: int) -> None:
+                    # _process_one_chapter reports its own failures and returns None,
+                    # so one bad chapter never cancels its siblings
+                    async with semaphore:
+                        slots[chapter_num - 1] = await self._process_one_chapter(
+                            chapter_num, chapter_count, outline, settings
+                        )
+                
+                await asyncio.gather(*(_run(chapter_num) for chapter_num in range(1, chapter_count + 1)))
+                
+                chapters = [chapter for chapter in slots if chapter is not None]
+            
+            return chapters
+            
+        except Exception as e:
+            raise StoryGenerationError(f"Failed to generate chapters: {e}") from e
+    
+    async def _safe_load(self, step_name: Optional[str]) -> Optional[Any]:
+        """Load a savepoint step, returning None when it is missing or unreadable."""
+        if not step_name or not self.savepoint_manager:
+            return None
+        try:
+            return await self.savepoint_manager.load_step(step_name)
+        except StorageError:
+            return None
+    
+    async def _get_previous_recap(self, chapter_num: int) -> str:
+        """Return the recap of the chapter before chapter_num, or "" if there is none."""
+        if chapter_num <= 1:
+            return ""
+        if chapter_num - 1 in self._recap_by_chapter:
+            return self._recap_by_chapter[chapter_num - 1]
+        try:
+            recap = await self.savepoint_manager.load_step(f"chapter_{chapter_num-1}/recap", required=True)
+        except StorageError:
+            return ""
+        recap = recap or ""
+        if recap:
+            self._recap_by_chapter[chapter_num - 1] = recap
+        return recap
+    
+    async def _get_story_start_date(self) -> Optional[str]:
+        """Return the saved story start date, reading it from the savepoint only once."""
+        if self._story_start_date is None:
+            try:
+                self._story_start_date = await self.savepoint_manager.load_step("story_start_date", required=True)
+            except StorageError:
+                return None
+        return self._story_start_date
+    
+    async def _process_one_chapter(
+        self,
+        chapter_num: int,
+        chapter_count: int,
+        outline: Outline,
+        settings: GenerationSettings
+    ) -> Optional[Chapter]:
+        """Run a single chapter through outline, scenes, recap and title generation."""
+        prepared = await self._prepare_chapter_outline(chapter_num, outline, settings)
+        if prepared is None:
+            return None
+        existing_steps, chapter_outline = prepared
+        return await self._complete_chapter(
+            chapter_num, chapter_count, chapter_outline, existing_steps, outline, settings
+        )
+    
+    async def _prepare_chapter_outline(
+        self,
+        chapter_num: int,
+        outline: Outline,
+        settings: GenerationSettings,
+        previous_done: Optional[asyncio.Event] = None
+    ) -> Optional[Tuple[Set[str], str]]:
+        """Load or generate a chapter's outline; returns (saved step names, outline) or None to skip.
+        
+        ``previous_done`` is set once the previous chapter is complete; a new outline waits for
+        it before reading the sheets and recap that chapter updates.
+        """
+        try:
+            logger.info("\nProcessing Chapter %s...", chapter_num)
+            
+            # One directory listing answers every "does this step exist" question below
+            existing_steps = await self.savepoint_manager.list_steps(f"chapter_{chapter_num}")
+            
+            # Step 1: Generate/load chapter outline
+            logger.info("  Step 1: Checking outline for Chapter %s...", chapter_num)
+            chapter_outline = None
+            try:
+                if "outline" in existing_steps:
+                    logger.info("  Chapter %s outline already exists, loading...", chapter_num)
+                    chapter_outline = await self.savepoint_manager.load_step(f"chapter_{chapter_num}/outline")
+                else:
+                    # Verify that this chapter has a synopsis
+                    if "synopsis" not in existing_steps:
+                        logger.info("  Chapter %s synopsis not found, skipping...", chapter_num)
+                        return None
+                    synopsis = await self.savepoint_manager.load_step(f"chapter_{chapter_num}/synopsis")
+                    if not synopsis or synopsis.strip() == "":
+                        logger.info("  Chapter %s has no synopsis, skipping...", chapter_num)
+                        return None
                     
-                    # Step 2: Generate/load chapter scenes
-                    print(f"  Step 2: Checking scenes for Chapter {chapter_num}...")
-                    chapter_scenes = []
+                    logger.info("  Generating outline for Chapter %s...", chapter_num)
+                    chapter_outline = await self._generate_chapter_outline(
+                        chapter_num=chapter_num,
+                        chapter_synopsis=synopsis,
+                        outline=outline,
+                        settings=settings,
+                        previous_done=previous_done
+                    )
+            except Exception as e:
+                logger.error("  Error processing outline for Chapter %s: %s", chapter_num, e)
+                return None
+            
+            return existing_steps, chapter_outline
+            
+        except Exception as e:
+            logger.error("Error processing Chapter %s: %s", chapter_num, e)
+            return None
+    
+    async def _complete_chapter(
+        self,
+        chapter_num: int,
+        chapter_count: int,
+        chapter_outline: str,
+        existing_steps: Set[str],
+        outline: Outline,
+        settings: GenerationSettings
+    ) -> Optional[Chapter]:
+        """Generate or load a chapter's scenes, recap and title from its outline."""
+        try:
+            # Step 2: Generate/load chapter scenes
+            logger.info("  Step 2: Checking scenes for Chapter %s...", chapter_num)
+            chapter_scenes = []
+            try:
+                # First, check if scene definitions exist and load them
+                expected_scene_count = 0
+                scene_definitions = []
+                
+                if "scene_definitions" in existing_steps:
+                    logger.info("  Chapter %s scene definitions found, loading...", chapter_num)
                     try:
-                        # First, check if scene definitions exist and load them
-                        expected_scene_count = 0
-                        scene_definitions = []
-                        
-                        if await self.savepoint_manager.has_step(f"chapter_{chapter_num}/scene_definitions"):
-                            print(f"  Chapter {chapter_num} scene definitions found, loading...")
-                            try:
-                                # Load and parse scene definitions
-                                scene_definitions_raw = await self.savepoint_manager.load_step(f"chapter_{chapter_num}/scene_definitions")
-                                
-                                # Parse JSON directly since this is loaded from savepoint
-                                try:
-                                    scene_definitions = json.loads(scene_definitions_raw)
-                                    
-                                    # Validate that we got a list of scene objects
-                                    if isinstance(scene_definitions, list):
-                                        expected_scene_count = len(scene_definitions)
-                                        if settings.debug:
-                                            print(f"    Successfully parsed {expected_scene_count} scene definitions from JSON")
-                                    else:
-                                        raise ValueError("Expected JSON array of scenes")
-                                        
-                                except (json.JSONDecodeError, ValueError) as e:
-                                    if settings.debug:
-                                        print(f"    JSON parsing failed: {e}, will regenerate scene definitions")
-                                    scene_definitions = []
-                                    expected_scene_count = 0
-                            except Exception as e:
-                                if settings.debug:
-                                    print(f"    Error loading scene definitions: {e}, will regenerate")
-                                scene_definitions = []
-                                expected_scene_count = 0
+                        # Load and parse scene definitions
+                        scene_definitions_raw = await self.savepoint_manager.load_step(f"chapter_{chapter_num}/scene_definitions")
                         
-                        # Check if all expected scenes already exist
-                        if expected_scene_count > 0:
-                            all_scenes_exist = True
-                            missing_scenes = []
+                        # Parse JSON directly since this is loaded from savepoint
+                        try:
+                            scene_definitions = _json_loads(scene_definitions_raw)
                             
-                            for scene_num in range(1, expected_scene_count + 1):
-                                if not await self.savepoint_manager.has_step(f"chapter_{chapter_num}/scene_{scene_num}"):
-                                    all_scenes_exist = False
-                                    missing_scenes.append(scene_num)
-                            
-                            if all_scenes_exist:
-                                print(f"  Chapter {chapter_num} has all {expected_scene_count} scenes, loading...")
-                                # Load existing scenes
-                                for scene_num in range(1, expected_scene_count + 1):
-                                    scene_content = await self.savepoint_manager.load_step(f"chapter_{chapter_num}/scene_{scene_num}")
-                                    scene_title = await self.savepoint_manager.load_step(f"chapter_{chapter_num}/scene_{scene_num}_title")
-                                    
-                                    scene = Scene(
-                                        number=scene_num,
-                                        title=scene_title,
-                                        content=scene_content,
-                                        outline=""
-                                    )
-                                    chapter_scenes.append(scene)
-                                
-                                chapter_content = "\n\n".join([f"## {scene.title}\n\n{scene.content}" for scene in chapter_scenes])
+                            # Validate that we got a list of scene objects
+                            if isinstance(scene_definitions, list):
+                                expected_scene_count = len(scene_definitions)
+                                logger.debug("    Successfully parsed %s scene definitions from JSON", expected_scene_count)
                             else:
-                                print(f"  Chapter {chapter_num} missing scenes: {missing_scenes}, regenerating all scenes...")
-                                # Some scenes are missing, regenerate all
-                                scene_definitions = []
-                                expected_scene_count = 0
-                        else:
-                            print(f"  Chapter {chapter_num} has no scene definitions, will generate...")
-                        
-                        # If we need to generate scenes (either no definitions or missing scenes)
-                        if expected_scene_count == 0 or len(chapter_scenes) == 0:
-                            print(f"  Generating scenes for Chapter {chapter_num}...")
-                            
-                            # Update managers with current savepoint manager
-                            self.recap_manager.savepoint_manager = self.savepoint_manager
-                            self.scene_generator.savepoint_manager = self.savepoint_manager
-                            
-                            # Get previous chapter recap
-                            previous_recap = await self.recap_manager.get_previous_chapter_recap_from_savepoint(
-                                chapter_num, outline, settings
-                            )
-                            
-                            # Get next chapter synopsis
-                            next_chapter_synopsis = await self._get_next_chapter_synopsis_from_savepoint(
-                                chapter_num, chapter_count, settings
-                            )
-
-                            chapter_outline_for_scene = await self.savepoint_manager.load_step(f"chapter_{chapter_num}/disambiguated_outline")
-                            
-                            # Update the scene generator's savepoint manager to ensure character/setting managers have access
-                            self.scene_generator.update_savepoint_manager(self.savepoint_manager)
-                            
-                            # Generate scenes for this chapter
-                            chapter_scenes = await self.scene_generator.generate_scenes(
-                                chapter_num=chapter_num,
-                                chapter_count=chapter_count,
-                                chapter_outline=chapter_outline_for_scene,
-                                base_context=outline.base_context,
-                                story_elements=outline.story_elements,
-                                previous_recap=previous_recap,
-                                next_chapter_synopsis=next_chapter_synopsis,
-                                settings=settings
-                            )
-                            
-                            # Combine scenes into chapter content
-                            chapter_content = "\n\n".join([f"## {scene.title}\n\n{scene.content}" for scene in chapter_scenes])
-                            
-                            # Save the combined content
-                            await self.savepoint_manager.save_step(f"chapter_{chapter_num}/content", chapter_content)
-                            print(f"  Chapter {chapter_num} scenes generated and combined.")
-                            
-                            # Update character and setting sheets based on new chapter content
-                            print(f"  Updating character and setting sheets for Chapter {chapter_num}...")
-                            try:
-                                # Extract character names from chapter content
-                                chapter_characters = await self.character_manager.extract_chapter_characters(chapter_content, chapter_num, settings)
-                                if chapter_characters:
-                                    print(f"    Found characters in chapter: {', '.join(chapter_characters)}")
-                                    # Update character sheets based on new chapter content
-                                    await self.character_manager.update_character_sheets(
-                                        chapter_characters, chapter_content, chapter_num, settings
-                                    )
-                                
-                                # Extract setting names from chapter content
-                                chapter_settings = await self.setting_manager.extract_chapter_settings(chapter_content, chapter_num, settings)
-                                if chapter_settings:
-                                    print(f"    Found settings in chapter: {', '.join(chapter_settings)}")
-                                    # Update setting sheets based on new chapter content
-                                    await self.setting_manager.update_setting_sheets(
-                                        chapter_settings, chapter_content, chapter_num, settings
-                                    )
+                                raise ValueError("Expected JSON array of scenes")
                                 
-                                print(f"    Character and setting sheets updated for Chapter {chapter_num}")
-                                
-                            except Exception as e:
-                                print(f"    Warning: Failed to update character/setting sheets for Chapter {chapter_num}: {e}")
-                                # Continue processing even if updates fail
+                        except (TypeError, ValueError) as e:
+                            logger.debug("    JSON parsing failed: %s, will regenerate scene definitions", e)
+                            scene_definitions = []
+                            expected_scene_count = 0
                     except Exception as e:
-                        print(f"  Error processing scenes for Chapter {chapter_num}: {e}")
-                        continue
+                        logger.debug("    Error loading scene definitions: %s, will regenerate", e)
+                        scene_definitions = []
+                        expected_scene_count = 0
+                
+                # Check if all expected scenes already exist
+                if expected_scene_count > 0:
+                    needed = {f"scene_{scene_num}" for scene_num in range(1, expected_scene_count + 1)}
+                    missing_scenes = sorted(int(name[6:]) for name in needed - existing_steps)
                     
-                    # Step 3: Generate/load chapter recap
-                    print(f"  Step 3: Checking recap for Chapter {chapter_num}...")
-                    try:
-                        if await self.savepoint_manager.has_step(f"chapter_{chapter_num}/recap"):
-                            print(f"  Chapter {chapter_num} recap already exists, skipping...")
-                        else:
-                            print(f"  Generating recap for Chapter {chapter_num}...")
-                            
-                            # Get previous chapter recap
-                            previous_recap = ""
-                            if chapter_num > 1:
-                                try:
-                                    previous_recap = await self.savepoint_manager.load_step(f"chapter_{chapter_num-1}/recap")
-                                except:
-                                    if settings.debug:
-                                        print(f"    No previous recap found for chapter {chapter_num-1}")
-                            
-                            # Get story start date from savepoint or use a default
-                            story_start_date = "2024-01-01"  # Default fallback
-                            try:
-                                story_start_date = await self.savepoint_manager.load_step("story_start_date")
-                            except:
-                                if settings.debug:
-                                    print(f"    Using default story start date for chapter {chapter_num}")
-                            
-                            # Generate recap for this chapter
-                            chapter_recap = await self.recap_manager.generate_chapter_recap(
-                                chapter_num=chapter_num,
-                                chapter_content=chapter_content,
-                                chapter_outline=chapter_outline,
-                                story_start_date=story_start_date,
-                                previous_chapter_recap=previous_recap,
-                                settings=settings
-                            )
-                            
-                            # Save the recap to savepoint
-                            await self.savepoint_manager.save_step(f"chapter_{chapter_num}/recap", chapter_recap)
-                            
-                            if settings.debug:
-                                print(f"    Generated and saved recap for chapter {chapter_num}")
-                            else:
-                                print(f"    Chapter {chapter_num} recap generated and saved.")
-                    except Exception as e:
-                        print(f"  Error processing recap for Chapter {chapter_num}: {e}")
-                        # Continue to next step even if recap fails
+                    if not missing_scenes:
+                        logger.info("  Chapter %s has all %s scenes, loading...", chapter_num, expected_scene_count)
+                        # Load existing scenes in one batch
+                        chapter_scenes = list(await asyncio.gather(*[
+                            self.scene_generator.load_saved_scene(chapter_num, scene_num)
+                            for scene_num in range(1, expected_scene_count + 1)
+                        ]))
+                        
+                        chapter_content = _assemble_chapter_content(chapter_scenes)
+                    else:
+                        logger.info("  Chapter %s missing scenes: %s, regenerating all scenes...", chapter_num, missing_scenes)
+                        # Some scenes are missing, regenerate all
+                        scene_definitions = []
+                        expected_scene_count = 0
+                else:
+                    logger.info("  Chapter %s has no scene definitions, will generate...", chapter_num)
+                
+                # If we need to generate scenes (either no definitions or missing scenes)
+                if expected_scene_count == 0 or len(chapter_scenes) == 0:
+                    logger.info("  Generating scenes for Chapter %s...", chapter_num)
+                    
+                    # Update managers with current savepoint manager
+                    self.recap_manager.savepoint_manager = self.savepoint_manager
+                    self.scene_generator.savepoint_manager = self.savepoint_manager
+                    
+                    # Previous recap, next synopsis and the outline to write from are independent reads
+                    previous_recap, next_chapter_synopsis, chapter_outline_for_scene = await asyncio.gather(
+                        self.recap_manager.get_previous_chapter_recap_from_savepoint(
+                            chapter_num, outline, settings
+                        ),
+                        self._get_next_chapter_synopsis_from_savepoint(
+                            chapter_num, chapter_count, settings
+                        ),
+                        self.savepoint_manager.load_step(f"chapter_{chapter_num}/disambiguated_outline")
+                    )
                     
-                    # Step 4: Generate title and create Chapter object
-                    print(f"  Step 4: Creating Chapter object for Chapter {chapter_num}...")
+                    # Update the scene generator's savepoint manager to ensure character/setting managers have access
+                    self.scene_generator.update_savepoint_manager(self.savepoint_manager)
+                    
+                    # Generate scenes for this chapter
+                    story_ctx = self._story_context(outline)
+                    chapter_scenes = await self.scene_generator.generate_scenes(
+                        chapter_num=chapter_num,
+                        chapter_count=chapter_count,
+                        chapter_outline=chapter_outline_for_scene,
+                        base_context=story_ctx["base_context"],
+                        story_elements=story_ctx["story_elements"],
+                        previous_recap=previous_recap,
+                        next_chapter_synopsis=next_chapter_synopsis,
+                        settings=settings
+                    )
+                    
+                    # Combine scenes into chapter content
+                    chapter_content = _assemble_chapter_content(chapter_scenes)
+                    
+                    # Save the combined content
+                    await self.savepoint_manager.save_step(f"chapter_{chapter_num}/content", chapter_content)
+                    logger.info("  Chapter %s scenes generated and combined.", chapter_num)
+                    
+                    # Update character and setting sheets based on new chapter content
+                    logger.info("  Updating character and setting sheets for Chapter %s...", chapter_num)
                     try:
-                        # Generate chapter title
-                        title = await self._generate_chapter_title(
-                            chapter_num, chapter_content, chapter_outline, settings
+                        # Start from the synopsis-phase characters and only ask for ones new in the content
+                        known_characters = self._synopsis_chars.get(chapter_num)
+                        if known_characters is None:
+                            known_characters = await self.character_manager.extract_chapter_characters(chapter_content, chapter_num, settings)
+                        new_characters = await self.character_manager.extract_new_characters(
+                            chapter_content, known_characters, chapter_num, settings
                         )
+                        chapter_characters = [*known_characters, *new_characters]
+                        if chapter_characters:
+                            logger.info("    Found characters in chapter: %s", ', '.join(chapter_characters))
+                            # Update character sheets based on new chapter content
+                            await self.character_manager.update_character_sheets(
+                                chapter_characters, chapter_content, chapter_num, settings
+                            )
                         
-                        chapter = Chapter(
-                            number=chapter_num,
-                            title=title,
-                            content=chapter_content,
-                            outline=chapter_outline,
-                            scenes=chapter_scenes
+                        # Same for settings
+                        known_settings = self._synopsis_settings.get(chapter_num)
+                        if known_settings is None:
+                            known_settings = await self.setting_manager.extract_chapter_settings(chapter_content, chapter_num, settings)
+                        new_settings = await self.setting_manager.extract_new_settings(
+                            chapter_content, known_settings, chapter_num, settings
                         )
-                        chapters.append(chapter)
-                        print(f"  Chapter {chapter_num} object created: '{title}'")
+                        chapter_settings = [*known_settings, *new_settings]
+                        if chapter_settings:
+                            logger.info("    Found settings in chapter: %s", ', '.join(chapter_settings))
+                            # Update setting sheets based on new chapter content
+                            await self.setting_manager.update_setting_sheets(
+                                chapter_settings, chapter_content, chapter_num, settings
+                            )
+                        
+                        logger.info("    Character and setting sheets updated for Chapter %s", chapter_num)
                         
                     except Exception as e:
-                        print(f"  Error creating Chapter {chapter_num} object: {e}")
-                        continue
+                        logger.warning("    Failed to update character/setting sheets for Chapter %s: %s", chapter_num, e)
+                        # Continue processing even if updates fail
+            except Exception as e:
+                logger.error("  Error processing scenes for Chapter %s: %s", chapter_num, e)
+                return None
+            
+            # Step 3: Generate/load chapter recap
+            logger.info("  Step 3: Checking recap for Chapter %s...", chapter_num)
+            try:
+                if "recap" in existing_steps:
+                    logger.info("  Chapter %s recap already exists, skipping...", chapter_num)
+                else:
+                    logger.info("  Generating recap for Chapter %s...", chapter_num)
                     
-                    print(f"  Chapter {chapter_num} processing complete!")
+                    # Get previous chapter recap
+                    previous_recap = await self._get_previous_recap(chapter_num)
+                    if chapter_num > 1 and not previous_recap:
+                        logger.debug("    No previous recap found for chapter %s", chapter_num-1)
                     
-                except Exception as e:
-                    print(f"Error processing Chapter {chapter_num}: {e}")
-                    continue
+                    # Get story start date from savepoint or use a default
+                    story_start_date = await self._get_story_start_date()
+                    if story_start_date is None:
+                        logger.debug("    Using default story start date for chapter %s", chapter_num)
+                        story_start_date = "2024-01-01"  # Default fallback
+                    
+                    # Generate recap for this chapter
+                    chapter_recap = await self.recap_manager.generate_chapter_recap(
+                        chapter_num=chapter_num,
+                        chapter_content=chapter_content,
+                        chapter_outline=chapter_outline,
+                        story_start_date=story_start_date,
+                        previous_chapter_recap=previous_recap,
+                        settings=settings
+                    )
+                    
+                    # Save the recap to savepoint
+                    await self.savepoint_manager.save_step(f"chapter_{chapter_num}/recap", chapter_recap)
+                    self._recap_by_chapter[chapter_num] = chapter_recap
+                    
+                    logger.info("    Chapter %s recap generated and saved.", chapter_num)
+            except Exception as e:
+                logger.error("  Error processing recap for Chapter %s: %s", chapter_num, e)
+                # Continue to next step even if recap fails
             
-            return chapters
+            # Step 4: Generate title and create Chapter object
+            logger.info("  Step 4: Creating Chapter object for Chapter %s...", chapter_num)
+            try:
+                # Generate chapter title
+                title = await self._generate_chapter_title(
+                    chapter_num, chapter_content, chapter_outline, settings
+                )
+                
+                chapter = Chapter(
+                    number=chapter_num,
+                    title=title,
+                    content=chapter_content,
+                    outline=chapter_outline,
+                    scenes=chapter_scenes
+                )
+                logger.info("  Chapter %s object created: '%s'", chapter_num, title)
+                
+            except Exception as e:
+                logger.error("  Error creating Chapter %s object: %s", chapter_num, e)
+                return None
+            
+            # Make this chapter's savepoints durable together before moving on
+            try:
+                await self.savepoint_manager.flush_group()
+            except StorageError as e:
+                logger.warning("  Failed to flush savepoints for Chapter %s: %s", chapter_num, e)
+            
+            logger.info("  Chapter %s processing complete!", chapter_num)
+            return chapter
             
         except Exception as e:
-            raise StoryGenerationError(f"Failed to generate chapters: {e}") from e
+            logger.error("Error processing Chapter %s: %s", chapter_num, e)
+            return None
     
-
+    async def _generate_chapters_pipelined(
+        self,
+        chapter_count: int,
+        outline: Outline,
+        settings: GenerationSettings,
+        pipeline_depth: int
+    ) -> List[Chapter]:
+        """Prepare chapter outlines up to pipeline_depth chapters ahead of scene and recap generation.
+        
+        Work that only needs the chapter's synopsis runs ahead; generating a new outline still
+        waits until the previous chapter's recap and sheet updates are done, as it does in order.
+        """
+        outline_queue: asyncio.Queue = asyncio.Queue()
+        # A slot is taken before a chapter is prepared and returned when its completion starts
+        ahead = asyncio.Semaphore(pipeline_depth)
+        # Set once each chapter has been completed (or skipped)
+        done = {chapter_num: asyncio.Event() for chapter_num in range(1, chapter_count + 1)}
+        
+        async def _produce_outlines() -> None:
+            for chapter_num in range(1, chapter_count + 1):
+                await ahead.acquire()
+                prepared = await self._prepare_chapter_outline(
+                    chapter_num, outline, settings, previous_done=done.get(chapter_num - 1)
+                )
+                await outline_queue.put((chapter_num, prepared))
+            await outline_queue.put(None)
+        
+        producer = asyncio.create_task(_produce_outlines())
+        chapters = []
+        try:
+            while (item := await outline_queue.get()) is not None:
+                chapter_num, prepared = item
+                ahead.release()
+                try:
+                    if prepared is None:
+                        continue
+                    existing_steps, chapter_outline = prepared
+                    chapter = await self._complete_chapter(
+                        chapter_num, chapter_count, chapter_outline, existing_steps, outline, settings
+                    )
+                    if chapter is not None:
+                        chapters.append(chapter)
+                finally:
+                    done[chapter_num].set()
+            await producer
+        finally:
+            if not producer.done():
+                producer.cancel()
+        
+        return chapters
     
     async def _generate_chapter_outline(
         self,
         chapter_num: int,
         chapter_synopsis: str,
         outline: Outline,
-        settings: GenerationSettings
+        settings: GenerationSettings,
+        previous_done: Optional[asyncio.Event] = None
     ) -> str:
-        """Generate detailed outline for a chapter from its synopsis."""
+        """Generate detailed outline for a chapter from its synopsis.
+        
+        When ``previous_done`` is given, the sheets and recap are only read once it is set.
+        """
         # Update managers with current savepoint manager
         self.character_manager.savepoint_manager = self.savepoint_manager
         self.setting_manager.savepoint_manager = self.savepoint_manager
         
         # Extract character names for this chapter
         chapter_characters = await self.character_manager.extract_chapter_characters(chapter_synopsis, chapter_num, settings)
-        
-        # Fetch character sheets for this chapter
-        character_sheets = await self.character_manager.fetch_character_sheets_for_chapter(chapter_characters, settings)
+        self._synopsis_chars[chapter_num] = chapter_characters
         
         # Extract setting names for this chapter
         chapter_settings = await self.setting_manager.extract_chapter_settings(chapter_synopsis, chapter_num, settings)
+        self._synopsis_settings[chapter_num] = chapter_settings
+        
+        # The previous chapter still updates the sheets and writes the recap read below
+        if previous_done is not None:
+            await previous_done.wait()
+        
+        # Fetch character sheets for this chapter
+        character_sheets = await self.character_manager.fetch_character_sheets_for_chapter(chapter_characters, settings)
         
         # Fetch setting sheets for this chapter
         setting_sheets = await self.setting_manager.fetch_setting_sheets_for_chapter(chapter_settings, settings)
         
         # Get previous chapter recap if available
-        previous_recap = ""
-        if chapter_num > 1:
-            try:
-                previous_recap = await self.savepoint_manager.load_step(f"chapter_{chapter_num-1}/recap")
-            except:
-                previous_recap = ""
+        previous_recap = await self._get_previous_recap(chapter_num)
         
         # Generate the detailed chapter outline
         return await self._generate_chapter_outline_impl(
@@ -434,7 +692,7 @@ class ChapterGenerator:
         settings: GenerationSettings
     ) -> str:
         """Implementation of chapter outline generation."""
-        model_config = ModelConfig.from_string(self.config["models"]["chapter_outline_writer"])
+        model_config = self._model_configs["chapter_outline_writer"]
         
         # First, generate the core outline
         core_outline = await self._generate_core_outline(
@@ -442,24 +700,50 @@ class ChapterGenerator:
             setting_sheets, previous_recap, settings
         )
         
+        # Validation usually passes, so start polishing the core outline alongside it.
+        # Skipped when streaming (interleaved output) or when a saved result already exists.
+        speculative_polish = None
+        if not settings.stream and self.savepoint_manager and not await self.savepoint_manager.has_step(
+            f"chapter_{chapter_num}/cleaned_outline"
+        ):
+            speculative_polish = asyncio.create_task(
+                self._polish_outline(core_outline, chapter_num, settings)
+            )
+        
         # Run quality validation
-        validation_issues = await self._validate_outline_quality(core_outline, chapter_num, settings)
+        try:
+            validation_issues = await self._validate_outline_quality(core_outline, chapter_num, settings)
+        except BaseException:
+            if speculative_polish:
+                speculative_polish.cancel()
+            raise
         
         if validation_issues:
-            if settings.debug:
-                print(f"[CHAPTER OUTLINE] Quality issues found: {validation_issues}")
+            logger.debug("[CHAPTER OUTLINE] Quality issues found: %s", validation_issues)
+            
+            # The speculative result describes the rejected outline; discard it
+            if speculative_polish:
+                speculative_polish.cancel()
+                try:
+                    await speculative_polish
+                except (asyncio.CancelledError, Exception):
+                    pass
             
             # Regenerate with feedback
             core_outline = await self._regenerate_outline_with_feedback(
                 core_outline, validation_issues, chapter_num, chapter_synopsis,
                 outline, character_sheets, setting_sheets, previous_recap, settings
             )
-        
-        # Run disambiguator
-        disambiguated_outline = await self._run_disambiguator(core_outline, chapter_num, settings)
-        
-        # Run cleanup
-        final_outline = await self._run_cleanup(disambiguated_outline, chapter_num, settings)
+            
+            # Overwrite any savepoints the speculative run managed to write
+            final_outline = await self._polish_outline(
+                core_outline, chapter_num, settings,
+                force_regenerate=speculative_polish is not None
+            )
+        elif speculative_polish:
+            final_outline = await speculative_polish
+        else:
+            final_outline = await self._polish_outline(core_outline, chapter_num, settings)
         
         # Format the final structure
         # formatted_outline = await self._format_outline_structure(final_outline, settings)
@@ -483,60 +767,39 @@ class ChapterGenerator:
         settings: GenerationSettings
     ) -> str:
         """Generate the core chapter outline."""
-        model_config = ModelConfig.from_string(self.config["models"]["chapter_outline_writer"])
-        
-        # Get next chapter synopsis if available
-        next_chapter_synopsis = ""
-        if self.savepoint_manager:
-            try:
-                next_chapter_synopsis = await self.savepoint_manager.load_step(f"chapter_{chapter_num+1}/synopsis")
-            except:
-                if settings.debug:
-                    print(f"[OUTLINE GENERATION] Could not load next chapter synopsis for chapter {chapter_num}")
-        
-        # Get previous chapter outline if available
-        previous_chapter_outline = ""
-        if chapter_num > 1 and self.savepoint_manager:
-            try:
-                previous_chapter_outline = await self.savepoint_manager.load_step(f"chapter_{chapter_num-1}/outline")
-            except:
-                if settings.debug:
-                    print(f"[OUTLINE GENERATION] Could not load previous chapter outline for chapter {chapter_num}")
-        
-        # Get abridged character and setting summaries for context
-        character_context = ""
-        setting_context = ""
-        if self.savepoint_manager:
-            try:
-                character_context = await self.savepoint_manager.load_step(f"chapter_{chapter_num}/characters_abridged")
-            except:
-                if settings.debug:
-                    print(f"[OUTLINE GENERATION] Could not load abridged character summary for chapter {chapter_num}")
-                character_context = character_sheets  # Fallback to full sheets
+        model_config = self._model_configs["chapter_outline_writer"]
+        
+        # The four context reads are independent, so issue them together
+        next_chapter_synopsis, previous_chapter_outline, character_context, setting_context = await asyncio.gather(
+            self._safe_load(f"chapter_{chapter_num+1}/synopsis"),
+            self._safe_load(f"chapter_{chapter_num-1}/outline" if chapter_num > 1 else None),
+            self._safe_load(f"chapter_{chapter_num}/characters_abridged"),
+            self._safe_load(f"chapter_{chapter_num}/settings_abridged")
+        )
         
-        if self.savepoint_manager:
-            try:
-                setting_context = await self.savepoint_manager.load_step(f"chapter_{chapter_num}/settings_abridged")
-            except:
-                if settings.debug:
-                    print(f"[OUTLINE GENERATION] Could not load abridged setting summary for chapter {chapter_num}")
-                setting_context = setting_sheets  # Fallback to full sheets
+        next_chapter_synopsis = next_chapter_synopsis or ""
+        previous_chapter_outline = previous_chapter_outline or ""
+        if character_context is None:
+            logger.debug("[OUTLINE GENERATION] Could not load abridged character summary for chapter %s", chapter_num)
+            character_context = character_sheets  # Fallback to full sheets
+        if setting_context is None:
+            logger.debug("[OUTLINE GENERATION] Could not load abridged setting summary for chapter %s", chapter_num)
+            setting_context = setting_sheets  # Fallback to full sheets
         
+        story_ctx = self._story_context(outline)
         response = await execute_prompt_with_savepoint(
             handler=self.prompt_handler,
             prompt_id="chapters/outline_core",
-            variables={
+            variables=ChainMap({
                 "chapter_number": chapter_num,
-                "outline": outline.story_elements,
-                "base_context": outline.base_context,
+                "outline": story_ctx["story_elements"],
                 "recap": previous_recap,
-                "story_elements": outline.story_elements,
                 "current_chapter_synopsis": chapter_synopsis,
                 "next_chapter_synopsis": next_chapter_synopsis,
                 "previous_chapter_outline": previous_chapter_outline,
                 "character_context": character_context,
                 "setting_context": setting_context
-            },
+            }, story_ctx),
             savepoint_id=f"chapter_{chapter_num}/core_outline",
             model_config=model_config,
             seed=settings.seed,
@@ -550,7 +813,7 @@ class ChapterGenerator:
     
     async def _validate_outline_quality(self, outline: str, chapter_num: int, settings: GenerationSettings) -> List[str]:
         """Validate the quality of a chapter outline."""
-        model_config = ModelConfig.from_string(self.config["models"]["logical_model"])
+        model_config = self._model_configs["logical_model"]
         
         try:
             response = await execute_prompt_with_savepoint(
@@ -568,17 +831,14 @@ class ChapterGenerator:
             
             validation_result = response.content.strip()
             
-            # Parse validation issues if any
-            if "ISSUES:" in validation_result:
-                issues_text = validation_result.split("ISSUES:")[1].strip()
-                issues = [issue.strip() for issue in issues_text.split('\n') if issue.strip()]
-                return issues
-            
-            return []
+            # Parse validation issues if any: one line per issue after the marker
+            _, marker, issues_text = validation_result.partition("ISSUES:")
+            if not marker:
+                return []
+            return [issue for issue in (line.strip() for line in issues_text.splitlines()) if issue]
             
         except Exception as e:
-            if settings.debug:
-                print(f"[OUTLINE VALIDATION] Error during validation: {e}")
+            logger.debug("[OUTLINE VALIDATION] Error during validation: %s", e)
             return []
     
     async def _regenerate_outline_with_feedback(
@@ -594,25 +854,22 @@ class ChapterGenerator:
         settings: GenerationSettings
     ) -> str:
         """Regenerate outline with feedback from validation."""
-        model_config = ModelConfig.from_string(self.config["models"]["chapter_outline_writer"])
+        model_config = self._model_configs["chapter_outline_writer"]
         
         issues_text = self._format_validation_issues(issues)
         
         response = await execute_prompt_with_savepoint(
             handler=self.prompt_handler,
             prompt_id="chapters/outline_improved",
-            variables={
+            variables=ChainMap({
                 "chapter_num": chapter_num,
                 "chapter_synopsis": chapter_synopsis,
-                "base_context": story_outline.base_context,
-                "story_elements": story_outline.story_elements,
-                "story_start_date": story_outline.story_start_date,
                 "character_sheets": character_sheets,
                 "setting_sheets": setting_sheets,
                 "previous_recap": previous_recap,
                 "current_outline": outline,
                 "validation_issues": issues_text
-            },
+            }, self._story_context(story_outline)),
             savepoint_id=f"chapter_{chapter_num}/improved_outline",
             model_config=model_config,
             seed=settings.seed,
@@ -624,20 +881,34 @@ class ChapterGenerator:
         
         return response.content.strip()
     
+    def _story_context(self, outline: Outline) -> Mapping[str, Any]:
+        """Return the read-only prompt variables that stay fixed for the whole story."""
+        if self._story_ctx is None or self._story_ctx_outline is not outline:
+            self._story_ctx = MappingProxyType({
+                "base_context": outline.base_context,
+                "story_elements": outline.story_elements,
+                "story_start_date": outline.story_start_date,
+            })
+            self._story_ctx_outline = outline
+        return self._story_ctx
+    
     def _format_validation_issues(self, issues: List[str]) -> str:
         """Format validation issues for prompt inclusion."""
         if not issues:
             return "No issues found."
         
-        formatted = "The following issues were identified:\n"
-        for i, issue in enumerate(issues, 1):
-            formatted += f"{i}. {issue}\n"
-        
-        return formatted
+        numbered = "".join(f"{i}. {issue}\n" for i, issue in enumerate(issues, 1))
+        return f"The following issues were identified:\n{numbered}"
     
-    async def _run_disambiguator(self, chapter_outline: str, chapter_num: int, settings: GenerationSettings) -> str:
+    async def _run_disambiguator(
+        self,
+        chapter_outline: str,
+        chapter_num: int,
+        settings: GenerationSettings,
+        force_regenerate: bool = False
+    ) -> str:
         """Run disambiguator on chapter outline."""
-        model_config = ModelConfig.from_string(self.config["models"]["logical_model"])
+        model_config = self._model_configs["logical_model"]
         
         response = await execute_prompt_with_savepoint(
             handler=self.prompt_handler,
@@ -645,6 +916,7 @@ class ChapterGenerator:
             variables={"chapter_outline": chapter_outline},
             savepoint_id=f"chapter_{chapter_num}/disambiguated_outline",
             model_config=model_config,
+            force_regenerate=force_regenerate,
             seed=settings.seed,
             debug=settings.debug,
             stream=settings.stream,
@@ -654,9 +926,15 @@ class ChapterGenerator:
         
         return response.content.strip()
     
-    async def _run_cleanup(self, chapter_outline: str, chapter_num: int, settings: GenerationSettings) -> str:
+    async def _run_cleanup(
+        self,
+        chapter_outline: str,
+        chapter_num: int,
+        settings: GenerationSettings,
+        force_regenerate: bool = False
+    ) -> str:
         """Run cleanup on chapter outline."""
-        model_config = ModelConfig.from_string(self.config["models"]["logical_model"])
+        model_config = self._model_configs["logical_model"]
         
         response = await execute_prompt_with_savepoint(
             handler=self.prompt_handler,
@@ -664,6 +942,7 @@ class ChapterGenerator:
             variables={"chapter_outline": chapter_outline},
             savepoint_id=f"chapter_{chapter_num}/cleaned_outline",
             model_config=model_config,
+            force_regenerate=force_regenerate,
             seed=settings.seed,
             debug=settings.debug,
             stream=settings.stream,
@@ -673,9 +952,85 @@ class ChapterGenerator:
         
         return response.content.strip()
     
+    async def _polish_outline(
+        self,
+        core_outline: str,
+        chapter_num: int,
+        settings: GenerationSettings,
+        force_regenerate: bool = False
+    ) -> str:
+        """Disambiguate then clean up a core outline, returning the cleaned outline."""
+        if self.config.get("fuse_outline_polish", False):
+            polished = await self._polish_outline_fused(core_outline, chapter_num, settings, force_regenerate)
+            if polished is not None:
+                return polished[1]
+        
+        disambiguated_outline = await self._run_disambiguator(
+            core_outline, chapter_num, settings, force_regenerate=force_regenerate
+        )
+        return await self._run_cleanup(
+            disambiguated_outline, chapter_num, settings, force_regenerate=force_regenerate
+        )
+    
+    async def _polish_outline_fused(
+        self,
+        core_outline: str,
+        chapter_num: int,
+        settings: GenerationSettings,
+        force_regenerate: bool = False
+    ) -> Optional[Tuple[str, str]]:
+        """Run disambiguation and cleanup as one structured call.
+        
+        Returns (disambiguated, cleaned) and writes each to the savepoint the separate
+        steps use, so runs with and without fusing can resume each other. Returns None
+        when the response is not the expected JSON so the caller can fall back.
+        """
+        if self.savepoint_manager and not force_regenerate:
+            disambiguated, cleaned = await asyncio.gather(
+                self._safe_load(f"chapter_{chapter_num}/disambiguated_outline"),
+                self._safe_load(f"chapter_{chapter_num}/cleaned_outline")
+            )
+            if disambiguated and cleaned:
+                return disambiguated, cleaned
+        
+        response = await execute_prompt_with_savepoint(
+            handler=self.prompt_handler,
+            prompt_id="chapters/outline_polish",
+            variables={"chapter_outline": core_outline},
+            savepoint_id=f"chapter_{chapter_num}/polished_outline",
+            model_config=self._model_configs["logical_model"],
+            force_regenerate=force_regenerate,
+            seed=settings.seed,
+            debug=settings.debug,
+            stream=settings.stream,
+            log_prompt_inputs=settings.log_prompt_inputs,
+            system_message=self.system_message,
+            expect_json=True,
+            json_schema=_POLISHED_OUTLINE_SCHEMA,
+            skip_validation=True
+        )
+        
+        try:
+            polished = _json_loads(response.content) if response.json_parsed else None
+        except ValueError:
+            polished = None
+        if not isinstance(polished, dict) or not all(
+            isinstance(polished.get(key), str) and polished[key].strip() for key in ("disambiguated", "cleaned")
+        ):
+            logger.debug("[CHAPTER OUTLINE] Fused polish response unusable for chapter %s, running steps separately", chapter_num)
+            return None
+        
+        disambiguated, cleaned = polished["disambiguated"].strip(), polished["cleaned"].strip()
+        if self.savepoint_manager:
+            await asyncio.gather(
+                self.savepoint_manager.save_step(f"chapter_{chapter_num}/disambiguated_outline", disambiguated),
+                self.savepoint_manager.save_step(f"chapter_{chapter_num}/cleaned_outline", cleaned)
+            )
+        return disambiguated, cleaned
+    
     async def _format_outline_structure(self, outline: str, settings: GenerationSettings) -> str:
         """Format the outline structure."""
-        model_config = ModelConfig.from_string(self.config["models"]["logical_model"])
+        model_config = self._model_configs["logical_model"]
         
         response = await execute_prompt_with_savepoint(
             handler=self.prompt_handler,
@@ -699,7 +1054,7 @@ class ChapterGenerator:
         settings: GenerationSettings
     ) -> str:
         """Get outline for specific chapter."""
-        model_config = ModelConfig.from_string(self.config["models"]["chapter_outline_writer"])
+        model_config = self._model_configs["chapter_outline_writer"]
         
         response = await execute_prompt_with_savepoint(
             handler=self.prompt_handler,
@@ -744,10 +1099,26 @@ class ChapterGenerator:
         if chapter_num >= total_chapters:
             return ""
         
-        try:
-            return await self.savepoint_manager.load_step(f"chapter_{chapter_num+1}/synopsis")
-        except:
-            return ""
+        synopsis = await self._load_synopsis(chapter_num + 1)
+        if synopsis is None:
+            logger.debug("    Could not load synopsis for chapter %s", chapter_num + 1)
+        return synopsis or ""
+    
+    async def _load_synopsis(self, chapter_num: int) -> Optional[str]:
+        """Return a chapter's synopsis from this run's cache or its savepoint.
+        
+        None means no synopsis is saved for the chapter; "" means one was saved empty.
+        """
+        if chapter_num in self._synopsis_cache:
+            return self._synopsis_cache[chapter_num]
+        
+        # A missing step loads as None, so the common first-run miss raises nothing
+        synopsis = await self._safe_load(f"chapter_{chapter_num}/synopsis")
+        if synopsis is None:
+            return None
+        
+        self._synopsis_cache[chapter_num] = synopsis
+        return synopsis
     
     async def _generate_chapter_content(
         self,
@@ -761,7 +1132,7 @@ class ChapterGenerator:
         settings: GenerationSettings
     ) -> str:
         """Generate the actual chapter content."""
-        model_config = ModelConfig.from_string(self.config["models"]["chapter_stage1_writer"])
+        model_config = self._model_configs["chapter_stage1_writer"]
         
         response = await execute_prompt_with_savepoint(
             handler=self.prompt_handler,
@@ -795,7 +1166,7 @@ class ChapterGenerator:
         settings: GenerationSettings
     ) -> str:
         """Generate title for chapter."""
-        model_config = ModelConfig.from_string(self.config["models"]["chapter_writer"])
+        model_config = self._model_configs["chapter_writer"]
         
         response = await execute_prompt_with_savepoint(
             handler=self.prompt_handler,
@@ -825,46 +1196,80 @@ class ChapterGenerator:
         settings: GenerationSettings
     ) -> str:
         """Extract chapters from combined outline and generate synopses for each."""
-        if settings.debug:
-            print(f"[CHAPTER SYNOPSES] Generating synopses for chapters from combined outline")
+        logger.debug("[CHAPTER SYNOPSES] Generating synopses for chapters from combined outline")
         
-        # Step 1: Extract chapters as JSON list from the combined outline
-        chapter_list = await self._extract_chapters_from_outline(
-            combined_outline, base_context, story_elements, settings
-        )
+        # The character and setting summaries are the same for every chapter; start them
+        # now so they are built once, alongside the chapter list extraction
+        entity_prompts = self._story_entity_prompts(story_elements, settings)
         
-        # Step 2: Generate synopsis for each chapter
-        synopses = []
-        for chapter_data in chapter_list:
-            chapter_num = chapter_data.get("number", len(synopses) + 1)
-            chapter_title = chapter_data.get("title", f"Chapter {chapter_num}")
-            chapter_description = chapter_data.get("description", "")
-            
-            if settings.debug:
-                print(f"[CHAPTER SYNOPSES] Generating synopsis for Chapter {chapter_num}: {chapter_title}")
-            
-            # Generate synopsis for this chapter
-            synopsis = await self._generate_single_chapter_synopsis(
-                chapter_num, chapter_title, chapter_description,
+        # Step 1: Extract chapters as JSON list from the combined outline
+        try:
+            chapter_list = await self._extract_chapters_from_outline(
                 combined_outline, base_context, story_elements, settings
             )
-            
-            synopses.append(synopsis)
-            
-            # Save synopsis to savepoint
-            if self.savepoint_manager:
-                await self.savepoint_manager.save_step(f"chapter_{chapter_num}/synopsis", synopsis)
-        
-        if settings.debug:
-            print(f"[CHAPTER SYNOPSES] Completed generating {len(synopses)} chapter synopses")
-        
-        # Return a formatted chapter list string for the main method to use
+        except BaseException:
+            entity_prompts.cancel()
+            raise
+        
+        # Step 2: Generate synopsis for each chapter. Only the final steps need the previous
+        # chapter's synopsis, so with pipeline_depth > 0 the enrichment steps of the next
+        # chapters run while the current chapter's synopsis is being written.
+        chapter_nums = [chapter.number for chapter in chapter_list]
+        pipeline_depth = max(0, self.config.get("pipeline_depth", 0))
+        enrichments: Dict[int, asyncio.Task] = {}
+        pending_saves: List[asyncio.Task] = []
+        synopses = []
+        # Formatted chapter list returned to the main method, built alongside the synopses
         chapter_list_text = []
-        for chapter_data in chapter_list:
-            chapter_num = chapter_data.get("number", 0)
-            chapter_title = chapter_data.get("title", f"Chapter {chapter_num}")
-            chapter_description = chapter_data.get("description", "")
-            chapter_list_text.append(f"## Chapter {chapter_num}: {chapter_title}\n{chapter_description}")
+        
+        # The storyline, context and outline enrichment prompts are identical for every chapter
+        story_prompts = {
+            "step1_storyline": self._render_enrichment_prompt("understand_storyline", {"story_elements": story_elements}),
+            "step2_base_context": self._render_enrichment_prompt("understand_base_context", {"base_context": base_context}),
+            "step3_outline": self._render_enrichment_prompt("understand_outline", {"outline": combined_outline})
+        }
+        try:
+            for index, chapter in enumerate(chapter_list):
+                for ahead in range(index, min(index + pipeline_depth + 1, len(chapter_list))):
+                    if ahead not in enrichments:
+                        enrichments[ahead] = asyncio.create_task(self._enrich_chapter_synopsis(
+                            chapter_nums[ahead], story_prompts, entity_prompts, settings
+                        ))
+                
+                chapter_num = chapter.number
+                
+                logger.debug("[CHAPTER SYNOPSES] Generating synopsis for Chapter %s: %s", chapter_num, chapter.title)
+                
+                # Generate synopsis for this chapter
+                conversation_history = await enrichments.pop(index)
+                synopsis = await self._generate_single_chapter_synopsis(
+                    chapter_num, chapter.title, chapter.description, conversation_history, settings
+                )
+                
+                synopses.append(synopsis)
+                chapter_list_text.append(f"## Chapter {chapter_num}: {chapter.title}\n{chapter.description}")
+                self._synopsis_cache[chapter_num] = synopsis
+                
+                # Save synopsis to savepoint in the background; the next chapter reads the cached copy
+                if self.savepoint_manager:
+                    pending_saves.append(asyncio.create_task(
+                        self.savepoint_manager.save_step(f"chapter_{chapter_num}/synopsis", synopsis)
+                    ))
+            
+            # Surface any failed write before reporting the synopses as done
+            await asyncio.gather(*pending_saves)
+        finally:
+            for task in enrichments.values():
+                task.cancel()
+            # Let writes started before a failure finish rather than abandoning them
+            await asyncio.gather(*pending_saves, return_exceptions=True)
+        
+        logger.debug("[CHAPTER SYNOPSES] Completed generating %s chapter synopses", len(synopses))
+        
+        # With batching enabled, pre-extract every chapter's characters in a few calls; the
+        # per-chapter extraction during outline generation then loads the saved results
+        self.character_manager.savepoint_manager = self.savepoint_manager
+        await self.character_manager.extract_chapter_characters_batch(list(zip(chapter_nums, synopses)), settings)
         
         return "\n\n".join(chapter_list_text)
     
@@ -874,9 +1279,9 @@ class ChapterGenerator:
         base_context: str,
         story_elements: str,
         settings: GenerationSettings
-    ) -> List[Dict[str, Any]]:
+    ) -> List[_ChapterItem]:
         """Extract chapters from combined outline as a structured list."""
-        model_config = ModelConfig.from_string(self.config["models"]["creative_model"])
+        model_config = self._model_configs["creative_model"]
         
         # Define JSON schema for chapter list
         CHAPTER_LIST_SCHEMA = {
@@ -916,150 +1321,139 @@ class ChapterGenerator:
             # llm-output-parser has already successfully parsed the JSON
             # The content should now be a clean JSON string that we can parse
             try:
-                # Validate the parsed JSON
-                chapter_list = json.loads(response.content.strip())
-                if not isinstance(chapter_list, list):
-                    raise ValueError("Response is not a list")
+                # Validate the parsed JSON into typed chapter entries
+                chapter_list = _parse_chapter_list(response.content)
                 
-                if settings.debug:
-                    print(f"[CHAPTER SYNOPSES] Successfully parsed {len(chapter_list)} chapters from JSON")
+                logger.debug("[CHAPTER SYNOPSES] Successfully parsed %s chapters from JSON", len(chapter_list))
                 return chapter_list
                 
-            except (json.JSONDecodeError, ValueError) as e:
-                if settings.debug:
-                    print(f"[CHAPTER SYNOPSES] JSON validation failed: {e}")
-                    print(f"[CHAPTER SYNOPSES] Raw response: {response.content}")
+            except ValueError as e:
+                logger.debug("[CHAPTER SYNOPSES] JSON validation failed: %s", e)
+                logger.debug("[CHAPTER SYNOPSES] Raw response: %s", response.content)
                 
                 # Fallback: create a simple list from the outline
                 return self._fallback_chapter_extraction(combined_outline)
         else:
-            if settings.debug:
-                print(f"[CHAPTER SYNOPSES] JSON parsing failed: {response.json_errors}")
-                print(f"[CHAPTER SYNOPSES] Raw response preview: {response.content[:200]}...")
+            logger.debug("[CHAPTER SYNOPSES] JSON parsing failed: %s", response.json_errors)
+            logger.debug("[CHAPTER SYNOPSES] Raw response preview: %s...", response.content[:200])
             
             # Fallback: create a simple list from the outline
             return self._fallback_chapter_extraction(combined_outline)
     
+    async def _enrich_chapter_synopsis(
+        self,
+        chapter_num: int,
+        story_prompts: Mapping[str, str],
+        entity_prompts: "asyncio.Future[Tuple[str, str]]",
+        settings: GenerationSettings
+    ) -> List[Dict[str, str]]:
+        """Run the enrichment steps that do not depend on the previous chapter's synopsis.
+        
+        ``story_prompts`` maps step ids to the already rendered story-wide prompts (steps 1-3);
+        ``entity_prompts`` resolves to the shared character and setting prompts (steps 4-5).
+        """
+        model_config = self._model_configs["chapter_outline_writer"]
+        
+        # Steps 1-5 each prime the model on one independent document, so they run as
+        # separate single-turn calls and their exchanges are stitched together afterwards
+        async def enrich(step: str, prompt: str) -> List[Dict[str, str]]:
+            messages = [{"role": "user", "content": prompt}]
+            async with self._enrichment_semaphore:
+                response = await execute_messages_with_savepoint(
+                    handler=self.prompt_handler,
+                    conversation_history=messages,
+                    savepoint_id=f"chapter_{chapter_num}_{step}",
+                    model_config=model_config,
+                    debug=settings.debug,
+                    stream=settings.stream
+                )
+            return [*messages, {"role": "assistant", "content": response.content.strip()}]
+        
+        # Shielded because the entity prompts task is shared with other chapters' enrichment
+        async def enrich_characters() -> List[Dict[str, str]]:
+            # Combined abridged characters
+            character_prompt, _ = await asyncio.shield(entity_prompts)
+            return await enrich("step4_characters", character_prompt)
+        
+        async def enrich_settings() -> List[Dict[str, str]]:
+            # Combined abridged settings
+            _, setting_prompt = await asyncio.shield(entity_prompts)
+            return await enrich("step5_settings", setting_prompt)
+        
+        exchanges = await asyncio.gather(
+            *(enrich(step, prompt) for step, prompt in story_prompts.items()),
+            enrich_characters(),
+            enrich_settings()
+        )
+        return [message for exchange in exchanges for message in exchange]
+    
+    def _render_enrichment_prompt(self, prompt_name: str, variables: Dict[str, Any]) -> str:
+        """Render one of the chapter-synopsis enrichment prompts."""
+        return self.prompt_handler.prompt_loader.load_prompt(
+            f"multistep/chapter/enrichment/{prompt_name}", variables
+        )
+    
+    def _story_entity_prompts(self, story_elements: str, settings: GenerationSettings) -> asyncio.Task:
+        """Return a task resolving to the rendered (characters, settings) enrichment prompts.
+        
+        The summaries behind them depend only on the story elements, so every chapter's
+        enrichment shares one task instead of re-extracting names and summaries per chapter.
+        """
+        task = self._entity_prompts_task
+        if (
+            task is None
+            or self._entity_prompts_for != story_elements
+            or (task.done() and (task.cancelled() or task.exception() is not None))
+        ):
+            async def character_summaries() -> str:
+                characters = await self.character_manager.extract_character_names(story_elements, settings)
+                return await self.character_manager.get_character_summaries(characters, settings)
+            
+            async def setting_summaries() -> str:
+                setting_names = await self.setting_manager.extract_setting_names(story_elements, settings)
+                return await self.setting_manager.get_setting_summaries(setting_names, settings)
+            
+            async def both() -> Tuple[str, str]:
+                # The character and setting chains are independent of each other
+                characters, settings_text = await asyncio.gather(character_summaries(), setting_summaries())
+                return (
+                    self._render_enrichment_prompt("understand_characters", {"character_summaries": characters}),
+                    self._render_enrichment_prompt("understand_settings", {"setting_summaries": settings_text})
+                )
+            
+            task = asyncio.create_task(both())
+            self._entity_prompts_task = task
+            self._entity_prompts_for = story_elements
+        return task
+    
     async def _generate_single_chapter_synopsis(
         self,
         chapter_num: int,
         chapter_title: str,
         chapter_description: str,
-        combined_outline: str,
-        base_context: str,
-        story_elements: str,
+        conversation_history: List[Dict[str, str]],
         settings: GenerationSettings
     ) -> str:
-        """Generate synopsis for a single chapter using a multistep approach."""
-        model_config = ModelConfig.from_string(self.config["models"]["chapter_outline_writer"])
+        """Generate synopsis for a single chapter on top of its enrichment conversation."""
+        model_config = self._model_configs["chapter_outline_writer"]
+        conversation_history = list(conversation_history)
         
         # Get previous chapter synopsis if this is not the first chapter
-        previous_chapter = ""
-        if chapter_num > 1 and self.savepoint_manager:
-            try:
-                previous_chapter = await self.savepoint_manager.load_step(f"chapter_{chapter_num-1}/synopsis")
-            except:
-                if settings.debug:
-                    print(f"[CHAPTER SYNOPSES] Could not load previous chapter synopsis for chapter {chapter_num}")
-                previous_chapter = ""
-        
-        # Build conversation history through multistep approach
-        conversation_history = []
-        
-        # Step 1: Understand storyline
-        storyline_prompt = self.prompt_handler.prompt_loader.load_prompt(
-            "multistep/chapter/enrichment/understand_storyline",
-            {"story_elements": story_elements}
-        )
-        conversation_history.append({"role": "user", "content": storyline_prompt})
-        
-        response = await execute_prompt_with_savepoint(
-            handler=self.prompt_handler,
-            conversation_history=conversation_history,
-            savepoint_id=f"chapter_{chapter_num}_step1_storyline",
-            model_config=model_config,
-            debug=settings.debug,
-            stream=settings.stream
-        )
-        conversation_history.append({"role": "assistant", "content": response.content.strip()})
-        
-        # Step 2: Understand base context
-        base_context_prompt = self.prompt_handler.prompt_loader.load_prompt(
-            "multistep/chapter/enrichment/understand_base_context",
-            {"base_context": base_context}
-        )
-        conversation_history.append({"role": "user", "content": base_context_prompt})
-        
-        response = await execute_prompt_with_savepoint(
-            handler=self.prompt_handler,
-            conversation_history=conversation_history,
-            model_config=model_config,
-            debug=settings.debug,
-            stream=settings.stream
-        )
-        conversation_history.append({"role": "assistant", "content": response.content.strip()})
-        
-        # Step 3: Understand combined outline
-        outline_prompt = self.prompt_handler.prompt_loader.load_prompt(
-            "multistep/chapter/enrichment/understand_outline",
-            {"outline": combined_outline}
-        )
-        conversation_history.append({"role": "user", "content": outline_prompt})
-        
-        response = await execute_prompt_with_savepoint(
-            handler=self.prompt_handler,
-            conversation_history=conversation_history,
-            model_config=model_config,
-            debug=settings.debug,
-            stream=settings.stream
-        )
-        conversation_history.append({"role": "assistant", "content": response.content.strip()})
-        
-        # Step 4: Understand characters (combined abridged characters)
-        characters = await self.character_manager.extract_character_names(story_elements, settings)
-        character_summaries = await self.character_manager.get_character_summaries(characters, settings)
-        character_prompt = self.prompt_handler.prompt_loader.load_prompt(
-            "multistep/chapter/enrichment/understand_characters",
-            {"character_summaries": character_summaries}
-        )
-        conversation_history.append({"role": "user", "content": character_prompt})
-        
-        response = await execute_prompt_with_savepoint(
-            handler=self.prompt_handler,
-            conversation_history=conversation_history,
-            model_config=model_config,
-            debug=settings.debug,
-            stream=settings.stream
-        )
-        conversation_history.append({"role": "assistant", "content": response.content.strip()})
-        
-        # Step 5: Understand settings (combined abridged settings)
-        setting_names = await self.setting_manager.extract_setting_names(story_elements, settings)
-        setting_summaries = await self.setting_manager.get_setting_summaries(setting_names, settings)
-        setting_prompt = self.prompt_handler.prompt_loader.load_prompt(
-            "multistep/chapter/enrichment/understand_settings",
-            {"setting_summaries": setting_summaries}
-        )
-        conversation_history.append({"role": "user", "content": setting_prompt})
-        
-        response = await execute_prompt_with_savepoint(
-            handler=self.prompt_handler,
-            conversation_history=conversation_history,
-            model_config=model_config,
-            debug=settings.debug,
-            stream=settings.stream
-        )
-        conversation_history.append({"role": "assistant", "content": response.content.strip()})
+        previous_chapter = None
+        if chapter_num > 1:
+            previous_chapter = await self._load_synopsis(chapter_num - 1)
+            if previous_chapter is None:
+                logger.debug("[CHAPTER SYNOPSES] Could not load previous chapter synopsis for chapter %s", chapter_num)
         
-        # Step 6: Understand previous chapter synopsis (if chapter > 1)
-        if chapter_num > 1 and previous_chapter:
+        # Step 6: Understand previous chapter synopsis (skipped for chapter 1, a miss, or an empty synopsis)
+        if previous_chapter:
             previous_chapter_prompt = self.prompt_handler.prompt_loader.load_prompt(
                 "multistep/chapter/enrichment/understand_previous_chapter",
                 {"previous_chapter": previous_chapter}
             )
             conversation_history.append({"role": "user", "content": previous_chapter_prompt})
             
-            response = await execute_prompt_with_savepoint(
+            response = await execute_messages_with_savepoint(
                 handler=self.prompt_handler,
                 conversation_history=conversation_history,
                 model_config=model_config,
@@ -1068,6 +1462,11 @@ class ChapterGenerator:
             )
             conversation_history.append({"role": "assistant", "content": response.content.strip()})
         
+        # The source documents were only needed to produce the understandings, so
+        # optionally hand step 7 the understandings alone to keep its prompt small
+        if self.config.get("digest_synopsis_context", False):
+            conversation_history = [self._digest_understandings(conversation_history)]
+        
         # Step 7: Generate the chapter synopsis
         synopsis_prompt = self.prompt_handler.prompt_loader.load_prompt(
             "multistep/chapter/create_synopsis",
@@ -1079,7 +1478,7 @@ class ChapterGenerator:
         )
         conversation_history.append({"role": "user", "content": synopsis_prompt})
         
-        response = await execute_prompt_with_savepoint(
+        response = await execute_messages_with_savepoint(
             handler=self.prompt_handler,
             conversation_history=conversation_history,
             savepoint_id=f"chapter_{chapter_num}/synopsis",
@@ -1090,36 +1489,42 @@ class ChapterGenerator:
         
         return response.content.strip()
     
-    def _fallback_chapter_extraction(self, combined_outline: str) -> List[Dict[str, Any]]:
+    def _digest_understandings(self, conversation_history: List[Dict[str, str]]) -> Dict[str, str]:
+        """Fold an enrichment conversation into one user turn holding only the model's understandings.
+        
+        Each understanding is headed by the title of the prompt that produced it.
+        """
+        sections = []
+        for prompt, answer in zip(conversation_history[::2], conversation_history[1::2]):
+            heading = prompt["content"].lstrip().partition("\n")[0].lstrip("# ").strip()
+            sections.append(f"## {heading}\n{answer['content']}")
+        
+        digest = self.prompt_handler.prompt_loader.load_prompt(
+            "multistep/chapter/understanding_digest",
+            {"understandings": "\n\n".join(sections)}
+        )
+        return {"role": "user", "content": digest}
+    
+    def _fallback_chapter_extraction(self, combined_outline: str) -> List[_ChapterItem]:
         """Fallback method to extract chapters when JSON parsing fails."""
-        chapters = []
-        lines = combined_outline.split('\n')
-        current_chapter = None
+        titles: List[str] = []
+        description_parts: List[List[str]] = []
         
-        for line in lines:
+        for line in combined_outline.splitlines():
             line = line.strip()
-            if line.startswith('## Chapter') or line.startswith('Chapter'):
-                # Extract chapter number and title
-                parts = line.split(':', 1)
-                if len(parts) == 2:
-                    chapter_title = parts[1].strip()
-                else:
-                    chapter_title = line
-                
-                current_chapter = {
-                    "number": len(chapters) + 1,
-                    "title": chapter_title,
-                    "description": ""
-                }
-                chapters.append(current_chapter)
-            elif current_chapter and line:
-                # Add description lines to current chapter
-                if current_chapter["description"]:
-                    current_chapter["description"] += " " + line
-                else:
-                    current_chapter["description"] = line
-        
-        return chapters
+            if _CHAPTER_HEADING_RE.match(line):
+                # Title is whatever follows the first colon, or the whole heading without one
+                _, colon, title = line.partition(':')
+                titles.append(title.strip() if colon else line)
+                description_parts.append([])
+            elif titles and line:
+                # Collect description lines and join once per chapter
+                description_parts[-1].append(line)
+        
+        return [
+            _ChapterItem(number=number, title=title, description=" ".join(parts))
+            for number, (title, parts) in enumerate(zip(titles, description_parts), 1)
+        ]
     
 
     
@@ -1132,15 +1537,13 @@ class ChapterGenerator:
         settings: GenerationSettings
     ) -> str:
         """Generate chunked outline by processing chapters in manageable chunks."""
-        if settings.debug:
-            print(f"[CHUNKED OUTLINE] Generating chunked outline for {settings.wanted_chapters} chapters")
+        logger.debug("[CHUNKED OUTLINE] Generating chunked outline for %s chapters", settings.wanted_chapters)
         
         # Determine chunk size (process 5-10 chapters at a time)
         chunk_size = min(10, max(5, settings.wanted_chapters // 4))
         total_chunks = (settings.wanted_chapters + chunk_size - 1) // chunk_size
         
-        if settings.debug:
-            print(f"[CHUNKED OUTLINE] Using chunk size {chunk_size}, total chunks: {total_chunks}")
+        logger.debug("[CHUNKED OUTLINE] Using chunk size %s, total chunks: %s", chunk_size, total_chunks)
         
         # Generate outline chunks
         outline_chunks = []
@@ -1151,8 +1554,7 @@ class ChapterGenerator:
             chunk_start = chunk_num * chunk_size + 1
             chunk_end = min((chunk_num + 1) * chunk_size, settings.wanted_chapters)
             
-            if settings.debug:
-                print(f"[CHUNKED OUTLINE] Processing chunk {chunk_num + 1}/{total_chunks}: chapters {chunk_start}-{chunk_end}")
+            logger.debug("[CHUNKED OUTLINE] Processing chunk %s/%s: chapters %s-%s", chunk_num + 1, total_chunks, chunk_start, chunk_end)
             
             # Generate chunk outline
             chunk_outline = await self._generate_outline_chunk(
@@ -1172,8 +1574,7 @@ class ChapterGenerator:
         # Combine all chunks into final outline
         final_outline = "\n\n".join(outline_chunks)
         
-        if settings.debug:
-            print(f"[CHUNKED OUTLINE] Completed chunked outline generation")
+        logger.debug("[CHUNKED OUTLINE] Completed chunked outline generation")
         
         return final_outline
     
@@ -1189,7 +1590,7 @@ class ChapterGenerator:
         settings: GenerationSettings
     ) -> str:
         """Generate outline for a specific chunk of chapters."""
-        model_config = ModelConfig.from_string(self.config["models"]["initial_outline_writer"])
+        model_config = self._model_configs["initial_outline_writer"]
         
         response = await execute_prompt_with_savepoint(
             handler=self.prompt_handler,
@@ -1221,7 +1622,7 @@ class ChapterGenerator:
         settings: GenerationSettings
     ) -> str:
         """Analyze continuity between chunks to maintain story flow."""
-        model_config = ModelConfig.from_string(self.config["models"]["logical_model"])
+        model_config = self._model_configs["logical_model"]
         
         response = await execute_prompt_with_savepoint(
             handler=self.prompt_handler,
@@ -1254,14 +1655,12 @@ class ChapterGenerator:
             if not hasattr(self, 'story_state_manager') or not self.story_state_manager.story_context:
                 raise StoryGenerationError("Story context must be initialized before progressive planning")
             
-            if settings.debug:
-                print(f"[PROGRESSIVE PLANNING] Coordinating next chapter planning...")
+            logger.debug("[PROGRESSIVE PLANNING] Coordinating next chapter planning...")
             
             # Delegate planning to StoryStateManager
             chapter_state = await self.story_state_manager.plan_next_chapter(settings)
             
-            if settings.debug:
-                print(f"[PROGRESSIVE PLANNING] Chapter {chapter_state.chapter_number} planning coordinated")
+            logger.debug("[PROGRESSIVE PLANNING] Chapter %s planning coordinated", chapter_state.chapter_number)
             
             # Return planning data for chapter generator to use
             return {
@@ -1285,14 +1684,12 @@ class ChapterGenerator:
     ) -> Dict[str, Any]:
         """Coordinate outline revision using StoryStateManager."""
         try:
-            if settings.debug:
-                print(f"[PROGRESSIVE PLANNING] Coordinating outline revision for chapter {chapter_num}...")
+            logger.debug("[PROGRESSIVE PLANNING] Coordinating outline revision for chapter %s...", chapter_num)
             
             # Delegate revision to StoryStateManager
             chapter_state = await self.story_state_manager.revise_chapter_plan(chapter_num, settings)
             
-            if settings.debug:
-                print(f"[PROGRESSIVE PLANNING] Chapter {chapter_num} revision coordinated")
+            logger.debug("[PROGRESSIVE PLANNING] Chapter %s revision coordinated", chapter_num)
             
             # Return revised planning data
             return {
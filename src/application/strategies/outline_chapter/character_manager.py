@@ -1,7 +1,12 @@
 """Character management functionality for the outline-chapter strategy."""
 
+import asyncio
 import json
-from typing import List, Optional, Dict, Any
+import logging
+import re
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Coroutine, Dict, List, Mapping, Optional, Set, Tuple
 from domain.value_objects.generation_settings import GenerationSettings
 from domain.value_objects.model_config import ModelConfig
 
@@ -11,6 +16,66 @@ from infrastructure.prompts.prompt_wrapper import execute_prompt_with_savepoint,
 from infrastructure.savepoints import SavepointManager
 from application.services.rag_service import RAGService
 from application.services.rag_integration_service import RAGIntegrationService
+from application.services.semantic_cache import SemanticCache
+
+logger = logging.getLogger(__name__)
+
+# Structured output of every character name extraction prompt
+_CHARACTER_NAMES_SCHEMA = MappingProxyType({
+    "type": "array",
+    "items": MappingProxyType({"type": "string"})
+})
+
+# Structured output of the batched extraction: chapter number -> character names
+_CHAPTER_CHARACTERS_SCHEMA = MappingProxyType({
+    "type": "object",
+    "additionalProperties": _CHARACTER_NAMES_SCHEMA
+})
+
+# Structured output of the fused extract-and-sheet prompt
+_CHARACTER_SHEETS_SCHEMA = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "characters": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {"name": {"type": "string"}, "sheet": {"type": "string"}},
+                "required": ["name", "sheet"]
+            }
+        }
+    },
+    "required": ["characters"]
+})
+
+# Focused parts of a character sheet, each generated by characters/create_{chunk_type}
+_CHARACTER_CHUNK_TYPES = (
+    "personality_chunk", "background_chunk", "motivations_chunk", "relationships_chunk",
+    "skills_chunk", "current_state_chunk", "growth_arc_chunk"
+)
+
+# Structured output of the fused chunk prompt, keyed by chunk type without the "_chunk" suffix
+_CHARACTER_CHUNKS_SCHEMA = MappingProxyType({
+    "type": "object",
+    "properties": {chunk_type.removesuffix("_chunk"): {"type": "string"} for chunk_type in _CHARACTER_CHUNK_TYPES},
+    "required": [chunk_type.removesuffix("_chunk") for chunk_type in _CHARACTER_CHUNK_TYPES]
+})
+
+# Steps a character's initial sheet generation saves under characters/{name}/
+_CHARACTER_SHEET_STEPS = frozenset({"sheet", *_CHARACTER_CHUNK_TYPES})
+
+@lru_cache(maxsize=4096)
+def _character_step(character_name: str, step: str) -> str:
+    """Savepoint step name for one of a character's saved documents, built once per pair."""
+    return f"characters/{character_name}/{step}"
+
+
+# One name per line for responses that are not a JSON list: headings and code fences are
+# skipped, and list markers, bold markers, quotes and trailing commas are stripped
+_NAME_LINE_RE = re.compile(
+    r"""^[ \t]*(?![#`])(?:[-*•>]|\d+[.)])?[ \t*"']*(\w[^\n]*?)[ \t*•"',]*$""",
+    re.MULTILINE
+)
 
 
 class CharacterManager:
@@ -34,106 +99,180 @@ class CharacterManager:
         
         # RAG integration service will be set by the strategy after story initialization
         self.rag_integration = None
+        
+        # Reuses name extraction results for identical or near-identical text, one cache per prompt
+        self._extraction_caches: Dict[str, SemanticCache] = {}
+        
+        self._model_configs = ModelConfig.from_mapping(self.config.get("models", {}))
+        
+        # Fire-and-forget work (RAG indexing of new chunks), awaited before sheet generation returns
+        self._background_tasks: Set[asyncio.Task] = set()
+        
+        # Per-character locks serialising RAG (re)indexing
+        self._index_locks: Dict[str, asyncio.Lock] = {}
+        
+        # Summaries already produced this run, by character name
+        self._summary_cache: Dict[str, str] = {}
+        
+        # Summaries still being produced, by character name, shared by every caller asking meanwhile
+        self._summary_tasks: Dict[str, asyncio.Task] = {}
+        
+        # Sheet and chunk savepoints already read this run, by step name; sheet updates evict theirs
+        self._step_cache: Dict[str, Any] = {}
+        
+        # Shared by every character's chunk prompts so concurrent sheets stay within one budget
+        self._chunk_semaphore = asyncio.Semaphore(self.config.get("chunk_generation_concurrency", 8))
+        
+        # Shared by every sheet update so overlapping chapters' updates stay within one budget
+        self._update_semaphore = asyncio.Semaphore(self.config.get("sheet_update_concurrency", 4))
+        
+        # Shared by every summary request so concurrent callers stay within one budget
+        self._summary_semaphore = asyncio.Semaphore(self.config.get("summary_concurrency", 4))
     
     async def generate_character_sheets(self, story_elements: str, additional_context: str, settings: GenerationSettings) -> None:
         """Generate character sheets for all characters identified in story elements."""
         try:
+            # Optionally write the names and every sheet in one call; the per-character path
+            # below then loads them from savepoints and only generates the chunks
+            if self.config.get("fuse_character_sheets", False):
+                await self._extract_and_sheet_characters(story_elements, additional_context, settings)
+            
             # Extract character names from story elements
             character_names = await self.extract_character_names(story_elements, settings)
             
-            if settings.debug:
-                print(f"[CHARACTER SHEETS] Found {len(character_names)} characters: {character_names}")
+            logger.debug("[CHARACTER SHEETS] Found %s characters: %s", len(character_names), character_names)
             
-            # Generate sheet for each character
-            for character_name in character_names:
-                if settings.debug:
-                    print(f"[CHARACTER SHEETS] Generating sheet for: {character_name}")
-                
-                await self.generate_single_character_sheet(character_name, story_elements, additional_context, settings)
+            # Characters whose sheet and chunks were all saved by an earlier run need no work;
+            # one directory listing per character answers that without touching the prompt layer
+            if self.savepoint_manager:
+                saved_steps = await asyncio.gather(
+                    *(self.savepoint_manager.list_steps(f"characters/{character_name}") for character_name in character_names)
+                )
+                complete = {
+                    character_name for character_name, steps in zip(character_names, saved_steps)
+                    if _CHARACTER_SHEET_STEPS <= steps
+                }
+                if complete:
+                    logger.debug("[CHARACTER SHEETS] Sheets already complete for: %s", sorted(complete))
+                    character_names = [name for name in character_names if name not in complete]
+                    # Skipped characters still need to be in RAG, e.g. when the store was reset
+                    await self._index_unindexed_characters(sorted(complete))
+            
+            # Each character's sheet is independent, so generate them concurrently within a bound
+            semaphore = asyncio.Semaphore(self.config.get("sheet_generation_concurrency", 4))
+            
+            async def generate_one(character_name: str) -> None:
+                async with semaphore:
+                    logger.debug("[CHARACTER SHEETS] Generating sheet for: %s", character_name)
+                    
+                    await self.generate_single_character_sheet(character_name, story_elements, additional_context, settings)
+            
+            # One character's failure must not abandon the others or skip the indexing wait below
+            results = await asyncio.gather(
+                *(generate_one(character_name) for character_name in character_names), return_exceptions=True
+            )
+            for character_name, result in zip(character_names, results):
+                if isinstance(result, Exception):
+                    logger.debug("[CHARACTER SHEETS] Error generating sheet for %s: %s", character_name, result)
+            
+            # Let chunk indexing still in flight finish so callers see complete RAG data
+            await asyncio.gather(*self._background_tasks, return_exceptions=True)
         
         except Exception as e:
-            if settings.debug:
-                print(f"[CHARACTER SHEETS] Error generating character sheets: {e}")
+            logger.debug("[CHARACTER SHEETS] Error generating character sheets: %s", e)
             # Don't fail the entire process if character sheet generation fails
             pass
     
-    async def extract_character_names(self, story_elements: str, settings: GenerationSettings) -> List[str]:
-        """Extract character names from story elements."""
-        model_config = ModelConfig.from_string(self.config["models"]["logical_model"])
+    async def _extract_and_sheet_characters(
+        self, story_elements: str, additional_context: str, settings: GenerationSettings
+    ) -> None:
+        """Extract character names and write their sheets with one structured model call.
         
-        # Define JSON schema for character names
-        CHARACTER_NAMES_SCHEMA = {
-            "type": "array",
-            "items": {"type": "string"}
-        }
-
-        response = await execute_prompt_with_savepoint(
-            handler=self.prompt_handler,
-            prompt_id="characters/extract_names",
-            variables={"story_elements": story_elements},
-            savepoint_id="character_names",
-            model_config=model_config,
-            seed=settings.seed,
-            debug=settings.debug,
-            stream=settings.stream,
-            log_prompt_inputs=settings.log_prompt_inputs,
-            system_message=self.system_message,
-            expect_json=True,
-            json_schema=CHARACTER_NAMES_SCHEMA
-        )
+        Results are saved as the ``character_names`` step and each ``characters/{name}/sheet``
+        step. Nothing is saved if the response does not validate, or if the names were already
+        extracted, so the regular one-call-per-character path takes over.
+        """
+        if not self.savepoint_manager or await self.savepoint_manager.has_step("character_names"):
+            return
         
-        # Parse the response using the new JSON integration
-        names_text = response.content.strip()
-        character_names = []
+        try:
+            response = await execute_prompt_with_savepoint(
+                handler=self.prompt_handler,
+                prompt_id="characters/extract_and_sheet",
+                variables={"story_elements": story_elements, "additional_context": additional_context},
+                model_config=self._model_configs["initial_outline_writer"],
+                seed=settings.seed,
+                debug=settings.debug,
+                stream=settings.stream,
+                log_prompt_inputs=settings.log_prompt_inputs,
+                system_message=self.system_message,
+                expect_json=True,
+                json_schema=_CHARACTER_SHEETS_SCHEMA,
+                # The prompt asks for a bare JSON object, not <output> tags
+                skip_validation=True
+            )
+        except Exception as e:
+            logger.debug("[CHARACTER SHEETS] Fused extraction failed, using per-character sheets: %s", e)
+            return
         
-        if response.json_parsed:
-            # llm-output-parser has already successfully parsed the JSON
-            # The content should now be a clean JSON string that we can parse
-            try:
-                parsed_names = json.loads(names_text)
-                if isinstance(parsed_names, list):
-                    character_names = [str(name).strip() for name in parsed_names if name and str(name).strip()]
-                    if settings.debug:
-                        print(f"[CHARACTER NAMES] Successfully parsed JSON: {character_names}")
-                else:
-                    if settings.debug:
-                        print(f"[CHARACTER NAMES] Expected list but got: {type(parsed_names)}")
-            except (json.JSONDecodeError, AttributeError) as e:
-                if settings.debug:
-                    print(f"[CHARACTER NAMES] JSON parsing failed: {e}, falling back to line parsing")
-                character_names = []
-        else:
-            if settings.debug:
-                print(f"[CHARACTER NAMES] JSON parsing failed: {response.json_errors}, falling back to line parsing")
-                print(f"[CHARACTER NAMES] Raw response preview: {names_text[:200]}...")
-            character_names = []
+        data = response.json_data if response.json_parsed else None
+        entries = data.get("characters") if isinstance(data, dict) else None
+        if not isinstance(entries, list):
+            logger.debug("[CHARACTER SHEETS] Fused extraction returned no character list: %s", response.json_errors)
+            return
         
-        # Fallback to line-by-line parsing if JSON parsing failed
+        sheets: Dict[str, str] = {}
+        for entry in entries:
+            if not isinstance(entry, dict) or not isinstance(entry.get("sheet"), str) or not entry["sheet"].strip():
+                continue
+            name = str(entry.get("name") or "").strip()
+            if name and len(name) < 50:
+                sheets.setdefault(name, entry["sheet"].strip())
+        
+        character_names = self._parse_name_list("", True, list(sheets))
         if not character_names:
-            # Since llm-output-parser handles markdown automatically, 
-            # we can use simpler line parsing as fallback
-            for line in names_text.split('\n'):
-                line = line.strip()
-                if line and not line.startswith('#') and not line.startswith('-') and not line.startswith('```'):
-                    # Remove any bullet points, numbers, or other formatting
-                    clean_name = line.replace('*', '').replace('-', '').replace('•', '')
-                    clean_name = clean_name.strip()
-                    if clean_name and len(clean_name) < 50:  # Reasonable name length
-                        character_names.append(clean_name)
-        
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_names = []
-        for name in character_names:
-            if name.lower() not in seen:
-                seen.add(name.lower())
-                unique_names.append(name)
+            logger.debug("[CHARACTER SHEETS] Fused extraction produced no usable sheets")
+            return
+        
+        # Sheets first, so the name list is only saved once every sheet it points to exists
+        await asyncio.gather(*(
+            self.savepoint_manager.save_step(_character_step(name, "sheet"), sheets[name])
+            for name in character_names
+        ))
+        await self.savepoint_manager.save_step("character_names", json.dumps(character_names, ensure_ascii=False))
+        logger.debug("[CHARACTER SHEETS] Fused extraction wrote sheets for: %s", character_names)
+    
+    async def _load_step_cached(self, step_name: str) -> Optional[Any]:
+        """Load a savepoint step, reusing the content of an earlier read of the same step.
         
-        return unique_names[:10]  # Limit to 10 characters max
+        Missing steps are not cached, so a step saved later is still picked up.
+        """
+        if step_name in self._step_cache:
+            return self._step_cache[step_name]
+        content = await self.savepoint_manager.load_step(step_name)
+        if content is not None:
+            self._step_cache[step_name] = content
+        return content
+    
+    def _run_in_background(self, coro: Coroutine[Any, Any, None]) -> None:
+        """Start coro as a task tracked in _background_tasks until it finishes."""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+    
+    async def extract_character_names(self, story_elements: str, settings: GenerationSettings) -> List[str]:
+        """Extract character names from story elements."""
+        return await self._extract_names(
+            prompt_id="characters/extract_names",
+            variables={"story_elements": story_elements},
+            savepoint_id="character_names",
+            source_text=story_elements,
+            settings=settings
+        )
     
     async def generate_single_character_sheet(self, character_name: str, story_elements: str, additional_context: str, settings: GenerationSettings) -> None:
         """Generate a character sheet for a single character using multistep conversation for optimal RAG indexing."""
-        model_config = ModelConfig.from_string(self.config["models"]["initial_outline_writer"])
+        model_config = self._model_configs["initial_outline_writer"]
         
         try:
             # Start the conversation with the character creation prompt
@@ -158,7 +297,7 @@ class CharacterManager:
             response = await execute_messages_with_savepoint(
                 handler=self.prompt_handler,
                 conversation_history=conversation,
-                savepoint_id=f"characters/{character_name}/sheet",
+                savepoint_id=_character_step(character_name, "sheet"),
                 model_config=model_config,
                 seed=settings.seed,
                 debug=settings.debug,
@@ -171,17 +310,15 @@ class CharacterManager:
                 "content": response.content
             })
             
-            if settings.debug:
-                print(f"[CHARACTER SHEET] Generated initial sheet for {character_name}")
+            logger.debug("[CHARACTER SHEET] Generated initial sheet for %s", character_name)
             
             # Generate chunked character information using the conversation
             await self._generate_character_chunks(character_name, conversation, settings)
             
-            # Character chunks are now indexed individually after generation
+            # Character chunks are indexed together once all of them have been generated
                 
         except Exception as e:
-            if settings.debug:
-                print(f"[CHARACTER SHEET] Error generating sheet for {character_name}: {e}")
+            logger.debug("[CHARACTER SHEET] Error generating sheet for %s: %s", character_name, e)
     
     async def _generate_character_chunks(
         self, 
@@ -192,419 +329,466 @@ class CharacterManager:
     ) -> None:
         """Generate focused character chunks for optimal RAG indexing using conversation continuation."""
         try:
-            # Generate each chunk using specialized prompts, passing a copy of the conversation
-            await self._generate_personality_chunk(character_name, conversation.copy(), settings)
-            await self._generate_background_chunk(character_name, conversation.copy(), settings)
-            await self._generate_motivations_chunk(character_name, conversation.copy(), settings)
-            await self._generate_relationships_chunk(character_name, conversation.copy(), settings)
-            await self._generate_skills_chunk(character_name, conversation.copy(), settings)
-            await self._generate_current_state_chunk(character_name, conversation.copy(), settings)
-            await self._generate_growth_arc_chunk(character_name, conversation.copy(), settings)
-            
-            if settings.debug:
-                print(f"[CHARACTER CHUNKS] Generated all chunks for {character_name}")
+            # Each chunk only adds its own prompt to the sheet conversation, so the chunks are
+            # independent branches of one prefix and can run concurrently
+            async def generate_chunk(chunk_type: str) -> Optional[str]:
+                async with self._chunk_semaphore:
+                    return await self._generate_chunk(character_name, chunk_type, conversation, settings)
+            
+            # Content generated here is handed straight to indexing instead of being read back
+            chunks: Dict[str, str] = {}
+            
+            # Chunks saved by an earlier run need no prompt rendering at all; one listing finds them
+            chunk_types = _CHARACTER_CHUNK_TYPES
+            if self.savepoint_manager:
+                saved_steps = await self.savepoint_manager.list_steps(f"characters/{character_name}")
+                chunk_types = [chunk_type for chunk_type in chunk_types if chunk_type not in saved_steps]
                 
-        except Exception as e:
-            if settings.debug:
-                print(f"[CHARACTER CHUNKS] Error generating chunks for {character_name}: {e}")
-    
-    async def _generate_personality_chunk(
-        self, 
-        character_name: str, 
-        conversation: List[Dict[str, str]], 
-        settings: GenerationSettings
-    ) -> None:
-        """Generate personality chunk focusing on core traits and behavioral patterns."""
-        model_config = ModelConfig.from_string(self.config["models"]["logical_model"])
-        
-        try:
-            # Continue the conversation with the personality chunk prompt
-            personality_prompt = self.prompt_handler.prompt_loader.load_prompt("characters/create_personality_chunk", {
-                "character_name": character_name,
-            })
+                # Optionally write the missing chunks in one call; any it leaves out are prompted singly
+                if chunk_types and self.config.get("fuse_character_chunks", False):
+                    chunks.update(await self._generate_fused_chunks(character_name, chunk_types, conversation, settings))
+                    chunk_types = [chunk_type for chunk_type in chunk_types if chunk_type not in chunks]
             
-            conversation.append({
-                "role": "user",
-                "content": personality_prompt
-            })
+            contents = await asyncio.gather(*(generate_chunk(chunk_type) for chunk_type in chunk_types))
+            chunks.update((chunk_type, content) for chunk_type, content in zip(chunk_types, contents) if content)
             
-            response = await execute_messages_with_savepoint(
-                handler=self.prompt_handler,
-                conversation_history=conversation,
-                savepoint_id=f"characters/{character_name}/personality_chunk",
-                model_config=model_config,
-                seed=settings.seed,
-                debug=settings.debug,
-                stream=settings.stream
-            )
-            
-            if settings.debug:
-                print(f"[CHARACTER CHUNK] Generated personality chunk for {character_name}")
+            logger.debug("[CHARACTER CHUNKS] Generated all chunks for %s", character_name)
             
-            # Index this chunk immediately after generation
-            await self._index_character_chunk(character_name, "personality_chunk", settings)
+            # Index the chunks together in the background so the next character is not held up
+            self._run_in_background(self._index_character_chunks(character_name, generated=chunks))
                 
         except Exception as e:
-            if settings.debug:
-                print(f"[CHARACTER CHUNK] Error generating personality chunk for {character_name}: {e}")
+            logger.debug("[CHARACTER CHUNKS] Error generating chunks for %s: %s", character_name, e)
     
-    async def _index_character_chunk(self, character_name: str, chunk_type: str, settings: GenerationSettings) -> None:
-        """Index a character chunk in RAG."""
-        if not self.rag_integration or not self.savepoint_manager:
-            return
-            
-        try:
-            chunk_key = f"characters/{character_name}/{chunk_type}"
-            chunk_content = await self.savepoint_manager.load_step(chunk_key)
-            
-            if chunk_content:
-                # Index each chunk with appropriate metadata
-                chunk_ids = await self.rag_integration.index_character(
-                    character_content=chunk_content,
-                    character_name=character_name,
-                    metadata={
-                        "character_name": character_name,
-                        "content_type": "character_chunk",
-                        "chunk_type": chunk_type.replace("_chunk", ""),
-                        "generation_stage": "outline"
-                    }
-                )
-                
-                if settings.debug:
-                    print(f"[RAG CHARACTER INDEXING] Indexed {len(chunk_ids)} chunks for {character_name} - {chunk_type}")
-        except Exception as e:
-            if settings.debug:
-                print(f"[RAG CHARACTER INDEXING] Could not index {chunk_type} for {character_name}: {e}")
-
-    async def _generate_background_chunk(
+    async def _generate_chunk(
         self, 
         character_name: str, 
+        chunk_type: str,
         conversation: List[Dict[str, str]], 
         settings: GenerationSettings
-    ) -> None:
-        """Generate background chunk focusing on history and formative experiences."""
-        model_config = ModelConfig.from_string(self.config["models"]["logical_model"])
+    ) -> Optional[str]:
+        """Generate one focused chunk of a character sheet by continuing the sheet conversation.
+        
+        ``conversation`` is shared by every chunk of the character and is not modified.
+        Returns the saved chunk content, or None if generation failed.
+        """
+        model_config = self._model_configs["logical_model"]
         
         try:
-            # Continue the conversation with the background chunk prompt
-            background_prompt = self.prompt_handler.prompt_loader.load_prompt("characters/create_background_chunk", {
+            # Continue the conversation with this chunk's prompt
+            chunk_prompt = self.prompt_handler.prompt_loader.load_prompt(f"characters/create_{chunk_type}", {
                 "character_name": character_name,
             })
             
-            conversation.append({
-                "role": "user",
-                "content": background_prompt
-            })
-            
             response = await execute_messages_with_savepoint(
                 handler=self.prompt_handler,
-                conversation_history=conversation,
-                savepoint_id=f"characters/{character_name}/background_chunk",
+                conversation_history=[*conversation, {"role": "user", "content": chunk_prompt}],
+                savepoint_id=_character_step(character_name, chunk_type),
                 model_config=model_config,
                 seed=settings.seed,
                 debug=settings.debug,
                 stream=settings.stream
             )
             
-            if settings.debug:
-                print(f"[CHARACTER CHUNK] Generated background chunk for {character_name}")
-            
-            # Index this chunk immediately after generation
-            await self._index_character_chunk(character_name, "background_chunk", settings)
+            logger.debug("[CHARACTER CHUNK] Generated %s for %s", chunk_type.replace("_", " "), character_name)
+            return response.content
                 
         except Exception as e:
-            if settings.debug:
-                print(f"[CHARACTER CHUNK] Error generating background chunk for {character_name}: {e}")
+            logger.debug("[CHARACTER CHUNK] Error generating %s for %s: %s", chunk_type.replace("_", " "), character_name, e)
+            return None
     
-    async def _generate_motivations_chunk(
-        self, 
-        character_name: str, 
-        conversation: List[Dict[str, str]], 
+    async def _generate_fused_chunks(
+        self,
+        character_name: str,
+        chunk_types: List[str],
+        conversation: List[Dict[str, str]],
         settings: GenerationSettings
-    ) -> None:
-        """Generate motivations chunk focusing on goals, driving forces, and values."""
-        model_config = ModelConfig.from_string(self.config["models"]["logical_model"])
+    ) -> Dict[str, str]:
+        """Generate all chunks of a character sheet with one structured call and save the requested ones.
         
+        Returns the saved chunks by chunk type; an unusable response saves nothing.
+        """
         try:
-            # Continue the conversation with the motivations chunk prompt
-            motivations_prompt = self.prompt_handler.prompt_loader.load_prompt("characters/create_motivations_chunk", {
+            chunk_prompt = self.prompt_handler.prompt_loader.load_prompt("characters/create_all_chunks", {
                 "character_name": character_name,
             })
             
-            conversation.append({
-                "role": "user",
-                "content": motivations_prompt
-            })
-            
             response = await execute_messages_with_savepoint(
                 handler=self.prompt_handler,
-                conversation_history=conversation,
-                savepoint_id=f"characters/{character_name}/motivations_chunk",
-                model_config=model_config,
+                conversation_history=[*conversation, {"role": "user", "content": chunk_prompt}],
+                model_config=self._model_configs["logical_model"],
                 seed=settings.seed,
                 debug=settings.debug,
-                stream=settings.stream
+                stream=settings.stream,
+                expect_json=True,
+                json_schema=_CHARACTER_CHUNKS_SCHEMA,
+                # The prompt asks for a bare JSON object, not <output> tags
+                skip_validation=True
             )
-            
-            if settings.debug:
-                print(f"[CHARACTER CHUNK] Generated motivations chunk for {character_name}")
-            
-            # Index this chunk immediately after generation
-            await self._index_character_chunk(character_name, "motivations_chunk", settings)
-                
         except Exception as e:
-            if settings.debug:
-                print(f"[CHARACTER CHUNK] Error generating motivations chunk for {character_name}: {e}")
+            logger.debug("[CHARACTER CHUNKS] Fused generation failed for %s: %s", character_name, e)
+            return {}
+        
+        data = response.json_data if response.json_parsed else None
+        if not isinstance(data, dict):
+            logger.debug("[CHARACTER CHUNKS] Fused generation for %s returned no JSON object: %s", character_name, response.json_errors)
+            return {}
+        
+        chunks: Dict[str, str] = {}
+        for chunk_type in chunk_types:
+            content = data.get(chunk_type.removesuffix("_chunk"))
+            if isinstance(content, str) and content.strip():
+                chunks[chunk_type] = content.strip()
+        await asyncio.gather(*(
+            self.savepoint_manager.save_step(_character_step(character_name, chunk_type), content)
+            for chunk_type, content in chunks.items()
+        ))
+        
+        logger.debug("[CHARACTER CHUNKS] Fused generation wrote %s for %s", sorted(chunks), character_name)
+        return chunks
     
-    async def _generate_relationships_chunk(
-        self, 
-        character_name: str, 
-        conversation: List[Dict[str, str]], 
-        settings: GenerationSettings
+    async def _index_character_chunks(
+        self,
+        character_name: str,
+        replace_existing: bool = False,
+        generated: Optional[Mapping[str, str]] = None
     ) -> None:
-        """Generate relationships chunk focusing on connections with other characters."""
-        model_config = ModelConfig.from_string(self.config["models"]["logical_model"])
+        """Index every saved chunk of a character in RAG with one batch call.
         
-        try:
-            # Continue the conversation with the relationships chunk prompt
-            relationships_prompt = self.prompt_handler.prompt_loader.load_prompt("characters/create_relationships_chunk", {
-                "character_name": character_name,
-            })
-            
-            conversation.append({
-                "role": "user",
-                "content": relationships_prompt
-            })
-            
-            response = await execute_messages_with_savepoint(
-                handler=self.prompt_handler,
-                conversation_history=conversation,
-                savepoint_id=f"characters/{character_name}/relationships_chunk",
-                model_config=model_config,
-                seed=settings.seed,
-                debug=settings.debug,
-                stream=settings.stream
-            )
-            
-            if settings.debug:
-                print(f"[CHARACTER CHUNK] Generated relationships chunk for {character_name}")
-            
-            # Index this chunk immediately after generation
-            await self._index_character_chunk(character_name, "relationships_chunk", settings)
+        ``generated`` holds chunk content already in memory by chunk type; only the other
+        chunks are read from savepoints. With ``replace_existing``, the character's previously
+        indexed chunks are deleted first; the deletion runs alongside the savepoint loads but
+        always finishes before anything new is indexed.
+        """
+        generated = generated or {}
+        if not self.rag_integration or not self.savepoint_manager:
+            return
+        
+        # One (re)index per character at a time, so a cleanup cannot delete a concurrent write
+        async with self._index_locks.setdefault(character_name, asyncio.Lock()):
+            try:
+                async def load(chunk_type: str) -> Optional[str]:
+                    if chunk_type in generated:
+                        return generated[chunk_type]
+                    return await self._load_step_cached(_character_step(character_name, chunk_type))
                 
-        except Exception as e:
-            if settings.debug:
-                print(f"[CHARACTER CHUNK] Error generating relationships chunk for {character_name}: {e}")
+                loads = asyncio.gather(*(load(chunk_type) for chunk_type in _CHARACTER_CHUNK_TYPES))
+                if replace_existing:
+                    _, chunk_contents = await asyncio.gather(self._cleanup_character_chunks(character_name), loads)
+                else:
+                    chunk_contents = await loads
+                
+                # Index each chunk with appropriate metadata
+                contents = [
+                    (chunk_content, {
+                        "character_name": character_name,
+                        "content_type": "character_chunk",
+                        "chunk_type": chunk_type.replace("_chunk", ""),
+                        "generation_stage": "outline"
+                    })
+                    for chunk_type, chunk_content in zip(_CHARACTER_CHUNK_TYPES, chunk_contents)
+                    if chunk_content
+                ]
+                if not contents:
+                    return
+                
+                chunk_ids = await self.rag_integration.index_character_batch(character_name, contents)
+                
+                logger.debug("[RAG CHARACTER INDEXING] Indexed %s chunks for %s", len(chunk_ids), character_name)
+            except Exception as e:
+                logger.debug("[RAG CHARACTER INDEXING] Could not index chunks for %s: %s", character_name, e)
     
-    async def _generate_skills_chunk(
-        self, 
-        character_name: str, 
-        conversation: List[Dict[str, str]], 
-        settings: GenerationSettings
-    ) -> None:
-        """Generate skills chunk focusing on competencies, talents, and limitations."""
-        model_config = ModelConfig.from_string(self.config["models"]["logical_model"])
+    async def _index_unindexed_characters(self, character_names: List[str]) -> None:
+        """Index, in the background, those characters that have no chunks in RAG yet.
+        
+        The probe is a metadata count, so characters already indexed cost no embedding or
+        LLM work; if it fails, nothing is indexed rather than risking duplicates.
+        """
+        if not self.rag_integration or not character_names:
+            return
         
         try:
-            # Continue the conversation with the skills chunk prompt
-            skills_prompt = self.prompt_handler.prompt_loader.load_prompt("characters/create_skills_chunk", {
-                "character_name": character_name,
-            })
-            
-            conversation.append({
-                "role": "user",
-                "content": skills_prompt
-            })
-            
-            response = await execute_messages_with_savepoint(
-                handler=self.prompt_handler,
-                conversation_history=conversation,
-                savepoint_id=f"characters/{character_name}/skills_chunk",
-                model_config=model_config,
-                seed=settings.seed,
-                debug=settings.debug,
-                stream=settings.stream
-            )
-            
-            if settings.debug:
-                print(f"[CHARACTER CHUNK] Generated skills chunk for {character_name}")
-            
-            # Index this chunk immediately after generation
-            await self._index_character_chunk(character_name, "skills_chunk", settings)
-                
+            counts = await asyncio.gather(*(
+                self.rag_integration.count_content_by_type_and_metadata(
+                    content_type="character",
+                    metadata_filters={"character_name": character_name}
+                )
+                for character_name in character_names
+            ))
         except Exception as e:
-            if settings.debug:
-                print(f"[CHARACTER CHUNK] Error generating skills chunk for {character_name}: {e}")
+            logger.debug("[RAG CHARACTER INDEXING] Could not check indexed characters: %s", e)
+            return
+        
+        for character_name, count in zip(character_names, counts):
+            if not count:
+                self._run_in_background(self._index_character_chunks(character_name))
     
-    async def _generate_current_state_chunk(
+    async def _cleanup_character_chunks(self, character_name: str) -> None:
+        """Delete a character's indexed chunks before reindexing; failures are logged, not raised."""
+        try:
+            deleted_count = await self.rag_integration.cleanup_content_by_type_and_metadata(
+                content_type="character",
+                metadata_filters={
+                    "character_name": character_name
+                }
+            )
+            logger.debug("[RAG CHARACTER INDEXING] Cleaned up %s existing chunks for character '%s' before reindexing", deleted_count, character_name)
+        except Exception as e:
+            logger.debug("[RAG CHARACTER INDEXING] Warning: Failed to cleanup existing chunks for '%s': %s", character_name, e)
+            # Continue with indexing even if cleanup fails
+
+    async def index_character_in_rag(
         self, 
         character_name: str, 
-        conversation: List[Dict[str, str]], 
         settings: GenerationSettings
     ) -> None:
-        """Generate current state chunk focusing on present circumstances and emotional state."""
-        model_config = ModelConfig.from_string(self.config["models"]["logical_model"])
+        """Index character content in RAG from savepoint manager. Can be called by other modules."""
+        # Clean up existing character chunks, then index all character chunks for optimal RAG retrieval
+        await self._index_character_chunks(character_name, replace_existing=True)
+    
+    def _extraction_cache(self, prompt_id: str) -> SemanticCache:
+        """Return the name extraction cache for a prompt, creating it on first use.
         
-        try:
-            # Continue the conversation with the current state chunk prompt
-            current_state_prompt = self.prompt_handler.prompt_loader.load_prompt("characters/create_current_state_chunk", {
-                "character_name": character_name,
-            })
-            
-            conversation.append({
-                "role": "user",
-                "content": current_state_prompt
-            })
-            
-            response = await execute_messages_with_savepoint(
-                handler=self.prompt_handler,
-                conversation_history=conversation,
-                savepoint_id=f"characters/{character_name}/current_state_chunk",
-                model_config=model_config,
-                seed=settings.seed,
-                debug=settings.debug,
-                stream=settings.stream
+        Near-identical matches are only reused when the extraction model is explicitly
+        configured with temperature 0. An unset temperature leaves the provider's own
+        default (often well above 0), so a rerun is expected to vary, and only exact input
+        matches are served from the cache.
+        """
+        cache = self._extraction_caches.get(prompt_id)
+        if cache is None:
+            deterministic = self._model_configs["logical_model"].parameters.get("temperature") == 0
+            embedding_provider = self.rag_service.embedding_provider if self.rag_service and deterministic else None
+            cache = self._extraction_caches[prompt_id] = SemanticCache(
+                embedding_provider=embedding_provider,
+                similarity_threshold=self.config.get("extraction_cache_similarity", 0.97)
             )
-            
-            if settings.debug:
-                print(f"[CHARACTER CHUNK] Generated current state chunk for {character_name}")
-            
-            # Index this chunk immediately after generation
-            await self._index_character_chunk(character_name, "current_state_chunk", settings)
-                
-        except Exception as e:
-            if settings.debug:
-                print(f"[CHARACTER CHUNK] Error generating current state chunk for {character_name}: {e}")
+        return cache
     
-    async def _generate_growth_arc_chunk(
-        self, 
-        character_name: str, 
-        conversation: List[Dict[str, str]], 
-        settings: GenerationSettings
+    async def _lookup_extraction(
+        self, prompt_id: str, savepoint_id: str, text: str
+    ) -> Tuple[Optional[List[str]], Optional[List[float]]]:
+        """Return (cached names or None, embedding of text) for a name extraction about to run.
+        
+        A saved step wins over the cache, so the lookup is skipped when one exists.
+        """
+        if await self.prompt_handler.check_savepoint_exists(savepoint_id):
+            return None, None
+        return await self._extraction_cache(prompt_id).get(text)
+    
+    def _store_extraction(
+        self, prompt_id: str, text: str, names: List[str], embedding: Optional[List[float]]
     ) -> None:
-        """Generate growth arc chunk focusing on development patterns and character evolution."""
-        model_config = ModelConfig.from_string(self.config["models"]["logical_model"])
+        """Remember a name extraction result for reuse on identical or near-identical text."""
+        self._extraction_cache(prompt_id).put(text, names, embedding)
+    
+    async def _extract_names(
+        self,
+        prompt_id: str,
+        variables: Dict[str, Any],
+        savepoint_id: str,
+        source_text: str,
+        settings: GenerationSettings
+    ) -> List[str]:
+        """Run a character name extraction prompt and return up to 10 unique names.
         
+        ``source_text`` is the text the names come from; it keys the extraction cache.
+        """
+        cached_names, text_embedding = await self._lookup_extraction(prompt_id, savepoint_id, source_text)
+        if cached_names is not None:
+            logger.debug("[CHARACTER EXTRACTION] Reusing cached names for %s", savepoint_id)
+            # Saved like a prompted result, so a resumed run reads the same names back
+            if self.savepoint_manager:
+                await self.savepoint_manager.save_step(savepoint_id, json.dumps(cached_names, ensure_ascii=False))
+            return list(cached_names)
+        
+        model_config = self._model_configs["logical_model"]
+        
+        response = await execute_prompt_with_savepoint(
+            handler=self.prompt_handler,
+            prompt_id=prompt_id,
+            variables=variables,
+            savepoint_id=savepoint_id,
+            model_config=model_config,
+            seed=settings.seed,
+            debug=settings.debug,
+            stream=settings.stream,
+            log_prompt_inputs=settings.log_prompt_inputs,
+            system_message=self.system_message,
+            expect_json=True,
+            json_schema=_CHARACTER_NAMES_SCHEMA
+        )
+        
+        if not response.json_parsed:
+            logger.debug("[CHARACTER EXTRACTION] JSON parsing failed: %s, falling back to line parsing", response.json_errors)
+            logger.debug("[CHARACTER EXTRACTION] Raw response preview: %.200s...", response.content.strip())
+        
+        extracted_names = self._parse_name_list(response.content, response.json_parsed, response.json_data)
+        if extracted_names:
+            self._store_extraction(prompt_id, source_text, extracted_names, text_embedding)
+        return extracted_names
+    
+    @staticmethod
+    def _parse_name_list(names_text: str, json_parsed: bool, json_data: Any = None) -> List[str]:
+        """Parse a name extraction response: JSON list first, then one name per line.
+        
+        ``json_data`` is the value the prompt layer already parsed when ``json_parsed`` is
+        set; ``names_text`` is never decoded a second time. Names are deduplicated
+        case-insensitively in order and capped at 10.
+        """
+        # The line regex does not care about surrounding whitespace, so only the
+        # individual names are stripped
+        character_names = []
+        
+        if json_parsed:
+            # llm-output-parser has already successfully parsed the JSON
+            if isinstance(json_data, list):
+                stripped = (str(name).strip() for name in json_data if name)
+                # Same reasonable name length as the line fallback
+                character_names = [name for name in stripped if name and len(name) < 50]
+                logger.debug("[CHARACTER EXTRACTION] Successfully parsed JSON: %s", character_names)
+            else:
+                logger.debug("[CHARACTER EXTRACTION] Expected list but got: %s", type(json_data))
+        
+        # Fallback to line-by-line parsing if JSON parsing failed
+        if not character_names:
+            character_names = [
+                match.group(1) for match in _NAME_LINE_RE.finditer(names_text)
+                if len(match.group(1)) < 50  # Reasonable name length
+            ]
+        
+        # Remove duplicates while preserving order; the first spelling of a name wins
+        unique_names: Dict[str, str] = {}
+        for name in character_names:
+            unique_names.setdefault(name.casefold(), name)
+            if len(unique_names) == 10:  # Limit to 10 characters max
+                break
+        
+        return list(unique_names.values())
+    
+    async def extract_chapter_characters(self, chapter_synopsis: str, chapter_num: int, settings: GenerationSettings) -> List[str]:
+        """Extract character names from chapter synopsis."""
         try:
-            # Continue the conversation with the growth arc chunk prompt
-            growth_arc_prompt = self.prompt_handler.prompt_loader.load_prompt("characters/create_growth_arc_chunk", {
-                "character_name": character_name,
-            })
-            
-            conversation.append({
-                "role": "user",
-                "content": growth_arc_prompt
-            })
-            
-            response = await execute_messages_with_savepoint(
-                handler=self.prompt_handler,
-                conversation_history=conversation,
-                savepoint_id=f"characters/{character_name}/growth_arc_chunk",
-                model_config=model_config,
-                seed=settings.seed,
-                debug=settings.debug,
-                stream=settings.stream
+            return await self._extract_names(
+                prompt_id="characters/extract_from_chapter",
+                variables={"chapter_synopsis": chapter_synopsis, "chapter_num": chapter_num},
+                savepoint_id=f"chapter_{chapter_num}/characters",
+                source_text=chapter_synopsis,
+                settings=settings
             )
-            
-            if settings.debug:
-                print(f"[CHARACTER CHUNK] Generated growth arc chunk for {character_name}")
-            
-            # Index this chunk immediately after generation
-            await self._index_character_chunk(character_name, "growth_arc_chunk", settings)
-                
         except Exception as e:
-            if settings.debug:
-                print(f"[CHARACTER CHUNK] Error generating growth arc chunk for {character_name}: {e}")
+            logger.debug("[CHAPTER CHARACTERS] Error extracting characters for chapter %s: %s", chapter_num, e)
+            return []
     
-
-    async def index_character_in_rag(
-        self, 
-        character_name: str, 
+    async def extract_chapter_characters_batch(
+        self,
+        chapters: List[Tuple[int, str]],
         settings: GenerationSettings
-    ) -> None:
-        """Index character content in RAG from savepoint manager. Can be called by other modules."""
-        if not self.rag_integration or not self.savepoint_manager:
-            return
+    ) -> Dict[int, List[str]]:
+        """Extract characters for several (chapter number, synopsis) pairs, a batch per model call.
         
-        try:
-            # Clean up existing character chunks before reindexing
+        Enabled by ``character_extraction_batch_size`` (chapters per call). Each chapter's names
+        are saved as its ``chapter_N/characters`` step, so ``extract_chapter_characters`` later
+        loads them instead of prompting. Chapters already saved, or missing from a batch
+        response, are left to the per-chapter path.
+        
+        Without batching, ``character_extraction_concurrency`` instead runs the per-chapter
+        extraction for every chapter up front, that many calls at a time.
+        """
+        batch_size = self.config.get("character_extraction_batch_size", 0)
+        if batch_size < 2:
+            return await self._extract_chapter_characters_concurrently(chapters, settings)
+        if not self.savepoint_manager or len(chapters) < 2:
+            return {}
+        
+        saved = await asyncio.gather(
+            *(self.savepoint_manager.has_step(f"chapter_{chapter_num}/characters") for chapter_num, _ in chapters)
+        )
+        pending = [chapter for chapter, is_saved in zip(chapters, saved) if not is_saved]
+        
+        async def extract_batch(batch: List[Tuple[int, str]]) -> Dict[int, List[str]]:
+            chapters_text = "\n\n".join(
+                f'<CHAPTER number="{chapter_num}">\n{synopsis}\n</CHAPTER>' for chapter_num, synopsis in batch
+            )
             try:
-                deleted_count = await self.rag_integration.cleanup_content_by_type_and_metadata(
-                    content_type="character",
-                    metadata_filters={
-                        "character_name": character_name
-                    }
+                response = await execute_prompt_with_savepoint(
+                    handler=self.prompt_handler,
+                    prompt_id="characters/extract_from_chapters_batch",
+                    variables={"chapters": chapters_text},
+                    model_config=self._model_configs["logical_model"],
+                    seed=settings.seed,
+                    debug=settings.debug,
+                    stream=settings.stream,
+                    log_prompt_inputs=settings.log_prompt_inputs,
+                    system_message=self.system_message,
+                    expect_json=True,
+                    json_schema=_CHAPTER_CHARACTERS_SCHEMA
                 )
-                if settings.debug:
-                    print(f"[RAG CHARACTER INDEXING] Cleaned up {deleted_count} existing chunks for character '{character_name}' before reindexing")
             except Exception as e:
-                if settings.debug:
-                    print(f"[RAG CHARACTER INDEXING] Warning: Failed to cleanup existing chunks for '{character_name}': {e}")
-                # Continue with indexing even if cleanup fails
-            
-
-            
-            # Index all character chunks for optimal RAG retrieval
-            chunk_types = [
-                "personality_chunk",
-                "background_chunk", 
-                "motivations_chunk",
-                "relationships_chunk",
-                "skills_chunk",
-                "current_state_chunk",
-                "growth_arc_chunk"
-            ]
-            
-            for chunk_type in chunk_types:
-                try:
-                    chunk_key = f"characters/{character_name}/{chunk_type}"
-                    chunk_content = await self.savepoint_manager.load_step(chunk_key)
-                    
-                    if chunk_content:
-                        # Index each chunk with appropriate metadata
-                        chunk_ids = await self.rag_integration.index_character(
-                            character_content=chunk_content,
-                            character_name=character_name,
-                            metadata={
-                                "character_name": character_name,
-                                "content_type": "character_chunk",
-                                "chunk_type": chunk_type.replace("_chunk", ""),
-                                "generation_stage": "outline"
-                            }
-                        )
-                        
-                        if settings.debug:
-                            print(f"[RAG CHARACTER INDEXING] Indexed {len(chunk_ids)} chunks for {character_name} - {chunk_type}")
-                
-                except Exception as e:
-                    if settings.debug:
-                        print(f"[RAG CHARACTER INDEXING] Could not index {chunk_type} for {character_name}: {e}")
+                logger.debug("[CHAPTER CHARACTERS] Batch extraction failed for chapters %s: %s", [n for n, _ in batch], e)
+                return {}
+            
+            if not response.json_parsed or not isinstance(response.json_data, dict):
+                logger.debug("[CHAPTER CHARACTERS] Batch extraction returned no JSON object: %s", response.json_errors)
+                return {}
+            
+            extracted: Dict[int, List[str]] = {}
+            for chapter_num, _ in batch:
+                names = response.json_data.get(str(chapter_num))
+                if not isinstance(names, list):
+                    continue
+                extracted[chapter_num] = self._parse_name_list("", True, names)
+                await self.savepoint_manager.save_step(
+                    f"chapter_{chapter_num}/characters", json.dumps(extracted[chapter_num], ensure_ascii=False)
+                )
+            return extracted
         
-        except Exception as e:
-            if settings.debug:
-                print(f"[RAG CHARACTER INDEXING] Error indexing character '{character_name}' in RAG: {e}")
+        results = await asyncio.gather(
+            *(extract_batch(pending[start:start + batch_size]) for start in range(0, len(pending), batch_size))
+        )
+        return {chapter_num: names for result in results for chapter_num, names in result.items()}
     
-
+    async def _extract_chapter_characters_concurrently(
+        self,
+        chapters: List[Tuple[int, str]],
+        settings: GenerationSettings
+    ) -> Dict[int, List[str]]:
+        """Run ``extract_chapter_characters`` for every chapter, ``character_extraction_concurrency`` at a time."""
+        concurrency = self.config.get("character_extraction_concurrency", 0)
+        if concurrency < 2 or len(chapters) < 2:
+            return {}
+        
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def extract_one(chapter_num: int, synopsis: str) -> Tuple[int, List[str]]:
+            async with semaphore:
+                return chapter_num, await self.extract_chapter_characters(synopsis, chapter_num, settings)
+        
+        return dict(await asyncio.gather(*(extract_one(chapter_num, synopsis) for chapter_num, synopsis in chapters)))
     
-    async def extract_chapter_characters(self, chapter_synopsis: str, chapter_num: int, settings: GenerationSettings) -> List[str]:
-        """Extract character names from chapter synopsis."""
-        model_config = ModelConfig.from_string(self.config["models"]["logical_model"])
+    async def extract_new_characters(
+        self,
+        chapter_content: str,
+        known: List[str],
+        chapter_num: int,
+        settings: GenerationSettings
+    ) -> List[str]:
+        """Extract character names in chapter content that are not already in ``known``.
+
+        The synopsis-phase extraction already covers most of a chapter's characters, so this
+        only asks the model for the delta instead of re-extracting from the full text.
+        """
+        model_config = self._model_configs["logical_model"]
         
         try:
-            # Define JSON schema for character names
-            CHARACTER_NAMES_SCHEMA = {
-                "type": "array",
-                "items": {"type": "string"}
-            }
-
             response = await execute_prompt_with_savepoint(
                 handler=self.prompt_handler,
-                prompt_id="characters/extract_from_chapter",
+                prompt_id="characters/extract_new_from_chapter",
                 variables={
-                    "chapter_synopsis": chapter_synopsis,
+                    "chapter_content": chapter_content,
+                    "known_characters": json.dumps(known, ensure_ascii=False),
                     "chapter_num": chapter_num
                 },
-                savepoint_id=f"chapter_{chapter_num}/characters",
+                savepoint_id=f"chapter_{chapter_num}/new_characters",
                 model_config=model_config,
                 seed=settings.seed,
                 debug=settings.debug,
@@ -612,54 +796,26 @@ class CharacterManager:
                 log_prompt_inputs=settings.log_prompt_inputs,
                 system_message=self.system_message,
                 expect_json=True,
-                json_schema=CHARACTER_NAMES_SCHEMA
+                json_schema=_CHARACTER_NAMES_SCHEMA
             )
             
-            # Parse the response using the new JSON integration
-            names_text = response.content.strip()
+            parsed_names = response.json_data if response.json_parsed else None
+            if not isinstance(parsed_names, list):
+                return []
             
-            # First try to parse as JSON (the expected format)
-            character_names = []
-            if response.json_parsed:
-                try:
-                    parsed_names = json.loads(names_text)
-                    if isinstance(parsed_names, list):
-                        character_names = [str(name).strip() for name in parsed_names if name and str(name).strip()]
-                        if settings.debug:
-                            print(f"[CHARACTER EXTRACTION] Successfully parsed JSON: {character_names}")
-                except (json.JSONDecodeError, AttributeError) as e:
-                    if settings.debug:
-                        print(f"[CHARACTER EXTRACTION] JSON parsing failed: {e}, falling back to line parsing")
-                    character_names = []
-            else:
-                if settings.debug:
-                    print(f"[CHARACTER EXTRACTION] JSON parsing failed: {response.json_errors}, falling back to line parsing")
-                character_names = []
-            
-            # Fallback to line-by-line parsing if JSON parsing failed
-            if not character_names:
-                for line in names_text.split('\n'):
-                    line = line.strip()
-                    if line and not line.startswith('#') and not line.startswith('-'):
-                        # Remove any bullet points, numbers, or other formatting
-                        clean_name = line.replace('*', '').replace('-', '').replace('•', '')
-                        clean_name = clean_name.strip()
-                        if clean_name and len(clean_name) < 50:  # Reasonable name length
-                            character_names.append(clean_name)
-            
-            # Remove duplicates while preserving order
-            seen = set()
-            unique_names = []
-            for name in character_names:
-                if name.lower() not in seen:
-                    seen.add(name.lower())
-                    unique_names.append(name)
-            
-            return unique_names[:10]  # Limit to 10 characters max
+            # Drop anything the model echoed back from the known list; the first spelling of a name wins
+            known_keys = {name.casefold() for name in known}
+            unique_names: Dict[str, str] = {}
+            for name in (str(name).strip() for name in parsed_names if name):
+                if name and name.casefold() not in known_keys:
+                    unique_names.setdefault(name.casefold(), name)
+            new_names = list(unique_names.values())
+            
+            logger.debug("[CHAPTER CHARACTERS] New characters in chapter %s: %s", chapter_num, new_names)
+            return new_names
             
         except Exception as e:
-            if settings.debug:
-                print(f"[CHAPTER CHARACTERS] Error extracting characters for chapter {chapter_num}: {e}")
+            logger.debug("[CHAPTER CHARACTERS] Error extracting new characters for chapter %s: %s", chapter_num, e)
             return []
     
     async def fetch_character_sheets_for_chapter(self, character_names: List[str], settings: GenerationSettings) -> str:
@@ -667,15 +823,19 @@ class CharacterManager:
         if not character_names or not self.savepoint_manager:
             return ""
         
+        # The reads are independent, so issue them together
+        sheets = await asyncio.gather(
+            *(self._load_step_cached(_character_step(character_name, "sheet")) for character_name in character_names),
+            return_exceptions=True
+        )
+        
         character_sheets = []
-        for character_name in character_names:
-            try:
-                sheet_key = f"characters/{character_name}/sheet"
-                sheet_content = await self.savepoint_manager.load_step(sheet_key)
-                character_sheets.append(f"=== {character_name} ===\n{sheet_content}")
-            except:
-                if settings.debug:
-                    print(f"[CHARACTER SHEETS] Could not load sheet for {character_name}")
+        for character_name, sheet_content in zip(character_names, sheets):
+            # A missing step loads as None
+            if sheet_content is None or isinstance(sheet_content, Exception):
+                logger.debug("[CHARACTER SHEETS] Could not load sheet for %s", character_name)
+                continue
+            character_sheets.append(f"=== {character_name} ===\n{sheet_content}")
         
         return "\n\n".join(character_sheets)
     
@@ -690,132 +850,70 @@ class CharacterManager:
         if not character_names or not self.savepoint_manager:
             return
         
-        for character_name in character_names:
-            try:
-                # Check if character sheet exists
-                sheet_key = f"characters/{character_name}/sheet"
-                existing_sheet = ""
+        # Each character's update is independent, so run them concurrently within the shared bound
+        model_config = self._model_configs["initial_outline_writer"]
+        
+        async def update_one(character_name: str) -> None:
+            async with self._update_semaphore:
                 try:
-                    existing_sheet = await self.savepoint_manager.load_step(sheet_key)
-                except:
-                    if settings.debug:
-                        print(f"[CHARACTER UPDATE] No existing sheet for {character_name}, trying personality chunk as fallback")
-                        # Try to load personality chunk as fallback
-                        try:
-                            personality_key = f"characters/{character_name}/personality_chunk"
-                            existing_sheet = await self.savepoint_manager.load_step(personality_key)
-                            if settings.debug:
-                                print(f"[CHARACTER UPDATE] Using personality chunk for {character_name}")
-                        except:
-                            if settings.debug:
-                                print(f"[CHARACTER UPDATE] No personality chunk either for {character_name}")
-                            continue
-                
-                # Generate updated character sheet
-                model_config = ModelConfig.from_string(self.config["models"]["initial_outline_writer"])
+                    # A missing step loads as None; fall back to the personality chunk. Both reads
+                    # are issued together so the fallback costs no extra round trip
+                    existing_sheet, personality_chunk = await asyncio.gather(
+                        self._load_step_cached(_character_step(character_name, "sheet")),
+                        self._load_step_cached(_character_step(character_name, "personality_chunk"))
+                    )
+                    if existing_sheet is None:
+                        logger.debug("[CHARACTER UPDATE] No existing sheet for %s, trying personality chunk as fallback", character_name)
+                        existing_sheet = personality_chunk
+                        if existing_sheet is None:
+                            logger.debug("[CHARACTER UPDATE] No personality chunk either for %s", character_name)
+                            return
+                        logger.debug("[CHARACTER UPDATE] Using personality chunk for %s", character_name)
                 
-                response = await execute_prompt_with_savepoint(
-                    handler=self.prompt_handler,
-                    prompt_id="characters/update",
-                    variables={
-                        "character_name": character_name,
-                        "existing_sheet": existing_sheet,
-                        "chapter_outline": chapter_outline,
-                        "chapter_num": chapter_num
-                    },
-                    savepoint_id=f"characters/{character_name}/sheet",
-                    model_config=model_config,
-                    seed=settings.seed,
-                    debug=settings.debug,
-                    stream=settings.stream,
-                    log_prompt_inputs=settings.log_prompt_inputs,
-                    system_message=self.system_message
-                )
+                    # Generate updated character sheet
+                    sheet_step = _character_step(character_name, "sheet")
+                    response = await execute_prompt_with_savepoint(
+                        handler=self.prompt_handler,
+                        prompt_id="characters/update",
+                        variables={
+                            "character_name": character_name,
+                            "existing_sheet": existing_sheet,
+                            "chapter_outline": chapter_outline,
+                            "chapter_num": chapter_num
+                        },
+                        savepoint_id=sheet_step,
+                        model_config=model_config,
+                        seed=settings.seed,
+                        debug=settings.debug,
+                        stream=settings.stream,
+                        log_prompt_inputs=settings.log_prompt_inputs,
+                        system_message=self.system_message
+                    )
+                    # The saved sheet changed, so the next read must go back to the savepoint
+                    self._step_cache.pop(sheet_step, None)
                 
-                if settings.debug:
-                    print(f"[CHARACTER UPDATE] Updated sheet for {character_name} based on chapter {chapter_num}")
+                    logger.debug("[CHARACTER UPDATE] Updated sheet for %s based on chapter %s", character_name, chapter_num)
                     
-            except Exception as e:
-                if settings.debug:
-                    print(f"[CHARACTER UPDATE] Error updating sheet for {character_name}: {e}")
+                except Exception as e:
+                    logger.debug("[CHARACTER UPDATE] Error updating sheet for %s: %s", character_name, e)
+        
+        # update_one logs its own failures; anything escaping it must not abandon the other updates
+        await asyncio.gather(*(update_one(character_name) for character_name in character_names), return_exceptions=True)
     
 
     
     async def extract_chapter_characters_from_outline(self, chapter_outline: str, chapter_num: int, settings: GenerationSettings) -> List[str]:
         """Extract character names from chapter outline."""
-        model_config = ModelConfig.from_string(self.config["models"]["logical_model"])
-        
         try:
-            # Define JSON schema for character names
-            CHARACTER_NAMES_SCHEMA = {
-                "type": "array",
-                "items": {"type": "string"}
-            }
-
-            response = await execute_prompt_with_savepoint(
-                handler=self.prompt_handler,
+            return await self._extract_names(
                 prompt_id="characters/extract_from_chapter",
-                variables={
-                    "chapter_outline": chapter_outline,
-                    "chapter_num": chapter_num
-                },
+                variables={"chapter_outline": chapter_outline, "chapter_num": chapter_num},
                 savepoint_id=f"chapter_{chapter_num}/characters_from_outline",
-                model_config=model_config,
-                seed=settings.seed,
-                debug=settings.debug,
-                stream=settings.stream,
-                log_prompt_inputs=settings.log_prompt_inputs,
-                system_message=self.system_message,
-                expect_json=True,
-                json_schema=CHARACTER_NAMES_SCHEMA
+                source_text=chapter_outline,
+                settings=settings
             )
-            
-            # Parse the response using the new JSON integration
-            names_text = response.content.strip()
-            
-            # First try to parse as JSON (the expected format)
-            character_names = []
-            if response.json_parsed:
-                try:
-                    parsed_names = json.loads(names_text)
-                    if isinstance(parsed_names, list):
-                        character_names = [str(name).strip() for name in parsed_names if name and str(name).strip()]
-                        if settings.debug:
-                            print(f"[CHARACTER EXTRACTION] Successfully parsed JSON: {character_names}")
-                except (json.JSONDecodeError, AttributeError) as e:
-                    if settings.debug:
-                        print(f"[CHARACTER EXTRACTION] JSON parsing failed: {e}, falling back to line parsing")
-                    character_names = []
-            else:
-                if settings.debug:
-                    print(f"[CHARACTER EXTRACTION] JSON parsing failed: {response.json_errors}, falling back to line parsing")
-                print(f"[CHARACTER EXTRACTION] Raw response preview: {names_text[:200]}...")
-                character_names = []
-            
-            # Fallback to line-by-line parsing if JSON parsing failed
-            if not character_names:
-                for line in names_text.split('\n'):
-                    line = line.strip()
-                    if line and not line.startswith('#') and not line.startswith('-'):
-                        # Remove any bullet points, numbers, or other formatting
-                        clean_name = line.replace('*', '').replace('-', '').replace('•', '')
-                        clean_name = clean_name.strip()
-                        if clean_name and len(clean_name) < 50:  # Reasonable name length
-                            character_names.append(clean_name)
-            
-            # Remove duplicates while preserving order
-            seen = set()
-            unique_names = []
-            for name in character_names:
-                if name.lower() not in seen:
-                    seen.add(name.lower())
-                    unique_names.append(name)
-            
-            return unique_names[:10]  # Limit to 10 characters max
-            
         except Exception as e:
-            if settings.debug:
-                print(f"[CHAPTER CHARACTERS] Error extracting characters from outline for chapter {chapter_num}: {e}")
+            logger.debug("[CHAPTER CHARACTERS] Error extracting characters from outline for chapter %s: %s", chapter_num, e)
             return []
     
     async def generate_character_summary(
@@ -833,23 +931,46 @@ class CharacterManager:
             Natural language summary of the character, or empty string if not found
         """
         if not self.savepoint_manager:
-            if settings.debug:
-                print(f"[CHARACTER SUMMARY] No savepoint manager available for {character_name}")
+            logger.debug("[CHARACTER SUMMARY] No savepoint manager available for %s", character_name)
             return ""
         
+        if character_name in self._summary_cache:
+            return self._summary_cache[character_name]
+        
+        # Overlapping requests for the same character await one summary instead of prompting twice
+        task = self._summary_tasks.get(character_name)
+        if task is None:
+            task = self._summary_tasks[character_name] = asyncio.create_task(
+                self._summarize_character(character_name, settings)
+            )
+            task.add_done_callback(lambda _: self._summary_tasks.pop(character_name, None))
+        # Shielded so one caller being cancelled does not cancel the summary for the others
+        return await asyncio.shield(task)
+    
+    async def _summarize_character(self, character_name: str, settings: GenerationSettings) -> str:
+        """Load or generate the summary of one character and record it in _summary_cache."""
         try:
-            # Try to load key character chunks for summary generation
-            personality_key = f"characters/{character_name}/personality_chunk"
-            motivations_key = f"characters/{character_name}/motivations_chunk"
-            current_state_key = f"characters/{character_name}/current_state_chunk"
-            
-            personality_chunk = await self.savepoint_manager.load_step(personality_key)
-            motivations_chunk = await self.savepoint_manager.load_step(motivations_key)
-            current_state_chunk = await self.savepoint_manager.load_step(current_state_key)
+            # A saved summary is reused as is, so skip loading the chunks it was built from
+            saved_summary = await self.savepoint_manager.load_step(_character_step(character_name, "summary"))
+            if isinstance(saved_summary, str) and saved_summary.strip():
+                self._summary_cache[character_name] = saved_summary.strip()
+                return self._summary_cache[character_name]
+            
+            # Try to load key character chunks for summary generation; the reads are independent
+            # and an unreadable chunk is treated like a missing one
+            personality_chunk, motivations_chunk, current_state_chunk = (
+                None if isinstance(chunk, Exception) else chunk
+                for chunk in await asyncio.gather(
+                    *(
+                        self._load_step_cached(_character_step(character_name, chunk_type))
+                        for chunk_type in ("personality_chunk", "motivations_chunk", "current_state_chunk")
+                    ),
+                    return_exceptions=True
+                )
+            )
             
             if not personality_chunk and not motivations_chunk and not current_state_chunk:
-                if settings.debug:
-                    print(f"[CHARACTER SUMMARY] No character chunks found for {character_name}")
+                logger.debug("[CHARACTER SUMMARY] No character chunks found for %s", character_name)
                 return ""
             
             # Combine available chunks for summary generation
@@ -864,7 +985,7 @@ class CharacterManager:
             combined_info = "\n\n".join(character_info)
             
             # Generate natural language summary from the combined chunks
-            model_config = ModelConfig.from_string(self.config["models"]["logical_model"])
+            model_config = self._model_configs["logical_model"]
             
             response = await execute_prompt_with_savepoint(
                 handler=self.prompt_handler,
@@ -873,7 +994,7 @@ class CharacterManager:
                     "character_name": character_name,
                     "character_info": combined_info
                 },
-                savepoint_id=f"characters/{character_name}/summary",
+                savepoint_id=_character_step(character_name, "summary"),
                 model_config=model_config,
                 seed=settings.seed,
                 debug=settings.debug,
@@ -884,19 +1005,34 @@ class CharacterManager:
             
             if response and response.content and response.content.strip():
                 summary = response.content.strip()
-                if settings.debug:
-                    print(f"[CHARACTER SUMMARY] Generated summary for {character_name}: {len(summary)} characters")
+                logger.debug("[CHARACTER SUMMARY] Generated summary for %s: %s characters", character_name, len(summary))
+                self._summary_cache[character_name] = summary
                 return summary
             else:
-                if settings.debug:
-                    print(f"[CHARACTER SUMMARY] Warning: Empty response when generating summary for {character_name}")
+                logger.debug("[CHARACTER SUMMARY] Warning: Empty response when generating summary for %s", character_name)
                 return ""
                 
         except Exception as e:
-            if settings.debug:
-                print(f"[CHARACTER SUMMARY] Error generating summary for {character_name}: {e}")
+            logger.debug("[CHARACTER SUMMARY] Error generating summary for %s: %s", character_name, e)
             return ""
     
+    async def _generate_summaries(self, character_names: List[str], settings: GenerationSettings) -> List[str]:
+        """Generate summaries for several characters concurrently, in the order given.
+        
+        A character whose summary fails gets an empty one, like a character with no sheet.
+        """
+        async def summarize(character_name: str) -> str:
+            async with self._summary_semaphore:
+                return await self.generate_character_summary(character_name, settings)
+        
+        summaries = await asyncio.gather(
+            *(summarize(character_name) for character_name in character_names), return_exceptions=True
+        )
+        for character_name, summary in zip(character_names, summaries):
+            if isinstance(summary, Exception):
+                logger.debug("[CHARACTER SUMMARY] Error generating summary for %s: %s", character_name, summary)
+        return ["" if isinstance(summary, Exception) else summary for summary in summaries]
+    
     async def get_character_summaries(
         self,
         character_names: List[str],
@@ -916,27 +1052,24 @@ class CharacterManager:
         
         # Check if savepoint manager is available
         if not self.savepoint_manager:
-            if settings.debug:
-                print(f"[CHARACTER SUMMARIES] No savepoint manager available, returning character names only")
+            logger.debug("[CHARACTER SUMMARIES] No savepoint manager available, returning character names only")
             # Return just the character names as a fallback
-            return "\n\n".join([f"**{name}**: Character appears in this scene" for name in character_names])
+            return "\n\n".join(f"**{name}**: Character appears in this scene" for name in character_names)
         
-        summaries = []
-        for character_name in character_names:
-            summary = await self.generate_character_summary(character_name, settings)
-            if summary:
-                summaries.append(f"**{character_name}**: {summary}")
+        summaries = [
+            f"**{character_name}**: {summary}"
+            for character_name, summary in zip(character_names, await self._generate_summaries(character_names, settings))
+            if summary
+        ]
         
         if summaries:
             combined_summaries = "\n\n".join(summaries)
-            if settings.debug:
-                print(f"[CHARACTER SUMMARIES] Generated {len(summaries)} character summaries")
+            logger.debug("[CHARACTER SUMMARIES] Generated %s character summaries", len(summaries))
             return combined_summaries
         else:
-            if settings.debug:
-                print(f"[CHARACTER SUMMARIES] No character summaries generated, returning character names only")
+            logger.debug("[CHARACTER SUMMARIES] No character summaries generated, returning character names only")
             # Return just the character names as a fallback
-            return "\n\n".join([f"**{name}**: Character appears in this scene" for name in character_names])
+            return "\n\n".join(f"**{name}**: Character appears in this scene" for name in character_names)
     
     async def get_character_summaries_list(
         self,
@@ -960,27 +1093,24 @@ class CharacterManager:
         
         # Check if savepoint manager is available
         if not self.savepoint_manager:
-            if settings.debug:
-                print(f"[CHARACTER SUMMARIES LIST] No savepoint manager available, returning character names only")
+            logger.debug("[CHARACTER SUMMARIES LIST] No savepoint manager available, returning character names only")
             # Return just the character names as a fallback
-            return "\n\n---\n\n".join([f"**{name}**\n\nCharacter appears in this scene" for name in character_names])
+            return "\n\n---\n\n".join(f"**{name}**\n\nCharacter appears in this scene" for name in character_names)
         
-        summaries = []
-        for character_name in character_names:
-            summary = await self.generate_character_summary(character_name, settings)
-            if summary:
-                summaries.append(f"**{character_name}**\n\n{summary}")
+        summaries = [
+            f"**{character_name}**\n\n{summary}"
+            for character_name, summary in zip(character_names, await self._generate_summaries(character_names, settings))
+            if summary
+        ]
         
         if summaries:
             # Join summaries with horizontal rules, but don't add one after the last summary
             formatted_summaries = "\n\n---\n\n".join(summaries)
             
-            if settings.debug:
-                print(f"[CHARACTER SUMMARIES LIST] Generated {len(summaries)} character summaries with horizontal rule separators")
+            logger.debug("[CHARACTER SUMMARIES LIST] Generated %s character summaries with horizontal rule separators", len(summaries))
             
             return formatted_summaries
         else:
-            if settings.debug:
-                print(f"[CHARACTER SUMMARIES LIST] No character summaries generated, returning character names only")
+            logger.debug("[CHARACTER SUMMARIES LIST] No character summaries generated, returning character names only")
             # Return just the character names as a fallback
-            return "\n\n---\n\n".join([f"**{name}**\n\nCharacter appears in this scene" for name in character_names])
+            return "\n\n---\n\n".join(f"**{name}**\n\nCharacter appears in this scene" for name in character_names)
@@ -145,14 +145,12 @@ class OutlineGenerator:
     ) -> Dict[str, Any]:
         """Initialize the progressive outline system with story context."""
         try:
-            if settings.debug:
-                print(f"[PROGRESSIVE PLANNING] Initializing progressive outline system...")
+            logger.debug("[PROGRESSIVE PLANNING] Initializing progressive outline system...")
             
             # Initialize story context using story state manager
             story_context = await self.story_state_manager.initialize_story_context(prompt, settings)
             
-            if settings.debug:
-                print(f"[PROGRESSIVE PLANNING] Story context initialized: {story_context.story_direction}")
+            logger.debug("[PROGRESSIVE PLANNING] Story context initialized: %s", story_context.story_direction)
             
             # Generate initial story analysis chunks for RAG indexing
             story_chunks = await self._generate_story_analysis_chunks(prompt, settings, [])
@@ -178,8 +176,7 @@ class OutlineGenerator:
                 "generation_stage": "story_analysis"
             }
         )
-        if settings.debug:
-            print(f"[RAG STORY ANALYSIS] Indexed {chunk_type} chunk")
+        logger.debug("[RAG STORY ANALYSIS] Indexed %s chunk", chunk_type)
 
     async def _generate_story_analysis_chunks(
         self,
@@ -189,8 +186,7 @@ class OutlineGenerator:
     ) -> Dict[str, str]:
         """Generate focused story analysis chunks for optimal RAG indexing."""
         try:
-            if settings.debug:
-                print(f"[STORY ANALYSIS] Generating story analysis chunks")
+            logger.debug("[STORY ANALYSIS] Generating story analysis chunks")
             
             # Initialize base conversation for understanding the story prompt
             base_conversation = conversation_history
@@ -208,14 +204,12 @@ class OutlineGenerator:
             
             # Individual chunk methods now handle their own indexing
             
-            if settings.debug:
-                print(f"[STORY ANALYSIS] Generated all {len(chunks)} story analysis chunks")
+            logger.debug("[STORY ANALYSIS] Generated all %s story analysis chunks", len(chunks))
             
             return chunks
                 
         except Exception as e:
-            if settings.debug:
-                print(f"[STORY ANALYSIS] Error generating story analysis chunks: {e}")
+            logger.debug("[STORY ANALYSIS] Error generating story analysis chunks: %s", e)
             # Return empty dict as fallback
             return {}
     
@@ -248,8 +242,7 @@ class OutlineGenerator:
             )
             
             content = response.content.strip()
-            if settings.debug:
-                print(f"[STORY ANALYSIS] Generated core story foundation chunk")
+            logger.debug("[STORY ANALYSIS] Generated core story foundation chunk")
             
             # Index this chunk immediately
             await self._index_story_analysis_chunk(content, "core_story_foundation", settings)
@@ -257,8 +250,7 @@ class OutlineGenerator:
             return content
                 
         except Exception as e:
-            if settings.debug:
-                print(f"[STORY ANALYSIS] Error generating core story foundation chunk: {e}")
+            logger.debug("[STORY ANALYSIS] Error generating core story foundation chunk: %s", e)
             return ""
     
     async def _generate_character_foundation_chunk(
@@ -290,8 +282,7 @@ class OutlineGenerator:
             )
             
             content = response.content.strip()
-            if settings.debug:
-                print(f"[STORY ANALYSIS] Generated character foundation chunk")
+            logger.debug("[STORY ANALYSIS] Generated character foundation chunk")
             
             # Index this chunk immediately
             await self._index_story_analysis_chunk(content, "character_foundation", settings)
@@ -299,8 +290,7 @@ class OutlineGenerator:
             return content
                 
         except Exception as e:
-            if settings.debug:
-                print(f"[STORY ANALYSIS] Error generating character foundation chunk: {e}")
+            logger.debug("[STORY ANALYSIS] Error generating character foundation chunk: %s", e)
             return ""
     
     async def _generate_setting_foundation_chunk(
@@ -332,8 +322,7 @@ class OutlineGenerator:
             )
             
             content = response.content.strip()
-            if settings.debug:
-                print(f"[STORY ANALYSIS] Generated setting foundation chunk")
+            logger.debug("[STORY ANALYSIS] Generated setting foundation chunk")
             
             # Index this chunk immediately
             await self._index_story_analysis_chunk(content, "setting_foundation", settings)
@@ -341,8 +330,7 @@ class OutlineGenerator:
             return content
                 
         except Exception as e:
-            if settings.debug:
-                print(f"[STORY ANALYSIS] Error generating setting foundation chunk: {e}")
+            logger.debug("[STORY ANALYSIS] Error generating setting foundation chunk: %s", e)
             return ""
     
     async def _generate_plot_structure_chunk(
@@ -374,8 +362,7 @@ class OutlineGenerator:
             )
             
             content = response.content.strip()
-            if settings.debug:
-                print(f"[STORY ANALYSIS] Generated plot structure chunk")
+            logger.debug("[STORY ANALYSIS] Generated plot structure chunk")
             
             # Index this chunk immediately
             await self._index_story_analysis_chunk(content, "plot_structure", settings)
@@ -383,8 +370,7 @@ class OutlineGenerator:
             return content
                 
         except Exception as e:
-            if settings.debug:
-                print(f"[STORY ANALYSIS] Error generating plot structure chunk: {e}")
+            logger.debug("[STORY ANALYSIS] Error generating plot structure chunk: %s", e)
             return ""
     
     async def _generate_theme_message_chunk(
@@ -416,8 +402,7 @@ class OutlineGenerator:
             )
             
             content = response.content.strip()
-            if settings.debug:
-                print(f"[STORY ANALYSIS] Generated theme message chunk")
+            logger.debug("[STORY ANALYSIS] Generated theme message chunk")
             
             # Index this chunk immediately
             await self._index_story_analysis_chunk(content, "theme_message", settings)
@@ -425,8 +410,7 @@ class OutlineGenerator:
             return content
                 
         except Exception as e:
-            if settings.debug:
-                print(f"[STORY ANALYSIS] Error generating theme message chunk: {e}")
+            logger.debug("[STORY ANALYSIS] Error generating theme message chunk: %s", e)
             return ""
     
     async def _generate_tone_style_chunk(
@@ -458,8 +442,7 @@ class OutlineGenerator:
             )
             
             content = response.content.strip()
-            if settings.debug:
-                print(f"[STORY ANALYSIS] Generated tone style chunk")
+            logger.debug("[STORY ANALYSIS] Generated tone style chunk")
             
             # Index this chunk immediately
             await self._index_story_analysis_chunk(content, "tone_style", settings)
@@ -467,8 +450,7 @@ class OutlineGenerator:
             return content
                 
         except Exception as e:
-            if settings.debug:
-                print(f"[STORY ANALYSIS] Error generating tone style chunk: {e}")
+            logger.debug("[STORY ANALYSIS] Error generating tone style chunk: %s", e)
             return ""
     
     async def _generate_conflict_stakes_chunk(
@@ -500,8 +482,7 @@ class OutlineGenerator:
             )
             
             content = response.content.strip()
-            if settings.debug:
-                print(f"[STORY ANALYSIS] Generated conflict stakes chunk")
+            logger.debug("[STORY ANALYSIS] Generated conflict stakes chunk")
             
             # Index this chunk immediately
             await self._index_story_analysis_chunk(content, "conflict_stakes", settings)
@@ -509,8 +490,7 @@ class OutlineGenerator:
             return content
                 
         except Exception as e:
-            if settings.debug:
-                print(f"[STORY ANALYSIS] Error generating conflict stakes chunk: {e}")
+            logger.debug("[STORY ANALYSIS] Error generating conflict stakes chunk: %s", e)
             return ""
     
     async def _generate_world_rules_logic_chunk(
@@ -542,8 +522,7 @@ class OutlineGenerator:
             )
             
             content = response.content.strip()
-            if settings.debug:
-                print(f"[STORY ANALYSIS] Generated world rules logic chunk")
+            logger.debug("[STORY ANALYSIS] Generated world rules logic chunk")
             
             # Index this chunk immediately
             await self._index_story_analysis_chunk(content, "world_rules_logic", settings)
@@ -551,8 +530,7 @@ class OutlineGenerator:
             return content
                 
         except Exception as e:
-            if settings.debug:
-                print(f"[STORY ANALYSIS] Error generating world rules logic chunk: {e}")
+            logger.debug("[STORY ANALYSIS] Error generating world rules logic chunk: %s", e)
             return ""
     
     async def _extract_story_start_date_from_chunks(
@@ -586,8 +564,7 @@ class OutlineGenerator:
             return response.content.strip()
                 
         except Exception as e:
-            if settings.debug:
-                print(f"[STORY START DATE] Error extracting start date from chunks: {e}")
+            logger.debug("[STORY START DATE] Error extracting start date from chunks: %s", e)
             return "Present day"  # Default fallback
     
     async def _extract_base_context_from_chunks(
@@ -606,8 +583,7 @@ class OutlineGenerator:
             return core_foundation
                 
         except Exception as e:
-            if settings.debug:
-                print(f"[BASE CONTEXT] Error extracting base context from chunks: {e}")
+            logger.debug("[BASE CONTEXT] Error extracting base context from chunks: %s", e)
             return "Story development in progress"  # Default fallback
     
     async def _generate_story_elements_from_chunks(
@@ -635,8 +611,7 @@ class OutlineGenerator:
             return story_elements
                 
         except Exception as e:
-            if settings.debug:
-                print(f"[STORY ELEMENTS] Error generating story elements from chunks: {e}")
+            logger.debug("[STORY ELEMENTS] Error generating story elements from chunks: %s", e)
             return "Story elements generation in progress"  # Default fallback
 
 
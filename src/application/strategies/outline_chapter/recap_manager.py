@@ -1,6 +1,7 @@
 """Recap generation and processing functionality for the outline-chapter strategy."""
 
 import json
+import logging
 import re
 from datetime import datetime, timedelta
 from typing import List, Optional, Dict, Any
@@ -14,6 +15,8 @@ from infrastructure.prompts.prompt_wrapper import execute_prompt_with_savepoint
 from infrastructure.savepoints import SavepointManager
 from application.services.rag_service import RAGService
 
+logger = logging.getLogger(__name__)
+
 
 class RecapManager:
     """Handles recap generation, processing, and sanitization functionality."""
@@ -33,6 +36,8 @@ class RecapManager:
         self.system_message = system_message
         self.savepoint_manager = savepoint_manager
         self.rag_service = rag_service
+        
+        self._model_configs = ModelConfig.from_mapping(self.config.get("models", {}))
     
     async def get_previous_chapter_recap_from_savepoint(
         self,
@@ -47,9 +52,8 @@ class RecapManager:
         try:
             # Try to load existing recap from savepoint
             return await self.savepoint_manager.load_step(f"chapter_{chapter_num-1}/recap")
-        except:
-            if settings.debug:
-                print(f"[RECAP LOAD] No previous recap found in savepoint for chapter {chapter_num-1}")
+        except Exception:
+            logger.debug("[RECAP LOAD] No previous recap found in savepoint for chapter %s", chapter_num-1)
             return ""
     
     async def generate_chapter_recap(
@@ -93,9 +97,8 @@ class RecapManager:
             
         except Exception as e:
             # Fallback to simpler recap generation if the multi-stage approach fails
-            if settings.debug:
-                print(f"[RECAP GENERATION] Multi-stage approach failed for chapter {chapter_num}: {e}")
-                print("[RECAP GENERATION] Falling back to simple recap generation")
+            logger.debug("[RECAP GENERATION] Multi-stage approach failed for chapter %s: %s", chapter_num, e)
+            logger.debug("[RECAP GENERATION] Falling back to simple recap generation")
             
             return await self.generate_recap_fallback(
                 chapter_num, chapter_outline, story_start_date, previous_chapter_recap, settings
@@ -103,7 +106,7 @@ class RecapManager:
     
     async def extract_chapter_events(self, chapter_content: str, chapter_num: int, settings: GenerationSettings) -> str:
         """Extract events from chapter content."""
-        model_config = ModelConfig.from_string(self.config["models"]["logical_model"])
+        model_config = self._model_configs["logical_model"]
         
         # Define JSON schema for recap events
         RECAP_EVENTS_SCHEMA = {
@@ -148,21 +151,18 @@ class RecapManager:
             try:
                 # Validate the parsed JSON
                 events_data = json.loads(response.content.strip())
-                if settings.debug:
-                    print(f"[RECAP EVENTS] Successfully parsed {len(events_data)} events from JSON")
+                logger.debug("[RECAP EVENTS] Successfully parsed %s events from JSON", len(events_data))
                 return response.content.strip()
             except (json.JSONDecodeError, ValueError) as e:
-                if settings.debug:
-                    print(f"[RECAP EVENTS] JSON validation failed: {e}")
+                logger.debug("[RECAP EVENTS] JSON validation failed: %s", e)
                 return response.content.strip()
         else:
-            if settings.debug:
-                print(f"[RECAP EVENTS] JSON parsing failed: {response.json_errors}")
+            logger.debug("[RECAP EVENTS] JSON parsing failed: %s", response.json_errors)
             return response.content.strip()
     
     async def assign_event_timing(self, events: str, story_start_date: str, previous_chapter_recap: str, chapter_num: int, settings: GenerationSettings) -> str:
         """Assign timing to events."""
-        model_config = ModelConfig.from_string(self.config["models"]["logical_model"])
+        model_config = self._model_configs["logical_model"]
         
         # Define JSON schema for timed events
         TIMED_EVENTS_SCHEMA = {
@@ -211,21 +211,18 @@ class RecapManager:
             try:
                 # Validate the parsed JSON
                 events_data = json.loads(response.content.strip())
-                if settings.debug:
-                    print(f"[RECAP TIMING] Successfully parsed {len(events_data)} timed events from JSON")
+                logger.debug("[RECAP TIMING] Successfully parsed %s timed events from JSON", len(events_data))
                 return response.content.strip()
             except (json.JSONDecodeError, ValueError) as e:
-                if settings.debug:
-                    print(f"[RECAP TIMING] JSON validation failed: {e}")
+                logger.debug("[RECAP TIMING] JSON validation failed: %s", e)
                 return response.content.strip()
         else:
-            if settings.debug:
-                print(f"[RECAP TIMING] JSON parsing failed: {response.json_errors}")
+            logger.debug("[RECAP TIMING] JSON parsing failed: %s", response.json_errors)
             return response.content.strip()
     
     async def enrich_event_details(self, timed_events: str, chapter_num: int, settings: GenerationSettings) -> str:
         """Enrich event details with additional context."""
-        model_config = ModelConfig.from_string(self.config["models"]["logical_model"])
+        model_config = self._model_configs["logical_model"]
         
         # Define JSON schema for enriched events
         ENRICHED_EVENTS_SCHEMA = {
@@ -274,21 +271,18 @@ class RecapManager:
             try:
                 # Validate the parsed JSON
                 events_data = json.loads(response.content.strip())
-                if settings.debug:
-                    print(f"[RECAP ENRICHMENT] Successfully parsed {len(events_data)} enriched events from JSON")
+                logger.debug("[RECAP ENRICHMENT] Successfully parsed %s enriched events from JSON", len(events_data))
                 return response.content.strip()
             except (json.JSONDecodeError, ValueError) as e:
-                if settings.debug:
-                    print(f"[RECAP ENRICHMENT] JSON validation failed: {e}")
+                logger.debug("[RECAP ENRICHMENT] JSON validation failed: %s", e)
                 return response.content.strip()
         else:
-            if settings.debug:
-                print(f"[RECAP ENRICHMENT] JSON parsing failed: {response.json_errors}")
+            logger.debug("[RECAP ENRICHMENT] JSON parsing failed: %s", response.json_errors)
             return response.content.strip()
     
     async def format_recap_output(self, enriched_events: str, chapter_num: int, settings: GenerationSettings) -> str:
         """Format the final recap output."""
-        model_config = ModelConfig.from_string(self.config["models"]["logical_model"])
+        model_config = self._model_configs["logical_model"]
         
         # Define JSON schema for formatted recap
         FORMATTED_RECAP_SCHEMA = {
@@ -345,26 +339,22 @@ class RecapManager:
             try:
                 # Validate the parsed JSON
                 recap_data = json.loads(response.content.strip())
-                if settings.debug:
-                    print(f"[RECAP FORMAT] Successfully parsed formatted recap from JSON")
+                logger.debug("[RECAP FORMAT] Successfully parsed formatted recap from JSON")
                 return response.content.strip()
             except (json.JSONDecodeError, ValueError) as e:
-                if settings.debug:
-                    print(f"[RECAP FORMAT] JSON validation failed: {e}")
+                logger.debug("[RECAP FORMAT] JSON validation failed: %s", e)
                 return response.content.strip()
         else:
-            if settings.debug:
-                print(f"[RECAP FORMAT] JSON parsing failed: {response.json_errors}")
+            logger.debug("[RECAP FORMAT] JSON parsing failed: %s", response.json_errors)
             return response.content.strip()
     
     async def generate_recap_fallback(self, chapter_num: int, chapter_outline: str, story_start_date: str, previous_chapter_recap: str, settings: GenerationSettings) -> str:
         """Fallback recap generation method."""
-        model_config = ModelConfig.from_string(self.config["models"]["chapter_writer"])
+        model_config = self._model_configs["chapter_writer"]
         
         # Since we're always loading from savepoints now, this fallback function is no longer needed
         # The recap should already exist in the savepoint from when the chapter was created
-        if settings.debug:
-            print(f"[RECAP FALLBACK] Attempting to load existing recap from savepoint")
+        logger.debug("[RECAP FALLBACK] Attempting to load existing recap from savepoint")
         
         try:
             # Try to load the existing recap from savepoint
@@ -372,9 +362,8 @@ class RecapManager:
                 return await self.savepoint_manager.load_step(f"chapter_{chapter_num}/recap")
             else:
                 return ""
-        except:
-            if settings.debug:
-                print(f"[RECAP FALLBACK] No existing recap found in savepoint")
+        except Exception:
+            logger.debug("[RECAP FALLBACK] No existing recap found in savepoint")
             return ""
         
         # Ensure the response is valid JSON
@@ -383,14 +372,13 @@ class RecapManager:
             json.loads(response.content.strip())
             return response.content.strip()
         except json.JSONDecodeError:
-            if settings.debug:
-                print(f"[RECAP FALLBACK] Invalid JSON response, attempting to sanitize")
+            logger.debug("[RECAP FALLBACK] Invalid JSON response, attempting to sanitize")
             # Try to sanitize the response to extract JSON
             return await self.sanitize_json_response(response.content.strip())
     
     async def run_recap_sanitizer(self, recap: str, story_start_date: str, previous_chapter_recap: str, settings: GenerationSettings) -> str:
         """Run recap sanitizer to ensure consistency."""
-        model_config = ModelConfig.from_string(self.config["models"]["logical_model"])
+        model_config = self._model_configs["logical_model"]
         
         response = await execute_prompt_with_savepoint(
             handler=self.prompt_handler,
@@ -415,19 +403,17 @@ class RecapManager:
             json.loads(response.content.strip())
             return response.content.strip()
         except json.JSONDecodeError:
-            if settings.debug:
-                print(f"[RECAP SANITIZER] Invalid JSON response, attempting to sanitize")
+            logger.debug("[RECAP SANITIZER] Invalid JSON response, attempting to sanitize")
             # Try to sanitize the response to extract JSON
             return await self.sanitize_json_response(response.content.strip())
     
     async def run_multi_stage_recap_sanitizer(self, recap: str, story_start_date: str, previous_chapter_recap: str, settings: GenerationSettings) -> str:
         """Run enhanced recap sanitizer with progressive compaction."""
-        if settings.debug:
-            print("[RECAP SANITIZER] Running enhanced recap sanitizer")
+        logger.debug("[RECAP SANITIZER] Running enhanced recap sanitizer")
         
         try:
             # Use the enhanced sanitizer directly (no more multi-stage)
-            model_config = ModelConfig.from_string(self.config["models"]["logical_model"])
+            model_config = self._model_configs["logical_model"]
             
             response = await execute_prompt_with_savepoint(
                 handler=self.prompt_handler,
@@ -452,15 +438,13 @@ class RecapManager:
             try:
                 json.loads(sanitized_recap)
             except json.JSONDecodeError:
-                if settings.debug:
-                    print(f"[RECAP SANITIZER] Invalid JSON response, attempting to sanitize")
+                logger.debug("[RECAP SANITIZER] Invalid JSON response, attempting to sanitize")
                 sanitized_recap = await self.sanitize_json_response(sanitized_recap)
             
             # Extract current date from the recap to check for consistency
             current_date = self.extract_current_date_from_recap(sanitized_recap, story_start_date)
             
-            if settings.debug:
-                print(f"[RECAP SANITIZER] Extracted current date: {current_date}")
+            logger.debug("[RECAP SANITIZER] Extracted current date: %s", current_date)
             
             # Programmatic classification of event recency (if enabled)
             if hasattr(settings, 'enable_programmatic_event_classification') and settings.enable_programmatic_event_classification:
@@ -475,15 +459,13 @@ class RecapManager:
             else:
                 final_recap = sanitized_recap
             
-            if settings.debug:
-                print("[RECAP SANITIZER] Enhanced sanitization completed")
+            logger.debug("[RECAP SANITIZER] Enhanced sanitization completed")
             
             return final_recap
             
         except Exception as e:
-            if settings.debug:
-                print(f"[RECAP SANITIZER] Enhanced sanitization failed: {e}")
-                print("[RECAP SANITIZER] Falling back to basic sanitization")
+            logger.debug("[RECAP SANITIZER] Enhanced sanitization failed: %s", e)
+            logger.debug("[RECAP SANITIZER] Falling back to basic sanitization")
             
             # Fallback to basic sanitization
             return await self.run_recap_sanitizer(recap, story_start_date, previous_chapter_recap, settings)
@@ -577,7 +559,7 @@ class RecapManager:
     
     async def convert_recap_to_json(self, recap: str, settings: GenerationSettings) -> str:
         """Convert recap to JSON format for programmatic analysis."""
-        model_config = ModelConfig.from_string(self.config["models"]["logical_model"])
+        model_config = self._model_configs["logical_model"]
         
         response = await execute_prompt_with_savepoint(
             handler=self.prompt_handler,
@@ -640,14 +622,13 @@ class RecapManager:
             return json.dumps(events_data, indent=2)
             
         except Exception as e:
-            if settings.debug:
-                print(f"[EVENT CLASSIFICATION] Error in programmatic classification: {e}")
+            logger.debug("[EVENT CLASSIFICATION] Error in programmatic classification: %s", e)
             # Fallback to model-based classification
             return await self.classify_event_recency_model_based(events_json, current_date, settings)
     
     async def classify_event_recency_model_based(self, events_json: str, current_date: str, settings: GenerationSettings) -> str:
         """Classify events by recency using model-based approach."""
-        model_config = ModelConfig.from_string(self.config["models"]["logical_model"])
+        model_config = self._model_configs["logical_model"]
         
         # Define JSON schema for classified events
         CLASSIFIED_EVENTS_SCHEMA = {
@@ -700,16 +681,13 @@ class RecapManager:
             try:
                 # Validate the parsed JSON
                 events_data = json.loads(response.content.strip())
-                if settings.debug:
-                    print(f"[EVENT CLASSIFICATION] Successfully parsed classified events from JSON")
+                logger.debug("[EVENT CLASSIFICATION] Successfully parsed classified events from JSON")
                 return response.content.strip()
             except (json.JSONDecodeError, ValueError) as e:
-                if settings.debug:
-                    print(f"[EVENT CLASSIFICATION] JSON validation failed: {e}")
+                logger.debug("[EVENT CLASSIFICATION] JSON validation failed: %s", e)
                 return response.content.strip()
         else:
-            if settings.debug:
-                print(f"[EVENT CLASSIFICATION] JSON parsing failed: {response.json_errors}")
+            logger.debug("[EVENT CLASSIFICATION] JSON parsing failed: %s", response.json_errors)
             return response.content.strip()
     
     async def convert_json_to_recap(self, classified_json: str, settings: GenerationSettings) -> str:
@@ -721,8 +699,7 @@ class RecapManager:
             json.loads(classified_json)
             return classified_json
         except json.JSONDecodeError:
-            if settings.debug:
-                print(f"[JSON CONVERSION] Invalid JSON, attempting to sanitize")
+            logger.debug("[JSON CONVERSION] Invalid JSON, attempting to sanitize")
             return await self.sanitize_json_response(classified_json)
     
     async def compact_events_progressively(self, recap: str, chapter_num: int, settings: GenerationSettings) -> str:
@@ -739,7 +716,7 @@ class RecapManager:
         else:
             compaction_level = "heavy"
         
-        model_config = ModelConfig.from_string(self.config["models"]["logical_model"])
+        model_config = self._model_configs["logical_model"]
         
         # Define JSON schema for compacted recap
         COMPACTED_RECAP_SCHEMA = {
@@ -797,16 +774,13 @@ class RecapManager:
             try:
                 # Validate the parsed JSON
                 recap_data = json.loads(response.content.strip())
-                if settings.debug:
-                    print(f"[RECAP COMPACTION] Successfully parsed compacted recap from JSON")
+                logger.debug("[RECAP COMPACTION] Successfully parsed compacted recap from JSON")
                 return response.content.strip()
             except (json.JSONDecodeError, ValueError) as e:
-                if settings.debug:
-                    print(f"[RECAP COMPACTION] JSON validation failed: {e}")
+                logger.debug("[RECAP COMPACTION] JSON validation failed: %s", e)
                 return response.content.strip()
         else:
-            if settings.debug:
-                print(f"[RECAP COMPACTION] JSON parsing failed: {response.json_errors}")
+            logger.debug("[RECAP COMPACTION] JSON parsing failed: %s", response.json_errors)
             return response.content.strip()
     
     async def filter_aged_events(self, recap: str, story_start_date: str, settings: GenerationSettings) -> str:
@@ -872,8 +846,7 @@ class RecapManager:
             return json.dumps(recap_data, indent=2)
             
         except Exception as e:
-            if settings.debug:
-                print(f"[EVENT FILTERING] Error in programmatic filtering: {e}")
+            logger.debug("[EVENT FILTERING] Error in programmatic filtering: %s", e)
             # Fallback to original recap if filtering fails
             return recap
     
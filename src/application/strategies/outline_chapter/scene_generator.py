@@ -1,6 +1,7 @@
 """Scene generation functionality for the outline-chapter strategy."""
 
 import json
+import logging
 from typing import List, Optional, Dict, Any
 from domain.entities.story import Scene
 from domain.value_objects.generation_settings import GenerationSettings
@@ -15,6 +16,8 @@ from application.services.rag_service import RAGService
 from .character_manager import CharacterManager
 from .setting_manager import SettingManager
 
+logger = logging.getLogger(__name__)
+
 
 class SceneGenerator:
     """Handles scene generation functionality."""
@@ -60,6 +63,22 @@ class SceneGenerator:
         self.character_manager.savepoint_manager = savepoint_manager
         self.setting_manager.savepoint_manager = savepoint_manager
     
+    async def load_saved_scene(self, chapter_num: int, scene_num: int, outline: str = "") -> Scene:
+        """Load a saved scene with one read; the title lives in the scene's frontmatter."""
+        saved = await self.savepoint_manager.load_step_with_metadata(f"chapter_{chapter_num}/scene_{scene_num}") or {}
+        frontmatter = saved.get("_frontmatter")
+        scene_title = frontmatter.get("title") if isinstance(frontmatter, dict) else None
+        if not scene_title:
+            # Scenes saved before the title moved into the frontmatter kept it in its own step
+            scene_title = await self.savepoint_manager.load_step(f"chapter_{chapter_num}/scene_{scene_num}_title")
+        
+        return Scene(
+            number=scene_num,
+            title=scene_title,
+            content=saved.get("_body"),
+            outline=outline
+        )
+    
     async def generate_scenes(
         self,
         chapter_num: int,
@@ -92,20 +111,14 @@ class SceneGenerator:
             scenes = []
             for scene_num, scene_def in enumerate(scene_definitions, 1):
                 try:
-                    print(f"    Generating Scene {scene_num} for Chapter {chapter_num}...")
+                    logger.info("    Generating Scene %s for Chapter %s...", scene_num, chapter_num)
 
                     # Check if scene already exists
                     scene_savepoint_id = f"chapter_{chapter_num}/scene_{scene_num}"
                     if await self.savepoint_manager.has_step(scene_savepoint_id):
-                        print(f"    Scene {scene_num} already exists, loading...")
-                        scene_content = await self.savepoint_manager.load_step(scene_savepoint_id)
-                        scene_title = await self.savepoint_manager.load_step(f"chapter_{chapter_num}/scene_{scene_num}_title")
-                        
-                        scene = Scene(
-                            number=scene_num,
-                            title=scene_title,
-                            content=scene_content,
-                            outline=scene_def.get("description", "")
+                        logger.info("    Scene %s already exists, loading...", scene_num)
+                        scene = await self.load_saved_scene(
+                            chapter_num, scene_num, outline=scene_def.get("description", "")
                         )
                         scenes.append(scene)
                         continue
@@ -178,9 +191,11 @@ class SceneGenerator:
                         settings=settings
                     )
                     
-                    # Save scene content and title
-                    await self.savepoint_manager.save_step(scene_savepoint_id, scene_content)
-                    await self.savepoint_manager.save_step(f"chapter_{chapter_num}/scene_{scene_num}_title", scene_title)
+                    # Save scene content with its title in the frontmatter
+                    await self.savepoint_manager.save_step(
+                        scene_savepoint_id,
+                        {"_frontmatter": {"title": scene_title}, "_body": scene_content}
+                    )
                     
                     # Create Scene object
                     scene = Scene(
@@ -191,10 +206,10 @@ class SceneGenerator:
                     )
                     scenes.append(scene)
                     
-                    print(f"    Scene {scene_num} generated and saved: '{scene_title}'")
+                    logger.info("    Scene %s generated and saved: '%s'", scene_num, scene_title)
                     
                 except Exception as e:
-                    print(f"    Error generating Scene {scene_num}: {e}")
+                    logger.error("    Error generating Scene %s: %s", scene_num, e)
                     continue
             
             return scenes
@@ -266,16 +281,13 @@ class SceneGenerator:
                     if not isinstance(scene, dict) or "title" not in scene or "description" not in scene:
                         raise ValueError("Each scene must be an object with title and description")
                 
-                if settings.debug:
-                    print(f"[SCENE DEFINITIONS] Successfully parsed {len(scene_definitions)} scenes from JSON")
+                logger.debug("[SCENE DEFINITIONS] Successfully parsed %s scenes from JSON", len(scene_definitions))
                 
             except (json.JSONDecodeError, ValueError) as e:
-                if settings.debug:
-                    print(f"[SCENE DEFINITIONS] JSON parsing failed: {e}, falling back to default structure")
+                logger.debug("[SCENE DEFINITIONS] JSON parsing failed: %s, falling back to default structure", e)
                 scene_definitions = []
         else:
-            if settings.debug:
-                print(f"[SCENE DEFINITIONS] JSON parsing failed: {response.json_errors}, falling back to default structure")
+            logger.debug("[SCENE DEFINITIONS] JSON parsing failed: %s, falling back to default structure", response.json_errors)
             scene_definitions = []
         
         # If no scenes found, create a default structure
@@ -380,14 +392,12 @@ class SceneGenerator:
             
             summary = response.content.strip()
             
-            if settings.debug:
-                print(f"[SCENE OUTLINE SUMMARY] Generated {tense} tense summary: {len(summary)} characters")
+            logger.debug("[SCENE OUTLINE SUMMARY] Generated %s tense summary: %s characters", tense, len(summary))
             
             return summary
             
         except Exception as e:
-            if settings.debug:
-                print(f"[SCENE OUTLINE SUMMARY] Error generating summary: {e}")
+            logger.debug("[SCENE OUTLINE SUMMARY] Error generating summary: %s", e)
             return f"Error generating scene summary: {e}"
     
     async def _get_scene_outline_summary_programmatic(
@@ -476,18 +486,15 @@ class SceneGenerator:
             # Join all parts with line breaks
             summary = "\n\n".join(summary_parts)
             
-            if settings.debug:
-                print(f"[SCENE OUTLINE SUMMARY PROGRAMMATIC] Generated summary: {len(summary)} characters")
+            logger.debug("[SCENE OUTLINE SUMMARY PROGRAMMATIC] Generated summary: %s characters", len(summary))
             
             return summary
             
         except json.JSONDecodeError as e:
-            if settings.debug:
-                print(f"[SCENE OUTLINE SUMMARY PROGRAMMATIC] Error parsing JSON: {e}")
+            logger.debug("[SCENE OUTLINE SUMMARY PROGRAMMATIC] Error parsing JSON: %s", e)
             return f"Error parsing scene definition: {e}"
         except Exception as e:
-            if settings.debug:
-                print(f"[SCENE OUTLINE SUMMARY PROGRAMMATIC] Error generating summary: {e}")
+            logger.debug("[SCENE OUTLINE SUMMARY PROGRAMMATIC] Error generating summary: %s", e)
             return f"Error generating scene summary: {e}"
     
     async def _get_chapter_outline_summary(
@@ -530,14 +537,12 @@ class SceneGenerator:
             
             summary = response.content.strip()
             
-            if settings.debug:
-                print(f"[CHAPTER OUTLINE SUMMARY] Generated {tense} tense summary: {len(summary)} characters")
+            logger.debug("[CHAPTER OUTLINE SUMMARY] Generated %s tense summary: %s characters", tense, len(summary))
             
             return summary
             
         except Exception as e:
-            if settings.debug:
-                print(f"[CHAPTER OUTLINE SUMMARY] Error generating summary: {e}")
+            logger.debug("[CHAPTER OUTLINE SUMMARY] Error generating summary: %s", e)
             return f"Error generating chapter summary: {e}"
     
     async def _generate_scene_content_multistep(
@@ -592,12 +597,10 @@ class SceneGenerator:
                 # Ensure all character names are strings
                 character_names = [str(name).strip() for name in character_names if name and str(name).strip()]
             else:
-                if settings.debug:
-                    print(f"[MULTISTEP SCENE] No 'characters' property found in scene definition or invalid format")
+                logger.debug("[MULTISTEP SCENE] No 'characters' property found in scene definition or invalid format")
         except (json.JSONDecodeError, AttributeError) as e:
-            if settings.debug:
-                print(f"[MULTISTEP SCENE] Error parsing scene definition JSON: {e}")
-                print(f"[MULTISTEP SCENE] Scene definition: {scene_definition[:200]}...")
+            logger.debug("[MULTISTEP SCENE] Error parsing scene definition JSON: %s", e)
+            logger.debug("[MULTISTEP SCENE] Scene definition: %s...", scene_definition[:200])
             character_names = []
 
         # Get character summaries using the character manager utility
@@ -610,14 +613,11 @@ class SceneGenerator:
                     prompt_id="multistep/scene/understand_characters",
                     variables={"characters": character_summaries}
                 )
-                if settings.debug:
-                    print(f"[MULTISTEP SCENE] Retrieved summaries for {len(character_names)} characters: {character_names}")
+                logger.debug("[MULTISTEP SCENE] Retrieved summaries for %s characters: %s", len(character_names), character_names)
             except Exception as e:
-                if settings.debug:
-                    print(f"[MULTISTEP SCENE] Error getting character summaries: {e}")
+                logger.debug("[MULTISTEP SCENE] Error getting character summaries: %s", e)
         else:
-            if settings.debug:
-                print(f"[MULTISTEP SCENE] No character names found in scene definition")
+            logger.debug("[MULTISTEP SCENE] No character names found in scene definition")
 
         # Extract setting names from scene definition and get their summaries
         setting_names = []
@@ -634,11 +634,9 @@ class SceneGenerator:
                 # Ensure all setting names are strings
                 setting_names = [str(name).strip() for name in setting_names if name and str(name).strip()]
             else:
-                if settings.debug:
-                    print(f"[MULTISTEP SCENE] No 'setting' property found in scene definition or invalid format")
+                logger.debug("[MULTISTEP SCENE] No 'setting' property found in scene definition or invalid format")
         except (json.JSONDecodeError, AttributeError) as e:
-            if settings.debug:
-                print(f"[MULTISTEP SCENE] Error parsing scene definition for settings: {e}")
+            logger.debug("[MULTISTEP SCENE] Error parsing scene definition for settings: %s", e)
             setting_names = []
 
         # Get setting summaries using the setting manager utility
@@ -651,14 +649,11 @@ class SceneGenerator:
                     prompt_id="multistep/scene/understand_setting",
                     variables={"setting": setting_summary}
                 )
-                if settings.debug:
-                    print(f"[MULTISTEP SCENE] Retrieved summaries for {len(setting_names)} settings: {setting_names}")
+                logger.debug("[MULTISTEP SCENE] Retrieved summaries for %s settings: %s", len(setting_names), setting_names)
             except Exception as e:
-                if settings.debug:
-                    print(f"[MULTISTEP SCENE] Error getting setting summaries: {e}")
+                logger.debug("[MULTISTEP SCENE] Error getting setting summaries: %s", e)
         else:
-            if settings.debug:
-                print(f"[MULTISTEP SCENE] No setting names found in scene definition")
+            logger.debug("[MULTISTEP SCENE] No setting names found in scene definition")
 
             # Progressive multi-step conversation building
         conversation_history = []
@@ -689,9 +684,8 @@ class SceneGenerator:
             # Get the model provider for multi-step conversation
             model_config = ModelConfig.from_string(self.config["models"]["scene_writer"])
             
-            if settings.debug:
-                print(f"[MULTISTEP SCENE] Starting progressive multi-step conversation")
-                print(f"[MULTISTEP SCENE] System message loaded: {len(system_message)} characters")
+            logger.debug("[MULTISTEP SCENE] Starting progressive multi-step conversation")
+            logger.debug("[MULTISTEP SCENE] System message loaded: %s characters", len(system_message))
             
             # Step 1: First user message (understand elements)
             try:
@@ -703,9 +697,8 @@ class SceneGenerator:
                 
                 conversation_history.append({"role": "user", "content": elements_prompt})
 
-                if settings.debug:
-                    print(f"[MULTISTEP SCENE] Step 1: First message added (understand elements)")
-                    print(f"[MULTISTEP SCENE] Message length: {len(elements_prompt)} characters")
+                logger.debug("[MULTISTEP SCENE] Step 1: First message added (understand elements)")
+                logger.debug("[MULTISTEP SCENE] Message length: %s characters", len(elements_prompt))
                 
                 response = await execute_messages_with_savepoint(
                     handler=self.prompt_handler,
@@ -721,12 +714,10 @@ class SceneGenerator:
                 # Extract content from PromptResponse
                 conversation_history.append({"role": "assistant", "content": response.content})
                 
-                if settings.debug:
-                    print(f"[MULTISTEP SCENE] Step 1 completed")
+                logger.debug("[MULTISTEP SCENE] Step 1 completed")
 
             except Exception as e:
-                if settings.debug:
-                    print(f"[MULTISTEP SCENE] Error in step 1: {e}")
+                logger.debug("[MULTISTEP SCENE] Error in step 1: %s", e)
             
             # Step 2: Second user message (understand context) # Only continue if first step succeeded
             try:
@@ -738,9 +729,8 @@ class SceneGenerator:
                 
                 conversation_history.append({"role": "user", "content": context_prompt})
                 
-                if settings.debug:
-                    print(f"[MULTISTEP SCENE] Step 2: Second message added (understand context)")
-                    print(f"[MULTISTEP SCENE] Message length: {len(context_prompt)} characters")
+                logger.debug("[MULTISTEP SCENE] Step 2: Second message added (understand context)")
+                logger.debug("[MULTISTEP SCENE] Message length: %s characters", len(context_prompt))
 
                 
                 response = await execute_messages_with_savepoint(
@@ -756,12 +746,10 @@ class SceneGenerator:
                 
                 conversation_history.append({"role": "assistant", "content": response.content})
 
-                if settings.debug:
-                    print(f"[MULTISTEP SCENE] Step 2 completed")
+                logger.debug("[MULTISTEP SCENE] Step 2 completed")
             
             except Exception as e:
-                if settings.debug:
-                    print(f"[MULTISTEP SCENE] Error in step 2: {e}")
+                logger.debug("[MULTISTEP SCENE] Error in step 2: %s", e)
             
             # Step 3: Third user message (understand characters) - only if characters exist
             if character_names:  # Only continue if previous step succeeded and characters exist
@@ -769,9 +757,8 @@ class SceneGenerator:
                     # Add third user message to array
                     conversation_history.append({"role": "user", "content": characters_prompt})
                     
-                    if settings.debug:
-                        print(f"[MULTISTEP SCENE] Step 3: Third message added (understand characters)")
-                        print(f"[MULTISTEP SCENE] Message length: {len(characters_prompt)} characters")
+                    logger.debug("[MULTISTEP SCENE] Step 3: Third message added (understand characters)")
+                    logger.debug("[MULTISTEP SCENE] Message length: %s characters", len(characters_prompt))
                     
                     response = await execute_messages_with_savepoint(
                         handler=self.prompt_handler,
@@ -786,14 +773,12 @@ class SceneGenerator:
                     
                     conversation_history.append({"role": "assistant", "content": response.content})
                     
-                    if settings.debug:
-                        print(f"[MULTISTEP SCENE] Step 3 completed")
+                    logger.debug("[MULTISTEP SCENE] Step 3 completed")
                 
                 except Exception as e:
-                    if settings.debug:
-                        print(f"[MULTISTEP SCENE] Error in step 3: {e}")
-            elif not character_names and settings.debug:
-                print(f"[MULTISTEP SCENE] Step 3 skipped - no characters found in scene definition")
+                    logger.debug("[MULTISTEP SCENE] Error in step 3: %s", e)
+            elif not character_names:
+                logger.debug("[MULTISTEP SCENE] Step 3 skipped - no characters found in scene definition")
             
             # Step 4: Fourth user message (understand setting) - only if settings exist
             if setting_names:  # Only continue if previous step succeeded and settings exist
@@ -801,9 +786,8 @@ class SceneGenerator:
                     # Add fourth user message to array
                     conversation_history.append({"role": "user", "content": setting_prompt})
                     
-                    if settings.debug:
-                        print(f"[MULTISTEP SCENE] Step 4: Fourth message added (understand setting)")
-                        print(f"[MULTISTEP SCENE] Message length: {len(setting_prompt)} characters")
+                    logger.debug("[MULTISTEP SCENE] Step 4: Fourth message added (understand setting)")
+                    logger.debug("[MULTISTEP SCENE] Message length: %s characters", len(setting_prompt))
                     
                     response = await execute_messages_with_savepoint(
                         handler=self.prompt_handler,
@@ -818,14 +802,12 @@ class SceneGenerator:
                     
                     conversation_history.append({"role": "assistant", "content": response.content})
                     
-                    if settings.debug:
-                        print(f"[MULTISTEP SCENE] Step 4 completed")
+                    logger.debug("[MULTISTEP SCENE] Step 4 completed")
 
                 except Exception as e:
-                    if settings.debug:
-                        print(f"[MULTISTEP SCENE] Error in step 4: {e}")
-            elif not setting_names and settings.debug:
-                print(f"[MULTISTEP SCENE] Step 4 skipped - no settings found in scene definition")
+                    logger.debug("[MULTISTEP SCENE] Error in step 4: %s", e)
+            elif not setting_names:
+                logger.debug("[MULTISTEP SCENE] Step 4 skipped - no settings found in scene definition")
 
 
             if scene_num == 1 or scene_num != chapter_count:
@@ -856,12 +838,10 @@ class SceneGenerator:
                     
                     conversation_history.append({"role": "assistant", "content": response.content})
                     
-                    if settings.debug:
-                        print(f"[MULTISTEP SCENE] Step 5 completed")
+                    logger.debug("[MULTISTEP SCENE] Step 5 completed")
                 
                 except Exception as e:
-                    if settings.debug:
-                        print(f"[MULTISTEP SCENE] Error in step 5: {e}")
+                    logger.debug("[MULTISTEP SCENE] Error in step 5: %s", e)
 
             if scene_num == chapter_count or scene_num != 1:
                 try:
@@ -885,12 +865,10 @@ class SceneGenerator:
                     
                     conversation_history.append({"role": "assistant", "content": response.content})
                     
-                    if settings.debug:
-                        print(f"[MULTISTEP SCENE] Step 6 completed")
+                    logger.debug("[MULTISTEP SCENE] Step 6 completed")
 
                 except Exception as e:
-                    if settings.debug:
-                        print(f"[MULTISTEP SCENE] Error in step 6: {e}")
+                    logger.debug("[MULTISTEP SCENE] Error in step 6: %s", e)
 
             if scene_num == chapter_count:
                 try:
@@ -914,12 +892,10 @@ class SceneGenerator:
                     
                     conversation_history.append({"role": "assistant", "content": response.content})
                     
-                    if settings.debug:
-                        print(f"[MULTISTEP SCENE] Step 7 completed")
+                    logger.debug("[MULTISTEP SCENE] Step 7 completed")
                     
                 except Exception as e:
-                    if settings.debug:
-                        print(f"[MULTISTEP SCENE] Error in step 7: {e}")
+                    logger.debug("[MULTISTEP SCENE] Error in step 7: %s", e)
 
             scene_outline = await self._get_scene_outline_summary_programmatic(
                 scene_definition=scene_definition,
@@ -976,12 +952,10 @@ class SceneGenerator:
             # 2. Call generate_multistep_conversation with all user messages
             # 3. Repeat for next step
             
-            if settings.debug:
-                print(f"[MULTISTEP SCENE] Progressive conversation completed")
+            logger.debug("[MULTISTEP SCENE] Progressive conversation completed")
             
         except Exception as e:
-            if settings.debug:
-                print(f"[MULTISTEP SCENE] Error in progressive conversation: {e}")
+            logger.debug("[MULTISTEP SCENE] Error in progressive conversation: %s", e)
             # Fall back to standard generation
             pass
 
@@ -1,6 +1,9 @@
 """Setting management functionality for the outline-chapter strategy."""
 
+import asyncio
 import json
+import logging
+from types import MappingProxyType
 from typing import List, Optional, Dict, Any
 from domain.value_objects.generation_settings import GenerationSettings
 from domain.value_objects.model_config import ModelConfig
@@ -11,6 +14,19 @@ from infrastructure.prompts.prompt_wrapper import execute_prompt_with_savepoint,
 from infrastructure.savepoints import SavepointManager
 from application.services.rag_service import RAGService
 from application.services.rag_integration_service import RAGIntegrationService
+from application.services.semantic_cache import SemanticCache
+
+logger = logging.getLogger(__name__)
+
+# JSON schema for setting name extraction, shared by every call
+_SETTING_NAMES_SCHEMA = MappingProxyType({
+    "type": "array",
+    "items": MappingProxyType({"type": "string"})
+})
+
+# Formatting stripped from, and line prefixes that rule out, a name in the line fallback
+_NAME_CLEAN_TABLE = str.maketrans('', '', '*-•')
+_NAME_REJECT_PREFIX = ('#', '-', '```')
 
 
 class SettingManager:
@@ -34,6 +50,19 @@ class SettingManager:
         
         # RAG integration service will be set by the strategy after story initialization
         self.rag_integration = None
+        
+        self._model_configs = ModelConfig.from_mapping(self.config.get("models", {}))
+        
+        # Reuses per-chapter extraction results for identical text, and for near-identical text
+        # only when the extraction model is explicitly deterministic (temperature=0)
+        logical_model = self._model_configs.get("logical_model")
+        deterministic = logical_model is not None and logical_model.parameters.get("temperature") == 0
+        self._extraction_cache = SemanticCache(
+            embedding_provider=rag_service.embedding_provider if rag_service and deterministic else None
+        )
+        
+        # Shared by every sheet update so overlapping chapters' updates stay within one budget
+        self._update_semaphore = asyncio.Semaphore(self.config.get("sheet_update_concurrency", 4))
     
     async def generate_setting_sheets(self, story_elements: str, additional_context: str, settings: GenerationSettings) -> None:
         """Generate setting sheets for all settings identified in story elements."""
@@ -41,32 +70,23 @@ class SettingManager:
             # Extract setting names from story elements
             setting_names = await self.extract_setting_names(story_elements, settings)
             
-            if settings.debug:
-                print(f"[SETTING SHEETS] Found {len(setting_names)} settings: {setting_names}")
+            logger.debug("[SETTING SHEETS] Found %s settings: %s", len(setting_names), setting_names)
             
             # Generate sheet for each setting
             for setting_name in setting_names:
-                if settings.debug:
-                    print(f"[SETTING SHEETS] Generating sheet for: {setting_name}")
+                logger.debug("[SETTING SHEETS] Generating sheet for: %s", setting_name)
                 
                 await self.generate_single_setting_sheet(setting_name, story_elements, additional_context, settings)
         
         except Exception as e:
-            if settings.debug:
-                print(f"[SETTING SHEETS] Error generating setting sheets: {e}")
+            logger.debug("[SETTING SHEETS] Error generating setting sheets: %s", e)
             # Don't fail the entire process if setting sheet generation fails
             pass
     
     async def extract_setting_names(self, story_elements: str, settings: GenerationSettings) -> List[str]:
         """Extract setting names from story elements."""
-        model_config = ModelConfig.from_string(self.config["models"]["logical_model"])
+        model_config = self._model_configs["logical_model"]
         
-        # Define JSON schema for setting names
-        SETTING_NAMES_SCHEMA = {
-            "type": "array",
-            "items": {"type": "string"}
-        }
-
         response = await execute_prompt_with_savepoint(
             handler=self.prompt_handler,
             prompt_id="settings/extract_names",
@@ -79,7 +99,7 @@ class SettingManager:
             log_prompt_inputs=settings.log_prompt_inputs,
             system_message=self.system_message,
             expect_json=True,
-            json_schema=SETTING_NAMES_SCHEMA
+            json_schema=_SETTING_NAMES_SCHEMA
         )
         
         # Parse the response using the new JSON integration
@@ -88,53 +108,54 @@ class SettingManager:
         # First try to parse as JSON (the expected format)
         setting_names = []
         if response.json_parsed:
-            # llm-output-parser has already successfully parsed the JSON
-            # The content should now be a clean JSON string that we can parse
-            try:
-                parsed_names = json.loads(names_text)
-                if isinstance(parsed_names, list):
-                    setting_names = [str(name).strip() for name in parsed_names if name and str(name).strip()]
-                    if settings.debug:
-                        print(f"[SETTING NAMES] Successfully parsed JSON: {setting_names}")
-                else:
-                    if settings.debug:
-                        print(f"[SETTING NAMES] Expected list but got: {type(parsed_names)}")
-            except (json.JSONDecodeError, AttributeError) as e:
-                if settings.debug:
-                    print(f"[SETTING NAMES] JSON parsing failed: {e}, falling back to line parsing")
-                setting_names = []
+            # llm-output-parser has already successfully parsed the JSON; use its value
+            # rather than decoding the content again
+            parsed_names = response.json_data
+            if isinstance(parsed_names, list):
+                setting_names = [str(name).strip() for name in parsed_names if name and str(name).strip()]
+                logger.debug("[SETTING NAMES] Successfully parsed JSON: %s", setting_names)
+            else:
+                logger.debug("[SETTING NAMES] Expected list but got: %s", type(parsed_names))
         else:
-            if settings.debug:
-                print(f"[SETTING NAMES] JSON parsing failed: {response.json_errors}, falling back to line parsing")
-                print(f"[SETTING NAMES] Raw response preview: {names_text[:200]}...")
+            logger.debug("[SETTING NAMES] JSON parsing failed: %s, falling back to line parsing", response.json_errors)
+            logger.debug("[SETTING NAMES] Raw response preview: %.200s...", names_text)
             setting_names = []
         
         # Fallback to line-by-line parsing if JSON parsing failed
         if not setting_names:
             # Since llm-output-parser handles markdown automatically, 
             # we can use simpler line parsing as fallback
-            for line in names_text.split('\n'):
-                line = line.strip()
-                if line and not line.startswith('#') and not line.startswith('-') and not line.startswith('```'):
-                    # Remove any bullet points, numbers, or other formatting
-                    clean_name = line.replace('*', '').replace('-', '').replace('•', '')
-                    clean_name = clean_name.strip()
-                    if clean_name and len(clean_name) < 100:  # Reasonable setting name length
-                        setting_names.append(clean_name)
-        
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_names = []
-        for name in setting_names:
-            if name.lower() not in seen:
-                seen.add(name.lower())
-                unique_names.append(name)
+            setting_names = self._parse_names_fallback(names_text)
         
-        return unique_names[:10]  # Limit to 10 settings max
+        return self._dedupe_names(setting_names)
+    
+    @staticmethod
+    def _dedupe_names(setting_names: List[str]) -> List[str]:
+        """Remove duplicate names case-insensitively, keeping the first spelling, up to 10 names."""
+        unique_names: Dict[str, str] = {}
+        for name in setting_names:
+            unique_names.setdefault(name.lower(), name)
+            if len(unique_names) == 10:  # Limit to 10 settings max
+                break
+        return list(unique_names.values())
+    
+    @staticmethod
+    def _parse_names_fallback(names_text: str) -> List[str]:
+        """Parse one setting name per line from a response that was not valid JSON."""
+        setting_names = []
+        for line in names_text.split('\n'):
+            line = line.strip()
+            if not line or line.startswith(_NAME_REJECT_PREFIX):
+                continue
+            # Remove any bullet points or other formatting
+            clean_name = line.translate(_NAME_CLEAN_TABLE).strip()
+            if clean_name and len(clean_name) < 100:  # Reasonable setting name length
+                setting_names.append(clean_name)
+        return setting_names
     
     async def generate_single_setting_sheet(self, setting_name: str, story_elements: str, additional_context: str, settings: GenerationSettings) -> None:
         """Generate a setting sheet for a single setting using multistep conversation for optimal RAG indexing."""
-        model_config = ModelConfig.from_string(self.config["models"]["initial_outline_writer"])
+        model_config = self._model_configs["initial_outline_writer"]
         
         try:
             # Start the conversation with the setting creation prompt
@@ -172,8 +193,7 @@ class SettingManager:
                 "content": response.content
             })
             
-            if settings.debug:
-                print(f"[SETTING SHEET] Generated initial sheet for {setting_name}")
+            logger.debug("[SETTING SHEET] Generated initial sheet for %s", setting_name)
             
             # Generate chunked setting information using the conversation
             await self._generate_setting_chunks(setting_name, conversation, settings)
@@ -181,8 +201,7 @@ class SettingManager:
             # Setting chunks are now indexed individually after generation
                 
         except Exception as e:
-            if settings.debug:
-                print(f"[SETTING SHEET] Error generating sheet for {setting_name}: {e}")
+            logger.debug("[SETTING SHEET] Error generating sheet for %s: %s", setting_name, e)
     
 
     async def _generate_setting_chunks(
@@ -193,8 +212,7 @@ class SettingManager:
     ) -> None:
         """Generate focused setting chunks for optimal RAG indexing using conversation continuation."""
         try:
-            if settings.debug:
-                print(f"[SETTING CHUNKS] Generating chunks for {setting_name}")
+            logger.debug("[SETTING CHUNKS] Generating chunks for %s", setting_name)
             
             # Generate each type of setting chunk, passing a copy of the conversation
             await self._generate_physical_description_chunk(setting_name, conversation.copy(), settings)
@@ -204,12 +222,10 @@ class SettingManager:
             await self._generate_rules_constraints_chunk(setting_name, conversation.copy(), settings)
             await self._generate_connections_relationships_chunk(setting_name, conversation.copy(), settings)
             
-            if settings.debug:
-                print(f"[SETTING CHUNKS] Generated all chunks for {setting_name}")
+            logger.debug("[SETTING CHUNKS] Generated all chunks for %s", setting_name)
                 
         except Exception as e:
-            if settings.debug:
-                print(f"[SETTING CHUNKS] Error generating chunks for {setting_name}: {e}")
+            logger.debug("[SETTING CHUNKS] Error generating chunks for %s: %s", setting_name, e)
     
     async def _generate_physical_description_chunk(
         self,
@@ -218,7 +234,7 @@ class SettingManager:
         settings: GenerationSettings
     ) -> None:
         """Generate physical description chunk for a setting."""
-        model_config = ModelConfig.from_string(self.config["models"]["initial_outline_writer"])
+        model_config = self._model_configs["initial_outline_writer"]
         
         try:
             # Continue the conversation with the physical description chunk prompt
@@ -242,15 +258,13 @@ class SettingManager:
                 stream=settings.stream
             )
             
-            if settings.debug:
-                print(f"[SETTING CHUNK] Generated physical description chunk for {setting_name}")
+            logger.debug("[SETTING CHUNK] Generated physical description chunk for %s", setting_name)
             
             # Index this chunk immediately after generation
             await self._index_setting_chunk(setting_name, "physical_description_chunk", settings)
                 
         except Exception as e:
-            if settings.debug:
-                print(f"[SETTING CHUNK] Error generating physical description chunk for {setting_name}: {e}")
+            logger.debug("[SETTING CHUNK] Error generating physical description chunk for %s: %s", setting_name, e)
     
     async def _index_setting_chunk(self, setting_name: str, chunk_type: str, settings: GenerationSettings) -> None:
         """Index a setting chunk in RAG."""
@@ -274,11 +288,9 @@ class SettingManager:
                     }
                 )
                 
-                if settings.debug:
-                    print(f"[RAG SETTING INDEXING] Indexed {len(chunk_ids)} chunks for setting '{setting_name}' - {chunk_type}")
+                logger.debug("[RAG SETTING INDEXING] Indexed %s chunks for setting '%s' - %s", len(chunk_ids), setting_name, chunk_type)
         except Exception as e:
-            if settings.debug:
-                print(f"[RAG SETTING INDEXING] Could not index {chunk_type} for {setting_name}: {e}")
+            logger.debug("[RAG SETTING INDEXING] Could not index %s for %s: %s", chunk_type, setting_name, e)
 
     async def _generate_history_background_chunk(
         self,
@@ -287,7 +299,7 @@ class SettingManager:
         settings: GenerationSettings
     ) -> None:
         """Generate history and background chunk for a setting."""
-        model_config = ModelConfig.from_string(self.config["models"]["initial_outline_writer"])
+        model_config = self._model_configs["initial_outline_writer"]
         
         try:
             # Continue the conversation with the history background chunk prompt
@@ -311,15 +323,13 @@ class SettingManager:
                 stream=settings.stream
             )
             
-            if settings.debug:
-                print(f"[SETTING CHUNK] Generated history background chunk for {setting_name}")
+            logger.debug("[SETTING CHUNK] Generated history background chunk for %s", setting_name)
             
             # Index this chunk immediately after generation
             await self._index_setting_chunk(setting_name, "history_background_chunk", settings)
                 
         except Exception as e:
-            if settings.debug:
-                print(f"[SETTING CHUNK] Error generating history background chunk for {setting_name}: {e}")
+            logger.debug("[SETTING CHUNK] Error generating history background chunk for %s: %s", setting_name, e)
     
     async def _generate_function_purpose_chunk(
         self,
@@ -328,7 +338,7 @@ class SettingManager:
         settings: GenerationSettings
     ) -> None:
         """Generate function and purpose chunk for a setting."""
-        model_config = ModelConfig.from_string(self.config["models"]["initial_outline_writer"])
+        model_config = self._model_configs["initial_outline_writer"]
         
         try:
             # Continue the conversation with the function purpose chunk prompt
@@ -352,15 +362,13 @@ class SettingManager:
                 stream=settings.stream
             )
             
-            if settings.debug:
-                print(f"[SETTING CHUNK] Generated function purpose chunk for {setting_name}")
+            logger.debug("[SETTING CHUNK] Generated function purpose chunk for %s", setting_name)
             
             # Index this chunk immediately after generation
             await self._index_setting_chunk(setting_name, "function_purpose_chunk", settings)
                 
         except Exception as e:
-            if settings.debug:
-                print(f"[SETTING CHUNK] Error generating function purpose chunk for {setting_name}: {e}")
+            logger.debug("[SETTING CHUNK] Error generating function purpose chunk for %s: %s", setting_name, e)
     
     async def _generate_atmosphere_mood_chunk(
         self,
@@ -369,7 +377,7 @@ class SettingManager:
         settings: GenerationSettings
     ) -> None:
         """Generate atmosphere and mood chunk for a setting."""
-        model_config = ModelConfig.from_string(self.config["models"]["initial_outline_writer"])
+        model_config = self._model_configs["initial_outline_writer"]
         
         try:
             # Continue the conversation with the atmosphere mood chunk prompt
@@ -393,15 +401,13 @@ class SettingManager:
                 stream=settings.stream
             )
             
-            if settings.debug:
-                print(f"[SETTING CHUNK] Generated atmosphere mood chunk for {setting_name}")
+            logger.debug("[SETTING CHUNK] Generated atmosphere mood chunk for %s", setting_name)
             
             # Index this chunk immediately after generation
             await self._index_setting_chunk(setting_name, "atmosphere_mood_chunk", settings)
                 
         except Exception as e:
-            if settings.debug:
-                print(f"[SETTING CHUNK] Error generating atmosphere mood chunk for {setting_name}: {e}")
+            logger.debug("[SETTING CHUNK] Error generating atmosphere mood chunk for %s: %s", setting_name, e)
     
     async def _generate_rules_constraints_chunk(
         self,
@@ -410,7 +416,7 @@ class SettingManager:
         settings: GenerationSettings
     ) -> None:
         """Generate rules and constraints chunk for a setting."""
-        model_config = ModelConfig.from_string(self.config["models"]["initial_outline_writer"])
+        model_config = self._model_configs["initial_outline_writer"]
         
         try:
             # Continue the conversation with the rules constraints chunk prompt
@@ -434,15 +440,13 @@ class SettingManager:
                 stream=settings.stream
             )
             
-            if settings.debug:
-                print(f"[SETTING CHUNK] Generated rules constraints chunk for {setting_name}")
+            logger.debug("[SETTING CHUNK] Generated rules constraints chunk for %s", setting_name)
             
             # Index this chunk immediately after generation
             await self._index_setting_chunk(setting_name, "rules_constraints_chunk", settings)
                 
         except Exception as e:
-            if settings.debug:
-                print(f"[SETTING CHUNK] Error generating rules constraints chunk for {setting_name}: {e}")
+            logger.debug("[SETTING CHUNK] Error generating rules constraints chunk for %s: %s", setting_name, e)
     
     async def _generate_connections_relationships_chunk(
         self,
@@ -451,7 +455,7 @@ class SettingManager:
         settings: GenerationSettings
     ) -> None:
         """Generate connections and relationships chunk for a setting."""
-        model_config = ModelConfig.from_string(self.config["models"]["initial_outline_writer"])
+        model_config = self._model_configs["initial_outline_writer"]
         
         try:
             # Continue the conversation with the connections relationships chunk prompt
@@ -475,15 +479,13 @@ class SettingManager:
                 stream=settings.stream
             )
             
-            if settings.debug:
-                print(f"[SETTING CHUNK] Generated connections relationships chunk for {setting_name}")
+            logger.debug("[SETTING CHUNK] Generated connections relationships chunk for %s", setting_name)
             
             # Index this chunk immediately after generation
             await self._index_setting_chunk(setting_name, "connections_relationships_chunk", settings)
                 
         except Exception as e:
-            if settings.debug:
-                print(f"[SETTING CHUNK] Error generating connections relationships chunk for {setting_name}: {e}")
+            logger.debug("[SETTING CHUNK] Error generating connections relationships chunk for %s: %s", setting_name, e)
     
     async def index_setting_in_rag(
         self, 
@@ -503,11 +505,9 @@ class SettingManager:
                         "setting_name": setting_name
                     }
                 )
-                if settings.debug:
-                    print(f"[RAG SETTING INDEXING] Cleaned up {deleted_count} existing chunks for setting '{setting_name}' before reindexing")
+                logger.debug("[RAG SETTING INDEXING] Cleaned up %s existing chunks for setting '%s' before reindexing", deleted_count, setting_name)
             except Exception as e:
-                if settings.debug:
-                    print(f"[RAG SETTING INDEXING] Warning: Failed to cleanup existing chunks for '{setting_name}': {e}")
+                logger.debug("[RAG SETTING INDEXING] Warning: Failed to cleanup existing chunks for '%s': %s", setting_name, e)
                 # Continue with indexing even if cleanup fails
             
             # Index all setting chunks for optimal RAG retrieval
@@ -537,30 +537,34 @@ class SettingManager:
                                 }
                             )
                             
-                            if settings.debug:
-                                print(f"[RAG SETTING INDEXING] Indexed {len(chunk_chunk_ids)} {chunk_type} chunks for setting '{setting_name}'")
+                            logger.debug("[RAG SETTING INDEXING] Indexed %s %s chunks for setting '%s'", len(chunk_chunk_ids), chunk_type, setting_name)
                     
                     except Exception as e:
-                        if settings.debug:
-                            print(f"[RAG SETTING INDEXING] Could not index {chunk_type} for {setting_name}: {e}")
+                        logger.debug("[RAG SETTING INDEXING] Could not index %s for %s: %s", chunk_type, setting_name, e)
         
         except Exception as e:
-            if settings.debug:
-                print(f"[RAG SETTING INDEXING] Error indexing setting '{setting_name}' in RAG: {e}")
+            logger.debug("[RAG SETTING INDEXING] Error indexing setting '%s' in RAG: %s", setting_name, e)
     
 
     
     async def extract_chapter_settings(self, chapter_synopsis: str, chapter_num: int, settings: GenerationSettings) -> List[str]:
         """Extract setting names from chapter synopsis."""
-        model_config = ModelConfig.from_string(self.config["models"]["logical_model"])
+        model_config = self._model_configs["logical_model"]
         
         try:
-            # Define JSON schema for setting names
-            SETTING_NAMES_SCHEMA = {
-                "type": "array",
-                "items": {"type": "string"}
-            }
-
+            savepoint_id = f"chapter_{chapter_num}/settings"
+            
+            # A saved step for this chapter wins; otherwise reuse the result for near-identical text
+            cached_names, text_embedding = None, None
+            if not await self.prompt_handler.check_savepoint_exists(savepoint_id):
+                cached_names, text_embedding = await self._extraction_cache.get(chapter_synopsis)
+            if cached_names is not None:
+                logger.debug("[CHAPTER SETTINGS] Reusing cached settings for chapter %s", chapter_num)
+                # Saved like a prompted result, so a resumed run reads the same names back
+                if self.savepoint_manager:
+                    await self.savepoint_manager.save_step(savepoint_id, json.dumps(cached_names, ensure_ascii=False))
+                return list(cached_names)
+            
             response = await execute_prompt_with_savepoint(
                 handler=self.prompt_handler,
                 prompt_id="settings/extract_from_chapter",
@@ -568,7 +572,7 @@ class SettingManager:
                     "chapter_synopsis": chapter_synopsis,
                     "chapter_num": chapter_num
                 },
-                savepoint_id=f"chapter_{chapter_num}/settings",
+                savepoint_id=savepoint_id,
                 model_config=model_config,
                 seed=settings.seed,
                 debug=settings.debug,
@@ -576,7 +580,7 @@ class SettingManager:
                 log_prompt_inputs=settings.log_prompt_inputs,
                 system_message=self.system_message,
                 expect_json=True,
-                json_schema=SETTING_NAMES_SCHEMA
+                json_schema=_SETTING_NAMES_SCHEMA
             )
             
             # Parse the response using the new JSON integration
@@ -585,45 +589,79 @@ class SettingManager:
             # First try to parse as JSON (the expected format)
             setting_names = []
             if response.json_parsed:
-                try:
-                    parsed_names = json.loads(names_text)
-                    if isinstance(parsed_names, list):
-                        setting_names = [str(name).strip() for name in parsed_names if name and str(name).strip()]
-                        if settings.debug:
-                            print(f"[SETTING EXTRACTION] Successfully parsed JSON: {setting_names}")
-                except (json.JSONDecodeError, AttributeError) as e:
-                    if settings.debug:
-                        print(f"[SETTING EXTRACTION] JSON parsing failed: {e}, falling back to line parsing")
-                    setting_names = []
+                parsed_names = response.json_data
+                if isinstance(parsed_names, list):
+                    setting_names = [str(name).strip() for name in parsed_names if name and str(name).strip()]
+                    logger.debug("[SETTING EXTRACTION] Successfully parsed JSON: %s", setting_names)
             else:
-                if settings.debug:
-                    print(f"[SETTING EXTRACTION] JSON parsing failed: {response.json_errors}, falling back to line parsing")
+                logger.debug("[SETTING EXTRACTION] JSON parsing failed: %s, falling back to line parsing", response.json_errors)
                 setting_names = []
             
             # Fallback to line-by-line parsing if JSON parsing failed
             if not setting_names:
-                for line in names_text.split('\n'):
-                    line = line.strip()
-                    if line and not line.startswith('#') and not line.startswith('-'):
-                        # Remove any bullet points, numbers, or other formatting
-                        clean_name = line.replace('*', '').replace('-', '').replace('•', '')
-                        clean_name = clean_name.strip()
-                        if clean_name and len(clean_name) < 100:  # Reasonable setting name length
-                            setting_names.append(clean_name)
-            
-            # Remove duplicates while preserving order
-            seen = set()
-            unique_names = []
-            for name in setting_names:
-                if name.lower() not in seen:
+                setting_names = self._parse_names_fallback(names_text)
+            
+            extracted_names = self._dedupe_names(setting_names)
+            if extracted_names:
+                self._extraction_cache.put(chapter_synopsis, extracted_names, text_embedding)
+            return extracted_names
+            
+        except Exception as e:
+            logger.debug("[CHAPTER SETTINGS] Error extracting settings for chapter %s: %s", chapter_num, e)
+            return []
+    
+    async def extract_new_settings(
+        self,
+        chapter_content: str,
+        known: List[str],
+        chapter_num: int,
+        settings: GenerationSettings
+    ) -> List[str]:
+        """Extract setting names in chapter content that are not already in ``known``.
+
+        The synopsis-phase extraction already covers most of a chapter's settings, so this
+        only asks the model for the delta instead of re-extracting from the full text.
+        """
+        model_config = self._model_configs["logical_model"]
+        
+        try:
+            response = await execute_prompt_with_savepoint(
+                handler=self.prompt_handler,
+                prompt_id="settings/extract_new_from_chapter",
+                variables={
+                    "chapter_content": chapter_content,
+                    "known_settings": json.dumps(known, ensure_ascii=False),
+                    "chapter_num": chapter_num
+                },
+                savepoint_id=f"chapter_{chapter_num}/new_settings",
+                model_config=model_config,
+                seed=settings.seed,
+                debug=settings.debug,
+                stream=settings.stream,
+                log_prompt_inputs=settings.log_prompt_inputs,
+                system_message=self.system_message,
+                expect_json=True,
+                json_schema=_SETTING_NAMES_SCHEMA
+            )
+            
+            parsed_names = response.json_data if response.json_parsed else None
+            if not isinstance(parsed_names, list):
+                return []
+            
+            # Drop anything the model echoed back from the known list
+            seen = {name.lower() for name in known}
+            new_names = []
+            for name in parsed_names:
+                name = str(name).strip() if name else ""
+                if name and name.lower() not in seen:
                     seen.add(name.lower())
-                    unique_names.append(name)
+                    new_names.append(name)
             
-            return unique_names[:10]  # Limit to 10 settings max
+            logger.debug("[CHAPTER SETTINGS] New settings in chapter %s: %s", chapter_num, new_names)
+            return new_names
             
         except Exception as e:
-            if settings.debug:
-                print(f"[CHAPTER SETTINGS] Error extracting settings for chapter {chapter_num}: {e}")
+            logger.debug("[CHAPTER SETTINGS] Error extracting new settings for chapter %s: %s", chapter_num, e)
             return []
     
     async def fetch_setting_sheets_for_chapter(self, setting_names: List[str], settings: GenerationSettings) -> str:
@@ -637,9 +675,8 @@ class SettingManager:
                 sheet_key = f"settings/{setting_name}/sheet"
                 sheet_content = await self.savepoint_manager.load_step(sheet_key)
                 setting_sheets.append(f"=== {setting_name} ===\n{sheet_content}")
-            except:
-                if settings.debug:
-                    print(f"[SETTING SHEETS] Could not load sheet for {setting_name}")
+            except Exception:
+                logger.debug("[SETTING SHEETS] Could not load sheet for %s", setting_name)
         
         return "\n\n".join(setting_sheets)
 
@@ -656,54 +693,50 @@ class SettingManager:
         if not setting_names or not self.savepoint_manager:
             return
         
-        for setting_name in setting_names:
-            try:
-                # Check if setting sheet exists
-                sheet_key = f"settings/{setting_name}/sheet"
-                existing_sheet = ""
+        # Each setting's update is independent, so run them concurrently within the shared bound
+        async def update_one(setting_name: str) -> None:
+            async with self._update_semaphore:
                 try:
+                    # Check if setting sheet exists; a missing step loads as None
+                    sheet_key = f"settings/{setting_name}/sheet"
                     existing_sheet = await self.savepoint_manager.load_step(sheet_key)
-                except:
-                    if settings.debug:
-                        print(f"[SETTING UPDATE] No existing sheet for {setting_name}, trying physical description chunk")
+                    if existing_sheet is None:
+                        logger.debug("[SETTING UPDATE] No existing sheet for %s, trying physical description chunk", setting_name)
                         # Try to load physical description chunk as fallback
-                        try:
-                            physical_key = f"settings/{setting_name}/physical_description_chunk"
-                            existing_sheet = await self.savepoint_manager.load_step(physical_key)
-                            if settings.debug:
-                                print(f"[SETTING UPDATE] Using physical description chunk for {setting_name}")
-                        except:
-                            if settings.debug:
-                                print(f"[SETTING UPDATE] No physical description chunk either for {setting_name}")
-                            continue
+                        physical_key = f"settings/{setting_name}/physical_description_chunk"
+                        existing_sheet = await self.savepoint_manager.load_step(physical_key)
+                        if existing_sheet is None:
+                            logger.debug("[SETTING UPDATE] No physical description chunk either for %s", setting_name)
+                            return
+                        logger.debug("[SETTING UPDATE] Using physical description chunk for %s", setting_name)
                 
-                # Generate updated setting sheet
-                model_config = ModelConfig.from_string(self.config["models"]["initial_outline_writer"])
+                    # Generate updated setting sheet
+                    model_config = self._model_configs["initial_outline_writer"]
                 
-                response = await execute_prompt_with_savepoint(
-                    handler=self.prompt_handler,
-                    prompt_id="settings/update",
-                    variables={
-                        "setting_name": setting_name,
-                        "existing_sheet": existing_sheet,
-                        "chapter_outline": chapter_outline,
-                        "chapter_num": chapter_num
-                    },
-                    savepoint_id=f"settings/{setting_name}/sheet",
-                    model_config=model_config,
-                    seed=settings.seed,
-                    debug=settings.debug,
-                    stream=settings.stream,
-                    log_prompt_inputs=settings.log_prompt_inputs,
-                    system_message=self.system_message
-                )
+                    response = await execute_prompt_with_savepoint(
+                        handler=self.prompt_handler,
+                        prompt_id="settings/update",
+                        variables={
+                            "setting_name": setting_name,
+                            "existing_sheet": existing_sheet,
+                            "chapter_outline": chapter_outline,
+                            "chapter_num": chapter_num
+                        },
+                        savepoint_id=f"settings/{setting_name}/sheet",
+                        model_config=model_config,
+                        seed=settings.seed,
+                        debug=settings.debug,
+                        stream=settings.stream,
+                        log_prompt_inputs=settings.log_prompt_inputs,
+                        system_message=self.system_message
+                    )
                 
-                if settings.debug:
-                    print(f"[SETTING UPDATE] Updated sheet for {setting_name} based on chapter {chapter_num}")
+                    logger.debug("[SETTING UPDATE] Updated sheet for %s based on chapter %s", setting_name, chapter_num)
                     
-            except Exception as e:
-                if settings.debug:
-                    print(f"[SETTING UPDATE] Error updating sheet for {setting_name}: {e}")
+                except Exception as e:
+                    logger.debug("[SETTING UPDATE] Error updating sheet for %s: %s", setting_name, e)
+        
+        await asyncio.gather(*(update_one(setting_name) for setting_name in setting_names))
     
     async def generate_setting_summary(
         self,
@@ -720,8 +753,7 @@ class SettingManager:
             Natural language summary of the setting, or empty string if not found
         """
         if not self.savepoint_manager:
-            if settings.debug:
-                print(f"[SETTING SUMMARY] No savepoint manager available for {setting_name}")
+            logger.debug("[SETTING SUMMARY] No savepoint manager available for %s", setting_name)
             return ""
         
         try:
@@ -735,8 +767,7 @@ class SettingManager:
             function_chunk = await self.savepoint_manager.load_step(function_key)
             
             if not physical_chunk and not atmosphere_chunk and not function_chunk:
-                if settings.debug:
-                    print(f"[SETTING SUMMARY] No setting chunks found for {setting_name}")
+                logger.debug("[SETTING SUMMARY] No setting chunks found for %s", setting_name)
                 return ""
             
             # Combine available chunks for summary generation
@@ -751,7 +782,7 @@ class SettingManager:
             combined_info = "\n\n".join(setting_info)
             
             # Generate natural language summary from the combined chunks
-            model_config = ModelConfig.from_string(self.config["models"]["logical_model"])
+            model_config = self._model_configs["logical_model"]
             
             response = await execute_prompt_with_savepoint(
                 handler=self.prompt_handler,
@@ -771,17 +802,14 @@ class SettingManager:
             
             if response and response.content and response.content.strip():
                 summary = response.content.strip()
-                if settings.debug:
-                    print(f"[SETTING SUMMARY] Generated summary for {setting_name}: {len(summary)} characters")
+                logger.debug("[SETTING SUMMARY] Generated summary for %s: %s characters", setting_name, len(summary))
                 return summary
             else:
-                if settings.debug:
-                    print(f"[SETTING SUMMARY] Warning: Empty response when generating summary for {setting_name}")
+                logger.debug("[SETTING SUMMARY] Warning: Empty response when generating summary for %s", setting_name)
                 return ""
                 
         except Exception as e:
-            if settings.debug:
-                print(f"[SETTING SUMMARY] Error generating summary for {setting_name}: {e}")
+            logger.debug("[SETTING SUMMARY] Error generating summary for %s: %s", setting_name, e)
             return ""
     
     async def get_setting_summaries(
@@ -803,8 +831,7 @@ class SettingManager:
         
         # Check if savepoint manager is available
         if not self.savepoint_manager:
-            if settings.debug:
-                print(f"[SETTING SUMMARIES] No savepoint manager available, returning setting names only")
+            logger.debug("[SETTING SUMMARIES] No savepoint manager available, returning setting names only")
             # Return just the setting names as a fallback
             return "\n\n".join([f"**{name}**: Setting appears in this scene" for name in setting_names])
         
@@ -816,12 +843,10 @@ class SettingManager:
         
         if summaries:
             combined_summaries = "\n\n".join(summaries)
-            if settings.debug:
-                print(f"[SETTING SUMMARIES] Generated {len(summaries)} setting summaries")
+            logger.debug("[SETTING SUMMARIES] Generated %s setting summaries", len(summaries))
             return combined_summaries
         else:
-            if settings.debug:
-                print(f"[SETTING SUMMARIES] No setting summaries generated, returning setting names only")
+            logger.debug("[SETTING SUMMARIES] No setting summaries generated, returning setting names only")
             # Return just the setting names as a fallback
             return "\n\n".join([f"**{name}**: Setting appears in this scene" for name in setting_names])
     
@@ -847,8 +872,7 @@ class SettingManager:
         
         # Check if savepoint manager is available
         if not self.savepoint_manager:
-            if settings.debug:
-                print(f"[SETTING SUMMARIES LIST] No savepoint manager available, returning setting names only")
+            logger.debug("[SETTING SUMMARIES LIST] No savepoint manager available, returning setting names only")
             # Return just the setting names as a fallback
             return "\n\n---\n\n".join([f"**{name}**\n\nSetting appears in this scene" for name in setting_names])
         
@@ -862,12 +886,10 @@ class SettingManager:
             # Join summaries with horizontal rules, but don't add one after the last summary
             formatted_summaries = "\n\n---\n\n".join(summaries)
             
-            if settings.debug:
-                print(f"[SETTING SUMMARIES LIST] Generated {len(summaries)} setting summaries with horizontal rule separators")
+            logger.debug("[SETTING SUMMARIES LIST] Generated %s setting summaries with horizontal rule separators", len(summaries))
             
             return formatted_summaries
         else:
-            if settings.debug:
-                print(f"[SETTING SUMMARIES LIST] No setting summaries generated, returning setting names only")
+            logger.debug("[SETTING SUMMARIES LIST] No setting summaries generated, returning setting names only")
             # Return just the setting names as a fallback
             return "\n\n---\n\n".join([f"**{name}**\n\nSetting appears in this scene" for name in setting_names])
@@ -4,6 +4,7 @@ from typing import Dict, List, Optional, Any, Set
 from dataclasses import dataclass, field
 from datetime import datetime
 import json
+import logging
 import os
 from domain.entities.story import Chapter, Scene
 from domain.value_objects.generation_settings import GenerationSettings
@@ -15,6 +16,8 @@ from infrastructure.savepoints import SavepointManager
 from application.services.rag_integration_service import RAGIntegrationService
 from application.services.content_chunker import ContentChunker
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class CharacterState:
@@ -96,6 +99,8 @@ class StoryStateManager:
         self.system_message = system_message
         self.savepoint_manager = savepoint_manager
         
+        self._model_configs = ModelConfig.from_mapping(self.config.get("models", {}))
+        
         # Story state components
         self.story_context: Optional[StoryContext] = None
         self.characters: Dict[str, CharacterState] = {}
@@ -119,7 +124,7 @@ class StoryStateManager:
     
     async def initialize_story_context(self, prompt: str, settings: GenerationSettings) -> StoryContext:
         """Initialize the story context from the initial prompt."""
-        model_config = ModelConfig.from_string(self.config["models"]["initial_outline_writer"])
+        model_config = self._model_configs["initial_outline_writer"]
         
         response = await execute_prompt_with_savepoint(
             handler=self.prompt_handler,
@@ -149,7 +154,7 @@ class StoryStateManager:
             raise ValueError("Story context must be initialized before planning chapters")
         
         next_chapter_num = len(self.chapters) + 1
-        model_config = ModelConfig.from_string(self.config["models"]["chapter_outline_writer"])
+        model_config = self._model_configs["chapter_outline_writer"]
         
         # Prepare context for planning
         planning_context = self._prepare_planning_context()
@@ -185,7 +190,7 @@ class StoryStateManager:
     
     async def update_story_evolution(self, chapter_num: int, settings: GenerationSettings) -> None:
         """Analyze how the chapter affects story evolution using RAG interrogation."""
-        model_config = ModelConfig.from_string(self.config["models"]["logical_model"])
+        model_config = self._model_configs["logical_model"]
         
         # Use RAG to interrogate the chapter instead of reading full content
         evolution_data = await self._analyze_chapter_evolution_rag(chapter_num, settings)
@@ -202,7 +207,7 @@ class StoryStateManager:
             raise ValueError(f"Chapter {chapter_num} not found")
         
         chapter_state = self.chapters[chapter_num]
-        model_config = ModelConfig.from_string(self.config["models"]["chapter_outline_writer"])
+        model_config = self._model_configs["chapter_outline_writer"]
         
         response = await execute_prompt_with_savepoint(
             handler=self.prompt_handler,
@@ -287,8 +292,7 @@ class StoryStateManager:
             return response.strip() if response else None
             
         except Exception as e:
-            if settings.debug:
-                print(f"RAG query failed: {e}")
+            logger.debug("RAG query failed: %s", e)
             return None
     
     def _extract_list_items(self, text: str) -> List[str]:
@@ -861,7 +865,7 @@ class StoryStateManager:
             with open(self.state_file_path, 'w') as f:
                 json.dump(state_data, f, indent=2)
         except Exception as e:
-            print(f"Warning: Could not save story state: {e}")
+            logger.warning("Warning: Could not save story state: %s", e)
     
     def _load_state(self) -> None:
         """Load the story state from file."""
@@ -901,4 +905,4 @@ class StoryStateManager:
                 self.story_evolution = state_data["story_evolution"]
                 
         except Exception as e:
-            print(f"Warning: Could not load story state: {e}")
+            logger.warning("Warning: Could not load story state: %s", e)
@@ -1,6 +1,8 @@
 """Outline-Chapter story writing strategy."""
 
 import asyncio
+import logging
+import sys
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 from pathlib import Path
@@ -13,7 +15,9 @@ from application.interfaces.story_strategy import StoryStrategy
 from application.interfaces.model_provider import ModelProvider
 from infrastructure.prompts.prompt_loader import PromptLoader
 from infrastructure.prompts.prompt_handler import PromptHandler
+from infrastructure.prompts.prompt_cache import PromptCache
 from infrastructure.prompts.prompt_wrapper import execute_prompt_with_savepoint
+from infrastructure.providers.throttled_provider import ThrottledModelProvider, TokenThrottle
 from infrastructure.savepoints import SavepointManager
 from .outline_generator import OutlineGenerator
 from .chapter_generator import ChapterGenerator
@@ -21,6 +25,24 @@ from .story_state_manager import StoryStateManager
 from application.services.rag_service import RAGService
 from application.services.rag_integration_service import RAGIntegrationService
 
+logger = logging.getLogger(__name__)
+
+
+def _configure_package_logging(debug: bool = False) -> None:
+    """Show the strategy's progress messages (logged at INFO) wherever it runs.
+    
+    ``debug`` (GenerationSettings.debug) also shows the package's diagnostics, which are
+    logged at DEBUG. The CLI routes logging to the console itself; any other caller that set
+    up no logging (the scripts in the repository root, an embedding application) would
+    otherwise only see warnings, so the package then gets a plain console handler of its own.
+    """
+    package_logger = logging.getLogger(__package__)
+    package_logger.setLevel(logging.DEBUG if debug else logging.INFO)
+    if not package_logger.handlers and not logging.getLogger().handlers:
+        console = logging.StreamHandler(sys.stdout)
+        console.setFormatter(logging.Formatter("%(message)s"))
+        package_logger.addHandler(console)
+
 
 class OutlineChapterStrategy(StoryStrategy):
     """Story writing strategy that generates outline first, then chapters."""
@@ -33,7 +55,12 @@ class OutlineChapterStrategy(StoryStrategy):
         savepoint_repo: Optional[SavepointRepository] = None,
         rag_service: Optional['RAGService'] = None
     ):
+        # Concurrent chapters and enrichment share one request/token budget when configured
+        rpm, tpm = config.get("rate_limit_rpm"), config.get("rate_limit_tpm")
+        if rpm or tpm:
+            model_provider = ThrottledModelProvider(model_provider, TokenThrottle(rpm, tpm))
         super().__init__(model_provider)
+        _configure_package_logging()
         self.config = config
         self.prompt_loader = prompt_loader
         self.savepoint_repo = savepoint_repo
@@ -43,11 +70,13 @@ class OutlineChapterStrategy(StoryStrategy):
         self._rag_story_id: Optional[int] = None
         self.rag_integration: Optional['RAGIntegrationService'] = None
         
-        # Create the prompt handler
+        # Create the prompt handler, with a cross-run response cache when configured
+        prompt_cache_path = config.get("prompt_cache_path")
         self.prompt_handler = PromptHandler(
             model_provider=model_provider,
             prompt_loader=prompt_loader,
-            savepoint_repo=savepoint_repo
+            savepoint_repo=savepoint_repo,
+            prompt_cache=PromptCache(prompt_cache_path) if prompt_cache_path else None
         )
         
         # System message for consistent context and role signaling
@@ -131,9 +160,9 @@ You have deep knowledge of storytelling techniques, character development, plot
                 # Purge all existing RAG content for this story to ensure a clean slate
                 try:
                     await self._purge_story_rag_content(prompt_filename)
-                    print(f"🧹 Purged all existing RAG content for story '{prompt_filename}'")
+                    logger.info("🧹 Purged all existing RAG content for story '%s'", prompt_filename)
                 except Exception as e:
-                    print(f"⚠️ Warning: Could not purge RAG content for '{prompt_filename}': {e}")
+                    logger.warning("⚠️ Warning: Could not purge RAG content for '%s': %s", prompt_filename, e)
                 
                 # Pass the RAG integration service to all managers and generators
                 self.outline_generator.rag_integration = self.rag_integration
@@ -169,10 +198,10 @@ You have deep knowledge of storytelling techniques, character development, plot
             # Store the story ID for future use
             self._rag_story_id = story_id
             
-            print(f"✅ RAG story initialized for '{prompt_filename}' with ID: {story_id}")
+            logger.info("✅ RAG story initialized for '%s' with ID: %s", prompt_filename, story_id)
             
         except Exception as e:
-            print(f"⚠️ Warning: Could not initialize RAG story for '{prompt_filename}': {e}")
+            logger.warning("⚠️ Warning: Could not initialize RAG story for '%s': %s", prompt_filename, e)
     
     async def _purge_story_rag_content(self, prompt_filename: str) -> None:
         """Purge all existing RAG content for a story to ensure a clean slate."""
@@ -185,44 +214,44 @@ You have deep knowledge of storytelling techniques, character development, plot
                 await self.rag_service.initialize()
                 self.rag_service._initialized = True
 
-            print(f"🔍 [DEBUG] Purging RAG content for story '{prompt_filename}'")
+            logger.debug("🔍 [DEBUG] Purging RAG content for story '%s'", prompt_filename)
             
             # Use the RAG integration service to get the story ID (this ensures consistency)
             story_id = await self.rag_integration.initialize_story(prompt_filename)
-            print(f"🔍 [DEBUG] Using story ID from RAG integration service: {story_id}")
+            logger.debug("🔍 [DEBUG] Using story ID from RAG integration service: %s", story_id)
             
             # Let's also check what stories exist in the database
             try:
                 all_stories = await self.rag_service.vector_store.list_stories()
-                print(f"🔍 [DEBUG] All stories in database: {[{'id': s['id'], 'name': s['story_name'], 'file': s['prompt_file_name']} for s in all_stories]}")
+                logger.debug("🔍 [DEBUG] All stories in database: %s", [{'id': s['id'], 'name': s['story_name'], 'file': s['prompt_file_name']} for s in all_stories])
             except Exception as e:
-                print(f"⚠️ [DEBUG] Could not list stories: {e}")
+                logger.debug("⚠️ [DEBUG] Could not list stories: %s", e)
             
             # First, let's check how many chunks exist for this story
             try:
                 existing_chunks = await self.rag_service.vector_store.get_story_content(story_id)
                 chunk_count = len(existing_chunks) if existing_chunks else 0
-                print(f"🔍 [DEBUG] Found {chunk_count} existing chunks for story ID {story_id}")
+                logger.debug("🔍 [DEBUG] Found %s existing chunks for story ID %s", chunk_count, story_id)
                 
                 if chunk_count > 0:
                     # Delete all content chunks for this story
                     deleted_count = await self.rag_service.vector_store.delete_story_content(story_id)
                     
                     if deleted_count > 0:
-                        print(f"🗑️ Deleted {deleted_count} existing content chunks for story '{prompt_filename}'")
+                        logger.info("🗑️ Deleted %s existing content chunks for story '%s'", deleted_count, prompt_filename)
                     else:
-                        print(f"⚠️ [DEBUG] delete_story_content returned 0, but we found {chunk_count} chunks")
+                        logger.debug("⚠️ [DEBUG] delete_story_content returned 0, but we found %s chunks", chunk_count)
                 else:
-                    print(f"✨ No existing content chunks found for story '{prompt_filename}'")
+                    logger.info("✨ No existing content chunks found for story '%s'", prompt_filename)
                     
             except Exception as e:
-                print(f"⚠️ [DEBUG] Error checking existing chunks: {e}")
+                logger.debug("⚠️ [DEBUG] Error checking existing chunks: %s", e)
                 # Try the delete anyway
                 deleted_count = await self.rag_service.vector_store.delete_story_content(story_id)
-                print(f"🗑️ [DEBUG] Delete attempt returned: {deleted_count}")
+                logger.debug("🗑️ [DEBUG] Delete attempt returned: %s", deleted_count)
                 
         except Exception as e:
-            print(f"⚠️ Warning: Could not purge RAG content for '{prompt_filename}': {e}")
+            logger.warning("⚠️ Warning: Could not purge RAG content for '%s': %s", prompt_filename, e)
             # Don't raise the exception - we want to continue with story generation even if purge fails
     
     def get_rag_story_id(self) -> Optional[int]:
@@ -287,6 +316,7 @@ You have deep knowledge of storytelling techniques, character development, plot
     
     async def generate_outline(self, prompt: str, settings: GenerationSettings, prompt_filename: Optional[str] = None) -> Outline:
         """Generate story outline from prompt."""
+        _configure_package_logging(settings.debug)
         try:
             # Setup savepoints if available
             if prompt_filename and self.savepoint_repo:
@@ -300,6 +330,7 @@ You have deep knowledge of storytelling techniques, character development, plot
     
     async def generate_chapters(self, outline: Outline, settings: GenerationSettings) -> List[Chapter]:
         """Generate chapters from outline."""
+        _configure_package_logging(settings.debug)
         try:
             # Delegate to chapter generator
             return await self.chapter_generator.generate_chapters(outline, settings)
@@ -309,11 +340,12 @@ You have deep knowledge of storytelling techniques, character development, plot
     
     async def generate_progressive_story(self, prompt: str, settings: GenerationSettings) -> List[Chapter]:
         """Generate story progressively, one chapter at a time."""
+        _configure_package_logging(settings.debug)
         try:
             # Initialize progressive outline system
-            print("[PROGRESSIVE STORY] Initializing progressive outline system...")
+            logger.info("[PROGRESSIVE STORY] Initializing progressive outline system...")
             init_result = await self.outline_generator.initialize_progressive_outline(prompt, settings)
-            print(f"[PROGRESSIVE STORY] Progressive outline initialized: {init_result['status']}")
+            logger.info("[PROGRESSIVE STORY] Progressive outline initialized: %s", init_result['status'])
             
             chapters = []
             chapter_count = 0
@@ -321,28 +353,28 @@ You have deep knowledge of storytelling techniques, character development, plot
             # Generate chapters progressively
             while chapter_count < settings.wanted_chapters:
                 chapter_count += 1
-                print(f"[PROGRESSIVE STORY] Planning Chapter {chapter_count}...")
+                logger.info("[PROGRESSIVE STORY] Planning Chapter %s...", chapter_count)
                 
                 # Use ChapterGenerator to coordinate chapter planning
                 chapter_plan = await self.chapter_generator.plan_next_chapter_progressive(settings)
-                print(f"[PROGRESSIVE STORY] Chapter {chapter_count} planned: {chapter_plan['title']}")
+                logger.info("[PROGRESSIVE STORY] Chapter %s planned: %s", chapter_count, chapter_plan['title'])
                 
                 # Generate the chapter content using ChapterGenerator
-                print(f"[PROGRESSIVE STORY] Generating Chapter {chapter_count} content...")
+                logger.info("[PROGRESSIVE STORY] Generating Chapter %s content...", chapter_count)
                 chapter = await self._generate_chapter_from_plan(chapter_plan, settings)
                 chapters.append(chapter)
                 
                 # Update story evolution
-                print(f"[PROGRESSIVE STORY] Analyzing Chapter {chapter_count} evolution...")
+                logger.info("[PROGRESSIVE STORY] Analyzing Chapter %s evolution...", chapter_count)
                 await self.story_state_manager.update_story_evolution(chapter_count, settings)
                 
                 # Check if we need to revise previous chapter plans
                 if chapter_count > 1:
-                    print(f"[PROGRESSIVE STORY] Checking if Chapter {chapter_count-1} needs revision...")
+                    logger.info("[PROGRESSIVE STORY] Checking if Chapter %s needs revision...", chapter_count-1)
                     await self._check_and_revise_previous_chapters(chapter_count, settings)
                 
-                print(f"[PROGRESSIVE STORY] Chapter {chapter_count} completed. Story state updated.")
-                print(f"[PROGRESSIVE STORY] Current story summary:\n{self.story_state_manager.get_story_summary()}")
+                logger.info("[PROGRESSIVE STORY] Chapter %s completed. Story state updated.", chapter_count)
+                logger.info("[PROGRESSIVE STORY] Current story summary:\n%s", self.story_state_manager.get_story_summary())
             
             return chapters
             
@@ -400,8 +432,7 @@ You have deep knowledge of storytelling techniques, character development, plot
             # Use ChapterGenerator to coordinate chapter planning
             chapter_plan = await self.chapter_generator.plan_next_chapter_progressive(settings)
             
-            if settings.debug:
-                print(f"[PROGRESSIVE PLANNING] Next chapter planned: {chapter_plan['title']}")
+            logger.debug("[PROGRESSIVE PLANNING] Next chapter planned: %s", chapter_plan['title'])
             
             return chapter_plan
             
@@ -422,10 +453,9 @@ You have deep knowledge of storytelling techniques, character development, plot
             # Use ChapterGenerator to enhance the chapter content if needed
             # This could involve scene generation, character development, etc.
             # For now, we'll use the planned content directly
-            if settings.debug:
-                print(f"[PROGRESSIVE STORY] Chapter {chapter.chapter_number} generated from plan")
-                print(f"   Title: {chapter.title}")
-                print(f"   Content length: {len(chapter.content)} characters")
+            logger.debug("[PROGRESSIVE STORY] Chapter %s generated from plan", chapter.chapter_number)
+            logger.debug("   Title: %s", chapter.title)
+            logger.debug("   Content length: %s characters", len(chapter.content))
             
             # Update the chapter state in StoryStateManager
             if chapter.chapter_number in self.story_state_manager.chapters:
@@ -452,13 +482,13 @@ You have deep knowledge of storytelling techniques, character development, plot
                 
                 # Simple heuristic: if the chapter was planned more than 2 chapters ago, consider revision
                 if current_chapter - chapter_state.chapter_number > 2:
-                    print(f"[PROGRESSIVE STORY] Revising Chapter {prev_chapter} plan...")
+                    logger.info("[PROGRESSIVE STORY] Revising Chapter %s plan...", prev_chapter)
                     # Use ChapterGenerator to coordinate revision
                     await self.chapter_generator.revise_outline_progressive(prev_chapter, settings)
-                    print(f"[PROGRESSIVE STORY] Chapter {prev_chapter} plan revised.")
+                    logger.info("[PROGRESSIVE STORY] Chapter %s plan revised.", prev_chapter)
                     
         except Exception as e:
-            print(f"[PROGRESSIVE STORY] Warning: Could not check/revise previous chapters: {e}")
+            logger.warning("[PROGRESSIVE STORY] Warning: Could not check/revise previous chapters: %s", e)
     
     async def generate_story_info(self, outline: Outline, chapters: List[Chapter], settings: GenerationSettings) -> StoryInfo:
         """Generate story metadata."""
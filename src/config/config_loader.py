@@ -55,6 +55,28 @@ class ConfigLoader:
                     'max_context_chunks': infrastructure.get('max_context_chunks', 20),
                     'max_chunk_size': infrastructure.get('max_chunk_size', 1000),
                     'overlap_size': infrastructure.get('overlap_size', 200),
+                    # Concurrency
+                    'chapter_concurrency': infrastructure.get('chapter_concurrency', 1),
+                    'pipeline_depth': infrastructure.get('pipeline_depth', 0),
+                    'sheet_generation_concurrency': infrastructure.get('sheet_generation_concurrency', 4),
+                    'chunk_generation_concurrency': infrastructure.get('chunk_generation_concurrency', 8),
+                    'sheet_update_concurrency': infrastructure.get('sheet_update_concurrency', 4),
+                    'enrichment_concurrency': infrastructure.get('enrichment_concurrency', 5),
+                    'summary_concurrency': infrastructure.get('summary_concurrency', 4),
+                    'extraction_cache_similarity': infrastructure.get('extraction_cache_similarity', 0.97),
+                    # Shared rate limits (disabled unless set)
+                    'rate_limit_rpm': infrastructure.get('rate_limit_rpm'),
+                    'rate_limit_tpm': infrastructure.get('rate_limit_tpm'),
+                    # Prompt fusion
+                    'fuse_outline_polish': infrastructure.get('fuse_outline_polish', False),
+                    'fuse_character_sheets': infrastructure.get('fuse_character_sheets', False),
+                    'fuse_character_chunks': infrastructure.get('fuse_character_chunks', False),
+                    'digest_synopsis_context': infrastructure.get('digest_synopsis_context', False),
+                    # Batched extraction (disabled unless set)
+                    'character_extraction_batch_size': infrastructure.get('character_extraction_batch_size', 0),
+                    'character_extraction_concurrency': infrastructure.get('character_extraction_concurrency', 0),
+                    # Response cache (disabled unless a path is given)
+                    'prompt_cache_path': infrastructure.get('prompt_cache_path'),
                 })
                 del config_data['infrastructure']
             
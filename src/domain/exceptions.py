@@ -1,5 +1,7 @@
 """Domain exceptions for the AI Story Writer application."""
 
+from typing import Optional
+
 
 class StoryGenerationError(Exception):
     """Base exception for story generation errors."""
@@ -7,8 +9,14 @@ class StoryGenerationError(Exception):
 
 
 class ModelProviderError(StoryGenerationError):
-    """Raised when model provider fails."""
-    pass
+    """Raised when model provider fails.
+    
+    ``status_code`` is the HTTP status of the failed provider request, when there was one.
+    """
+    
+    def __init__(self, message: str = "", status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
 
 
 class ConfigurationError(StoryGenerationError):
@@ -26,6 +34,11 @@ class StorageError(StoryGenerationError):
     pass
 
 
+class StepNotFoundError(StorageError):
+    """Raised when a required savepoint step has not been saved."""
+    pass
+
+
 class PromptError(StoryGenerationError):
     """Raised when prompt processing fails."""
     pass
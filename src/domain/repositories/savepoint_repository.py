@@ -1,7 +1,7 @@
 """Savepoint repository interface."""
 
 from abc import ABC, abstractmethod
-from typing import Optional, Any, Dict
+from typing import Optional, Any, Dict, Set
 
 
 class SavepointRepository(ABC):
@@ -27,6 +27,11 @@ class SavepointRepository(ABC):
         """Check if a savepoint exists."""
         pass
     
+    @abstractmethod
+    async def list_step_names(self, prefix: str = "") -> Set[str]:
+        """List the step names stored directly under a step prefix."""
+        pass
+    
     @abstractmethod
     async def delete_savepoint(self, step_name: str) -> bool:
         """Delete a savepoint."""
@@ -37,6 +42,10 @@ class SavepointRepository(ABC):
         """List all available savepoints."""
         pass
     
+    async def flush_savepoints(self) -> None:
+        """Make savepoints written since the last flush durable; a no-op by default."""
+        pass
+    
     @abstractmethod
     async def clear_all_savepoints(self) -> None:
         """Clear all savepoints."""
@@ -1,7 +1,7 @@
 """Model configuration value objects."""
 
 from dataclasses import dataclass, field
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Mapping
 from urllib.parse import urlparse, parse_qs
 from ..exceptions import ValidationError
 
@@ -89,6 +89,11 @@ class ModelConfig:
         except Exception as e:
             raise ValidationError(f"Invalid model string format: {model_string}. Error: {e}")
     
+    @classmethod
+    def from_mapping(cls, models: Mapping[str, str]) -> Dict[str, "ModelConfig"]:
+        """Parse a config's ``models`` section (role -> model string) once, so callers reuse the configs."""
+        return {role: cls.from_string(model_string) for role, model_string in models.items()}
+    
     def to_string(self) -> str:
         """Convert ModelConfig back to string representation."""
         result = f"{self.provider}://{self.name}"
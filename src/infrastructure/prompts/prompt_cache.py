@@ -0,0 +1,67 @@
+"""Persistent cache of model responses keyed by the exact request sent."""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from domain.value_objects.model_config import ModelConfig
+
+
+class PromptCache:
+    """SQLite-backed response cache shared across story runs."""
+
+    def __init__(self, db_path: Union[str, Path] = ".prompt_cache.db"):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # Lookups run in worker threads via asyncio.to_thread, so share one guarded connection
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        with self._lock:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT, created_at INT)"
+            )
+            self._conn.commit()
+
+    @staticmethod
+    def make_key(
+        messages: List[Dict[str, str]],
+        model_config: ModelConfig,
+        seed: Optional[int] = None,
+        format_type: Optional[str] = None
+    ) -> str:
+        """Hash everything that determines the model's output for a request."""
+        payload = json.dumps(
+            {
+                "messages": messages,
+                "model": str(model_config),
+                "seed": seed,
+                "format_type": format_type,
+            },
+            sort_keys=True,
+            ensure_ascii=False
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached entry for a key, if any."""
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM cache WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, key: str, value: Dict[str, Any]) -> None:
+        """Store an entry, replacing any previous value for the key."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, created_at) VALUES (?, ?, ?)",
+                (key, json.dumps(value, ensure_ascii=False), int(time.time()))
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
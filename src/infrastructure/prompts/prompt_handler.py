@@ -1,5 +1,6 @@
 """Prompt handler for executing prompts with savepoint management."""
 
+import asyncio
 import json
 import time
 from typing import Any, Dict, List, Optional
@@ -8,8 +9,31 @@ from domain.repositories.savepoint_repository import SavepointRepository
 from domain.value_objects.model_config import ModelConfig
 from application.interfaces.model_provider import ModelProvider
 from .prompt_loader import PromptLoader
+from .prompt_cache import PromptCache
 from domain.exceptions import StoryGenerationError
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+def parse_json_response(content: str) -> Any:
+    """Parse JSON from a model response, or return None if none can be extracted.
+    
+    A response that is already a bare JSON document is decoded directly (with orjson
+    when installed); only anything else goes through llm-output-parser's slower
+    extraction strategies (markdown fences, surrounding prose, repairs).
+    """
+    try:
+        return _json_loads(content)
+    except ValueError:
+        pass
+    
+    from llm_output_parser import parse_json
+    return parse_json(content, strict=False)
+
 
 @dataclass
 class PromptRequest:
@@ -38,11 +62,15 @@ class PromptResponse:
     content: str
     savepoint_id: Optional[str] = None
     was_cached: bool = False
+    # True when the answer came from the prompt cache, which stores raw model output
+    from_prompt_cache: bool = False
     model_used: Optional[str] = None
     execution_time: Optional[float] = None
     # JSON-related fields
     json_parsed: bool = False
     json_errors: Optional[str] = None
+    # The parsed JSON value itself when json_parsed is True, so callers need not re-parse content
+    json_data: Any = None
 
 
 class PromptHandler:
@@ -52,11 +80,13 @@ class PromptHandler:
         self,
         model_provider: ModelProvider,
         prompt_loader: PromptLoader,
-        savepoint_repo: Optional[SavepointRepository] = None
+        savepoint_repo: Optional[SavepointRepository] = None,
+        prompt_cache: Optional[PromptCache] = None
     ):
         self.model_provider = model_provider
         self.prompt_loader = prompt_loader
         self.savepoint_repo = savepoint_repo
+        self.prompt_cache = prompt_cache
     
     async def execute_prompt(self, request: PromptRequest) -> PromptResponse:
         """
@@ -80,13 +110,12 @@ class PromptHandler:
                     # If JSON parsing is requested, apply it to cached content as well
                     json_parsed = False
                     json_errors = None
+                    parsed_content = None
                     
                     if request.expect_json and request.json_schema:
                         try:
-                            from llm_output_parser import parse_json
-                            
                             # Parse the cached content using llm-output-parser
-                            parsed_content = parse_json(cached_content, strict=False)
+                            parsed_content = parse_json_response(cached_content)
                             
                             if parsed_content is not None:
                                 # Update content with parsed JSON string
@@ -112,7 +141,8 @@ class PromptHandler:
                         was_cached=True,
                         execution_time=execution_time,
                         json_parsed=json_parsed,
-                        json_errors=json_errors
+                        json_errors=json_errors,
+                        json_data=parsed_content if json_parsed else None
                     )
         
         # Load and prepare the prompt
@@ -142,12 +172,25 @@ class PromptHandler:
 
         print(f"Request: {request.prompt_id}")
         
+        # Look up an identical earlier request (same rendered messages, model and seed)
+        cache_key = None
+        cached_entry = None
+        if self.prompt_cache and request.model_config is not None:
+            cache_key = PromptCache.make_key(messages, request.model_config, request.seed, request.format_type)
+            if not request.force_regenerate:
+                cached_entry = await asyncio.to_thread(self.prompt_cache.get, cache_key)
+        
         # Execute the prompt
         try:
             if request.model_config is None:
                 raise StoryGenerationError("Model configuration is required for prompt execution")
             
-            if request.stream:
+            if cached_entry is not None:
+                thinking_content = cached_entry.get("thinking")
+                content = cached_entry["content"]
+                if request.debug:
+                    print(f"[PROMPT CACHE] Hit for {request.prompt_id}")
+            elif request.stream:
                 # Handle streaming with console output
                 raw_response = await self._execute_prompt_with_streaming(
                     messages=messages,
@@ -174,6 +217,14 @@ class PromptHandler:
         except Exception as e:
             raise StoryGenerationError(f"Failed to execute prompt '{request.prompt_id}': {e}")
         
+        if cache_key and cached_entry is None:
+            try:
+                await asyncio.to_thread(
+                    self.prompt_cache.put, cache_key, {"content": content, "thinking": thinking_content}
+                )
+            except Exception as e:
+                print(f"Warning: Failed to cache response for '{request.prompt_id}': {e}")
+        
         # Save to savepoint if requested
         if request.savepoint_id and self.savepoint_repo:
             try:
@@ -199,14 +250,13 @@ class PromptHandler:
         # Handle JSON parsing if requested
         json_parsed = False
         json_errors = None
+        parsed_content = None
         
         if request.expect_json and request.json_schema:
             try:
-                from llm_output_parser import parse_json
-                
                 # Parse the response using llm-output-parser
                 # This automatically handles markdown code blocks and multiple parsing strategies
-                parsed_content = parse_json(content, strict=False)
+                parsed_content = parse_json_response(content)
                 
                 if parsed_content is not None:
                     # Validate against the provided schema if possible
@@ -237,11 +287,13 @@ class PromptHandler:
         return PromptResponse(
             content=content,
             savepoint_id=request.savepoint_id,
-            was_cached=False,
+            was_cached=cached_entry is not None,
+            from_prompt_cache=cached_entry is not None,
             model_used=request.model_config.to_string() if request.model_config else None,
             execution_time=execution_time,
             json_parsed=json_parsed,
-            json_errors=json_errors
+            json_errors=json_errors,
+            json_data=parsed_content if json_parsed else None
         )
     
     async def execute_json_prompt(
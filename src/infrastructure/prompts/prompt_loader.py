@@ -2,9 +2,12 @@
 
 import re
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, List, Mapping, Optional, Tuple
 from domain.exceptions import ConfigurationError
 
+# A {{name}} or {name} slot; double braces are tried first, matching the old replace order
+_SLOT_RE = re.compile(r"\{\{(\w+)\}\}|\{(\w+)\}")
+
 
 class PromptLoader:
     """Loads and manages prompts from markdown files."""
@@ -12,9 +15,16 @@ class PromptLoader:
     def __init__(self, prompts_dir: str = "src/prompts"):
         self.prompts_dir = Path(prompts_dir)
         self._prompt_cache: Dict[str, str] = {}
+        self._compiled_cache: Dict[str, Callable[[Mapping[str, Any]], str]] = {}
     
     def load_prompt(self, prompt_name: str, variables: Optional[Dict[str, Any]] = None) -> str:
         """Load a prompt from a markdown file and substitute variables."""
+        if variables:
+            return self.compile_prompt(prompt_name)(variables)
+        return self._load_template(prompt_name)
+    
+    def _load_template(self, prompt_name: str) -> str:
+        """Read a prompt template once and keep it in memory."""
         if prompt_name not in self._prompt_cache:
             prompt_file = self.prompts_dir / f"{prompt_name}.md"
             if not prompt_file.exists():
@@ -22,24 +32,36 @@ class PromptLoader:
             
             self._prompt_cache[prompt_name] = prompt_file.read_text(encoding='utf-8').strip()
         
-        prompt_content = self._prompt_cache[prompt_name]
-        
-        if variables:
-            prompt_content = self._substitute_variables(prompt_content, variables)
-        
-        return prompt_content
+        return self._prompt_cache[prompt_name]
     
-    def _substitute_variables(self, content: str, variables: Dict[str, Any]) -> str:
-        """Substitute variables in prompt content."""
-        # Handle different variable formats: {{variable}}, {variable}, etc.
-        for key, value in variables.items():
-            # Replace {{variable}} format
-            content = content.replace(f"{{{{{key}}}}}", str(value))
-            # Replace {variable} format
-            content = content.replace(f"{{{key}}}", str(value))
+    def compile_prompt(self, prompt_name: str) -> Callable[[Mapping[str, Any]], str]:
+        """Return a renderer for a prompt that fills all its slots in one pass.
+        
+        The template is split into literal text and variable slots once; rendering
+        is then a single join instead of two full-string replaces per variable.
+        Slots whose variable is not supplied are left as written.
+        """
+        if prompt_name not in self._compiled_cache:
+            template = self._load_template(prompt_name)
+            parts: List[Tuple[str, Optional[str]]] = []
+            position = 0
+            for match in _SLOT_RE.finditer(template):
+                parts.append((template[position:match.start()], None))
+                parts.append((match.group(0), match.group(1) or match.group(2)))
+                position = match.end()
+            parts.append((template[position:], None))
+            
+            def render(variables: Mapping[str, Any]) -> str:
+                return "".join(
+                    text if name is None or name not in variables else str(variables[name])
+                    for text, name in parts
+                )
+            
+            self._compiled_cache[prompt_name] = render
         
-        return content
+        return self._compiled_cache[prompt_name]
     
     def clear_cache(self):
         """Clear the prompt cache."""
-        self._prompt_cache.clear() 
\ No newline at end of file
+        self._prompt_cache.clear()
+        self._compiled_cache.clear() 
\ No newline at end of file
@@ -1,8 +1,75 @@
 """Simple wrapper functions for prompt execution with savepoint management."""
 
-from typing import Dict, Any, Optional
+import asyncio
+import functools
+import json
+import random
+import re
+from dataclasses import replace
+from typing import Awaitable, Callable, Dict, Any, Optional, TypeVar
+from domain.exceptions import StoryGenerationError
 from domain.value_objects.model_config import ModelConfig
-from .prompt_handler import PromptHandler, PromptRequest, PromptResponse
+from .prompt_handler import PromptHandler, PromptRequest, PromptResponse, parse_json_response
+
+T = TypeVar("T")
+
+# Failures worth another attempt: the connection to the provider, not bad input or a missing model
+_TRANSIENT_ERRORS = (ConnectionError, TimeoutError)
+
+# HTTP client libraries (httpx, aiohttp, openai) name their timeout, connection and rate-limit
+# errors this way without deriving from the builtin types; matched by name so none is imported
+_TRANSIENT_ERROR_NAME_RE = re.compile(r"Timeout|Connect|RateLimit")
+
+
+def _is_transient_status(status: int) -> bool:
+    """Whether an HTTP status means the same request may succeed later."""
+    return status in (408, 429) or 500 <= status < 600
+
+
+def _is_transient(error: BaseException) -> bool:
+    """Whether an error, or anything it was raised from, is a transient provider failure.
+    
+    Providers wrap every failure in ModelProviderError, so the wrapper class says nothing;
+    the first HTTP status found in the chain decides, otherwise the underlying error type.
+    """
+    seen = set()
+    while error is not None and id(error) not in seen:
+        if isinstance(error, _TRANSIENT_ERRORS):
+            return True
+        status = getattr(error, "status_code", None) or getattr(error, "status", None)
+        if isinstance(status, int) and status > 0:
+            return _is_transient_status(status)
+        if any(_TRANSIENT_ERROR_NAME_RE.search(cls.__name__) for cls in type(error).__mro__):
+            return True
+        seen.add(id(error))
+        error = error.__cause__ or error.__context__
+    return False
+
+
+def with_retry(
+    max_attempts: int = 3,
+    base_delay: float = 1.0,
+    jitter: float = 0.5
+) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """Retry an async prompt call on transient provider failures.
+    
+    Waits ``base_delay * 2**attempt`` plus up to ``jitter`` seconds between attempts so
+    concurrent callers that failed together do not retry in lockstep.
+    """
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs) -> T:
+            for attempt in range(max_attempts):
+                try:
+                    return await func(*args, **kwargs)
+                except Exception as e:
+                    if attempt == max_attempts - 1 or not _is_transient(e):
+                        raise
+                    delay = base_delay * 2 ** attempt + random.uniform(0, jitter)
+                    print(f"🔄 {func.__name__} failed ({e}); retrying in {delay:.1f}s (attempt {attempt + 2}/{max_attempts})")
+                    await asyncio.sleep(delay)
+        return wrapper
+    return decorator
 
 def extract_boxed_solution(text: str) -> Optional[str]:
     """
@@ -130,6 +197,7 @@ def validate_and_parse_output(text: str, skip_validation: bool = False) -> tuple
     print("   Raw output preview:", text[:200] + "..." if len(text) > 200 else text)
     return text, True
 
+@with_retry()
 async def execute_prompt_with_savepoint(
     handler: PromptHandler,
     prompt_id: str,
@@ -183,8 +251,9 @@ async def execute_prompt_with_savepoint(
     
     response = await handler.execute_prompt(request)
     
-    # Skip validation and parsing if content comes from a savepoint (already parsed)
-    if response.was_cached:
+    # Skip validation and parsing if content comes from a savepoint (already parsed);
+    # prompt-cache hits hold the raw model output and are validated like fresh output
+    if response.was_cached and not response.from_prompt_cache:
         parsed_content = response.content
         print(f"📋 Using cached content from savepoint '{savepoint_id}' - skipping validation/parsing")
     else:
@@ -192,8 +261,8 @@ async def execute_prompt_with_savepoint(
         parsed_content, needs_retry = validate_and_parse_output(response.content, skip_validation)
         if needs_retry:
             print(f"🔄 Retrying prompt '{prompt_id}' due to missing output tags...")
-            # Retry the prompt once
-            retry_response = await handler.execute_prompt(request)
+            # Retry the prompt once, bypassing any savepoint/cached copy of the bad output
+            retry_response = await handler.execute_prompt(replace(request, force_regenerate=True))
             parsed_content, needs_retry = validate_and_parse_output(retry_response.content, skip_validation)
             if needs_retry:
                 print(f"⚠️ Warning: Retry failed for prompt '{prompt_id}', using raw output")
@@ -263,8 +332,9 @@ async def execute_prompt(
     
     response = await handler.execute_prompt(request)
     
-    # Skip validation and parsing if content comes from a savepoint (already parsed)
-    if response.was_cached:
+    # Skip validation and parsing if content comes from a savepoint (already parsed);
+    # prompt-cache hits hold the raw model output and are validated like fresh output
+    if response.was_cached and not response.from_prompt_cache:
         parsed_content = response.content
         print(f"📋 Using cached content from savepoint - skipping validation/parsing")
     else:
@@ -272,8 +342,8 @@ async def execute_prompt(
         parsed_content, needs_retry = validate_and_parse_output(response.content, skip_validation)
         if needs_retry:
             print(f"🔄 Retrying prompt '{prompt_id}' due to missing output tags...")
-            # Retry the prompt once
-            retry_response = await handler.execute_prompt(request)
+            # Retry the prompt once, bypassing any savepoint/cached copy of the bad output
+            retry_response = await handler.execute_prompt(replace(request, force_regenerate=True))
             parsed_content, needs_retry = validate_and_parse_output(retry_response.content, skip_validation)
             if needs_retry:
                 print(f"⚠️ Warning: Retry failed for prompt '{prompt_id}', using raw output")
@@ -300,6 +370,7 @@ async def execute_prompt(
     return response
 
 
+@with_retry()
 async def execute_messages_with_savepoint(
     handler: PromptHandler,
     conversation_history: list,
@@ -343,11 +414,11 @@ async def execute_messages_with_savepoint(
                 # Handle JSON parsing if requested
                 json_parsed = False
                 json_errors = None
+                parsed_content = None
                 
                 if expect_json and json_schema:
                     try:
-                        from llm_output_parser import parse_json
-                        parsed_content = parse_json(cached_content, strict=False)
+                        parsed_content = parse_json_response(cached_content)
                         
                         if parsed_content is not None:
                             cached_content = json.dumps(parsed_content, indent=2)
@@ -370,7 +441,8 @@ async def execute_messages_with_savepoint(
                     model_used=model_name,
                     execution_time=duration,
                     json_parsed=json_parsed,
-                    json_errors=json_errors
+                    json_errors=json_errors,
+                    json_data=parsed_content if json_parsed else None
                 )
     
     # Execute the conversation with custom history
@@ -422,6 +494,23 @@ async def execute_messages_with_savepoint(
         if savepoint_id and handler.savepoint_repo:
             await handler.savepoint_repo.save_savepoint(savepoint_id, final_content)
         
+        # Handle JSON parsing if requested, as for content loaded from a savepoint
+        json_parsed = False
+        json_errors = None
+        json_data = None
+        
+        if expect_json and json_schema:
+            try:
+                json_data = parse_json_response(final_content)
+                
+                if json_data is not None:
+                    final_content = json.dumps(json_data, indent=2)
+                    json_parsed = True
+                else:
+                    json_errors = "Failed to extract valid JSON from response"
+            except Exception as e:
+                json_errors = f"JSON parsing error: {e}"
+        
         end_time = time.time()
         duration = end_time - start_time
         
@@ -437,8 +526,9 @@ async def execute_messages_with_savepoint(
             was_cached=False,
             model_used=model_name,
             execution_time=duration,
-            json_parsed=False,  # Chat completion doesn't support JSON parsing
-            json_errors=None
+            json_parsed=json_parsed,
+            json_errors=json_errors,
+            json_data=json_data if json_parsed else None
         )
         
     except Exception as e:
@@ -3,10 +3,13 @@ from .ollama_provider import OllamaProvider
 from .lm_studio_provider import LMStudioProvider
 from .langchain_provider import LangChainProvider
 from .llama_cpp_provider import LlamaCppProvider
+from .throttled_provider import ThrottledModelProvider, TokenThrottle
 
 __all__ = [
     'OllamaProvider',
     'LMStudioProvider', 
     'LangChainProvider',
-    'LlamaCppProvider'
+    'LlamaCppProvider',
+    'ThrottledModelProvider',
+    'TokenThrottle'
 ] 
\ No newline at end of file
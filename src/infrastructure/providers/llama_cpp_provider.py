@@ -218,7 +218,7 @@ class LlamaCppProvider(ModelProvider):
             )
             
             if response.status_code != 200:
-                raise ModelProviderError(f"llama.cpp API error: {response.status_code} - {response.text}")
+                raise ModelProviderError(f"llama.cpp API error: {response.status_code} - {response.text}", status_code=response.status_code)
             
             response_data = response.json()
             response_text = response_data.get('content', '')
@@ -244,7 +244,7 @@ class LlamaCppProvider(ModelProvider):
                 )
                 
                 if response.status_code != 200:
-                    raise ModelProviderError(f"llama.cpp API error on continuation: {response.status_code} - {response.text}")
+                    raise ModelProviderError(f"llama.cpp API error on continuation: {response.status_code} - {response.text}", status_code=response.status_code)
                 
                 response_data = response.json()
                 response_text = response_data.get('content', '')
@@ -329,7 +329,7 @@ class LlamaCppProvider(ModelProvider):
             )
             
             if response.status_code != 200:
-                raise ModelProviderError(f"llama.cpp API error: {response.status_code} - {response.text}")
+                raise ModelProviderError(f"llama.cpp API error: {response.status_code} - {response.text}", status_code=response.status_code)
             
             response_data = response.json()
             response_text = response_data.get('content', '')
@@ -413,7 +413,7 @@ class LlamaCppProvider(ModelProvider):
             )
             
             if response.status_code != 200:
-                raise ModelProviderError(f"llama.cpp API error: {response.status_code} - {response.text}")
+                raise ModelProviderError(f"llama.cpp API error: {response.status_code} - {response.text}", status_code=response.status_code)
             
             # Process streaming response
             for line in response.iter_lines():
@@ -513,6 +513,10 @@ class LlamaCppProvider(ModelProvider):
             payload['top_k'] = 40
         if 'repeat_penalty' not in payload:
             payload['repeat_penalty'] = 1.1
+        # Let the server reuse the KV cache of a matching prompt prefix; calls that branch off
+        # one conversation (such as the character chunk prompts) share everything but the last turn
+        if 'cache_prompt' not in payload:
+            payload['cache_prompt'] = True
         
         # Log context length configuration for debugging
         if 'n_ctx' in payload:
@@ -613,7 +617,7 @@ class LlamaCppProvider(ModelProvider):
                 )
                 
                 if response.status_code != 200:
-                    raise ModelProviderError(f"llama.cpp API error: {response.status_code} - {response.text}")
+                    raise ModelProviderError(f"llama.cpp API error: {response.status_code} - {response.text}", status_code=response.status_code)
                 
                 response_data = response.json()
                 response_text = response_data.get('content', '')
@@ -53,7 +53,8 @@ class OllamaEmbeddingProvider:
                 if response.status != 200:
                     error_text = await response.text()
                     raise ModelProviderError(
-                        f"Ollama embedding API error: {response.status} - {error_text}"
+                        f"Ollama embedding API error: {response.status} - {error_text}",
+                        status_code=response.status
                     )
                 
                 result = await response.json()
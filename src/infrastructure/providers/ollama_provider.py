@@ -6,12 +6,79 @@ import random
 import subprocess
 import sys
 import re
-from typing import List, Dict, Any, Optional, AsyncGenerator
+import threading
+from typing import List, Dict, Any, Optional, AsyncGenerator, Iterable
 from domain.value_objects.model_config import ModelConfig
 from domain.exceptions import ModelProviderError
 from application.interfaces.model_provider import ModelProvider
 
 
+async def _iterate_in_thread(iterator: Iterable[Any]) -> AsyncGenerator[List[Any], None]:
+    """Drain a blocking iterator in a worker thread, yielding the chunks that have arrived.
+    
+    The ollama client's streaming response blocks on the network for every chunk, so
+    iterating it directly stalls the event loop (and every concurrent chapter) for the
+    whole generation. Chunks are handed over in batches so a fast stream costs one
+    loop wake-up per batch rather than per token.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+    stop = threading.Event()
+    done = object()
+    
+    def put(item: Any) -> None:
+        try:
+            loop.call_soon_threadsafe(queue.put_nowait, item)
+        except RuntimeError:
+            # Event loop already closed; nobody is listening any more
+            stop.set()
+    
+    def pump() -> None:
+        try:
+            for item in iterator:
+                if stop.is_set():
+                    break
+                put(item)
+        except BaseException as e:
+            put(_StreamFailure(e))
+        finally:
+            put(done)
+    
+    pump_future = loop.run_in_executor(None, pump)
+    try:
+        finished = False
+        while not finished:
+            arrived = [await queue.get()]
+            while not queue.empty():
+                arrived.append(queue.get_nowait())
+            
+            batch, failure = [], None
+            for item in arrived:
+                if item is done:
+                    finished = True
+                elif isinstance(item, _StreamFailure):
+                    failure = item.error
+                else:
+                    batch.append(item)
+            
+            # Hand over what arrived before a failure, then surface it
+            if batch:
+                yield batch
+            if failure is not None:
+                raise failure
+    finally:
+        stop.set()
+        if pump_future.done():
+            pump_future.result()
+
+
+class _StreamFailure:
+    """Carries an exception raised by the streaming iterator back to the event loop."""
+    
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
 class OllamaProvider(ModelProvider):
     """Ollama model provider implementation."""
     
@@ -376,48 +443,49 @@ class OllamaProvider(ModelProvider):
             content_buffer = ""
             thinking_complete = False
             
-            for chunk in stream:
-                # Handle thinking output (new Ollama thinking feature)
-                if 'message' in chunk and 'thinking' in chunk['message'] and chunk['message']['thinking']:
-                    thinking_buffer += chunk['message']['thinking']
-                    # Yield thinking content as it comes
-                    yield chunk['message']['thinking']
-                
-                # Handle content output
-                if 'message' in chunk and 'content' in chunk['message'] and chunk['message']['content']:
-                    content = chunk['message']['content']
-                    content_buffer += content
+            async for chunks in _iterate_in_thread(stream):
+                for chunk in chunks:
+                    # Handle thinking output (new Ollama thinking feature)
+                    if 'message' in chunk and 'thinking' in chunk['message'] and chunk['message']['thinking']:
+                        thinking_buffer += chunk['message']['thinking']
+                        # Yield thinking content as it comes
+                        yield chunk['message']['thinking']
+                
+                    # Handle content output
+                    if 'message' in chunk and 'content' in chunk['message'] and chunk['message']['content']:
+                        content = chunk['message']['content']
+                        content_buffer += content
                     
-                    # Process the buffer to handle legacy think tags
-                    while True:
-                        if not in_think_tag:
-                            # Look for start of think tag
-                            think_start = content_buffer.find('<think>')
-                            if think_start != -1:
-                                # Yield content before think tag
-                                if think_start > 0:
-                                    yield content_buffer[:think_start]
-                                # Remove content up to and including think tag start
-                                content_buffer = content_buffer[think_start + 7:]  # 7 is len('<think>')
-                                in_think_tag = True
-                                continue
-                            else:
-                                # No think tag found, yield the buffer
-                                if content_buffer:
-                                    yield content_buffer
-                                    content_buffer = ""
-                                break
-                        else:
-                            # We're inside a think tag, look for end
-                            think_end = content_buffer.find('</think>')
-                            if think_end != -1:
-                                # Remove content up to and including think tag end
-                                content_buffer = content_buffer[think_end + 8:]  # 8 is len('</think>')
-                                in_think_tag = False
-                                continue
+                        # Process the buffer to handle legacy think tags
+                        while True:
+                            if not in_think_tag:
+                                # Look for start of think tag
+                                think_start = content_buffer.find('<think>')
+                                if think_start != -1:
+                                    # Yield content before think tag
+                                    if think_start > 0:
+                                        yield content_buffer[:think_start]
+                                    # Remove content up to and including think tag start
+                                    content_buffer = content_buffer[think_start + 7:]  # 7 is len('<think>')
+                                    in_think_tag = True
+                                    continue
+                                else:
+                                    # No think tag found, yield the buffer
+                                    if content_buffer:
+                                        yield content_buffer
+                                        content_buffer = ""
+                                    break
                             else:
-                                # Think tag not complete, keep buffering
-                                break
+                                # We're inside a think tag, look for end
+                                think_end = content_buffer.find('</think>')
+                                if think_end != -1:
+                                    # Remove content up to and including think tag end
+                                    content_buffer = content_buffer[think_end + 8:]  # 8 is len('</think>')
+                                    in_think_tag = False
+                                    continue
+                                else:
+                                    # Think tag not complete, keep buffering
+                                    break
             
             # Yield any remaining content (outside of think tags)
             if content_buffer and not in_think_tag:
@@ -0,0 +1,167 @@
+"""Rate-limited wrapper around a model provider."""
+
+import asyncio
+import json
+import time
+from typing import Any, AsyncGenerator, Dict, Iterable, List, Optional
+
+from application.interfaces.model_provider import ModelProvider
+from domain.value_objects.model_config import ModelConfig
+
+
+def estimate_tokens(texts: Iterable[str]) -> int:
+    """Rough token count (about four characters per token) without running a tokenizer."""
+    return sum(len(text) for text in texts) // 4
+
+
+class TokenThrottle:
+    """Requests-per-minute and tokens-per-minute budgets shared by concurrent model calls.
+
+    Both budgets refill continuously. A call reserves one request and its estimated
+    tokens up front, waiting until both are available, and afterwards ``refund``
+    settles the difference between the estimate and what the call actually used.
+    """
+
+    def __init__(self, requests_per_minute: Optional[int] = None, tokens_per_minute: Optional[int] = None):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._requests = float(requests_per_minute or 0)
+        self._tokens = float(tokens_per_minute or 0)
+        self._updated = time.monotonic()
+        # Waiters queue on the lock, so reservations are granted in arrival order
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._updated = now
+        if self.requests_per_minute:
+            self._requests = min(self.requests_per_minute, self._requests + elapsed * self.requests_per_minute / 60)
+        if self.tokens_per_minute:
+            self._tokens = min(self.tokens_per_minute, self._tokens + elapsed * self.tokens_per_minute / 60)
+
+    async def acquire(self, tokens: int) -> None:
+        """Wait until a request slot and ``tokens`` tokens are available, then take them."""
+        # A single call larger than the whole budget waits for a full bucket instead of forever
+        if self.tokens_per_minute:
+            tokens = min(tokens, self.tokens_per_minute)
+        async with self._lock:
+            while True:
+                self._refill()
+                wait = 0.0
+                if self.requests_per_minute and self._requests < 1:
+                    wait = (1 - self._requests) * 60 / self.requests_per_minute
+                if self.tokens_per_minute and self._tokens < tokens:
+                    wait = max(wait, (tokens - self._tokens) * 60 / self.tokens_per_minute)
+                if wait <= 0:
+                    break
+                await asyncio.sleep(wait)
+            if self.requests_per_minute:
+                self._requests -= 1
+            if self.tokens_per_minute:
+                self._tokens -= tokens
+
+    def refund(self, tokens: int) -> None:
+        """Return unused reserved tokens; a negative amount charges for an underestimate."""
+        if self.tokens_per_minute:
+            self._refill()
+            self._tokens = min(self.tokens_per_minute, self._tokens + tokens)
+
+
+class ThrottledModelProvider(ModelProvider):
+    """Model provider that passes every generation call through a ``TokenThrottle``."""
+
+    def __init__(self, provider: ModelProvider, throttle: TokenThrottle, completion_tokens: int = 1000):
+        self.provider = provider
+        self.throttle = throttle
+        # Completion length is unknown before the call, so reserve a typical amount
+        self.completion_tokens = completion_tokens
+
+    def __getattr__(self, name: str) -> Any:
+        # Provider-specific attributes (host, context_length, ...) stay reachable
+        return getattr(self.provider, name)
+
+    async def _reserve(self, prompt_texts: Iterable[str]) -> int:
+        reserved = estimate_tokens(prompt_texts) + self.completion_tokens
+        await self.throttle.acquire(reserved)
+        return reserved
+
+    async def generate_text(
+        self,
+        messages: List[Dict[str, str]],
+        model_config: ModelConfig,
+        seed: Optional[int] = None,
+        format_type: Optional[str] = None,
+        min_word_count: int = 1,
+        debug: bool = False,
+        stream: bool = False
+    ) -> str:
+        prompt = [message.get("content", "") for message in messages]
+        reserved = await self._reserve(prompt)
+        response = await self.provider.generate_text(
+            messages, model_config, seed=seed, format_type=format_type,
+            min_word_count=min_word_count, debug=debug, stream=stream
+        )
+        self.throttle.refund(reserved - estimate_tokens([*prompt, response]))
+        return response
+
+    async def generate_multistep_conversation(
+        self,
+        user_messages: List[str],
+        model_config: ModelConfig,
+        system_message: Optional[str] = None,
+        seed: Optional[int] = None,
+        debug: bool = False,
+        stream: bool = False
+    ) -> str:
+        prompt = [*user_messages, system_message or ""]
+        reserved = await self._reserve(prompt)
+        response = await self.provider.generate_multistep_conversation(
+            user_messages, model_config, system_message=system_message, seed=seed, debug=debug, stream=stream
+        )
+        self.throttle.refund(reserved - estimate_tokens([*prompt, response]))
+        return response
+
+    async def generate_json(
+        self,
+        messages: List[Dict[str, str]],
+        model_config: ModelConfig,
+        required_attributes: List[str],
+        seed: Optional[int] = None,
+        debug: bool = False
+    ) -> Dict[str, Any]:
+        prompt = [message.get("content", "") for message in messages]
+        reserved = await self._reserve(prompt)
+        response = await self.provider.generate_json(
+            messages, model_config, required_attributes, seed=seed, debug=debug
+        )
+        self.throttle.refund(reserved - estimate_tokens([*prompt, json.dumps(response)]))
+        return response
+
+    async def stream_text(
+        self,
+        messages: List[Dict[str, str]],
+        model_config: ModelConfig,
+        seed: Optional[int] = None,
+        format_type: Optional[str] = None
+    ) -> AsyncGenerator[str, None]:
+        prompt = [message.get("content", "") for message in messages]
+        reserved = await self._reserve(prompt)
+        streamed = 0
+        try:
+            async for chunk in self.provider.stream_text(
+                messages, model_config, seed=seed, format_type=format_type
+            ):
+                streamed += len(chunk)
+                yield chunk
+        finally:
+            self.throttle.refund(reserved - estimate_tokens(prompt) - streamed // 4)
+
+    async def is_model_available(self, model_config: ModelConfig) -> bool:
+        return await self.provider.is_model_available(model_config)
+
+    async def download_model(self, model_config: ModelConfig) -> None:
+        await self.provider.download_model(model_config)
+
+    async def get_supported_providers(self) -> List[str]:
+        return await self.provider.get_supported_providers()
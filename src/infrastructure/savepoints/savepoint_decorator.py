@@ -2,8 +2,9 @@
 
 import functools
 import inspect
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Dict, Optional, Set
 from domain.repositories.savepoint_repository import SavepointRepository
+from domain.exceptions import StepNotFoundError
 
 
 def with_savepoint(
@@ -70,15 +71,34 @@ class SavepointManager:
         """Check if a step has been completed."""
         return await self.savepoint_repo.has_savepoint(step_name)
     
-    async def load_step(self, step_name: str) -> Optional[Any]:
-        """Load a completed step."""
+    async def list_steps(self, prefix: str = "") -> Set[str]:
+        """List completed step names under a prefix, e.g. {"outline", "scene_1"} for "chapter_1"."""
+        return await self.savepoint_repo.list_step_names(prefix)
+    
+    async def load_step(self, step_name: str, required: bool = False) -> Optional[Any]:
+        """Load a completed step; with required=True a missing step raises StepNotFoundError."""
+        print(f"[SAVEPOINT] loading: {step_name}")
+        result = await self.savepoint_repo.load_savepoint(step_name)
+        # None is also a legitimate saved value, so only probe for the file when it comes back
+        if result is None and required and not await self.savepoint_repo.has_savepoint(step_name):
+            raise StepNotFoundError(f"Savepoint step not found: {step_name}")
+        return result
+    
+    async def load_step_with_metadata(self, step_name: str) -> Optional[Dict[str, Any]]:
+        """Load a completed step as {"_frontmatter": ..., "_body": ...}."""
         print(f"[SAVEPOINT] loading: {step_name}")
-        return await self.savepoint_repo.load_savepoint(step_name)
+        return await self.savepoint_repo.load_savepoint_with_metadata(step_name)
     
-    async def save_step(self, step_name: str, result: Any) -> None:
-        """Manually save a step result."""
+    async def save_step(self, step_name: str, result: Any, flush: bool = False) -> None:
+        """Manually save a step result; flush=True also syncs all pending writes to disk."""
         print(f"[SAVEPOINT] Saving: {step_name}")
         await self.savepoint_repo.save_savepoint(step_name, result)
+        if flush:
+            await self.flush_group()
+    
+    async def flush_group(self) -> None:
+        """Sync the savepoints written since the last flush, e.g. at the end of a chapter."""
+        await self.savepoint_repo.flush_savepoints()
     
     async def clear_story_savepoints(self) -> None:
         """Clear all savepoints for the current story."""
@@ -155,6 +155,37 @@ class PgVectorStore:
                 logger.error(f"Failed to store embedding: {e}")
                 raise StorageError(f"Failed to store embedding: {e}")
     
+    async def store_embeddings(self, rows: List[Dict[str, Any]]) -> List[int]:
+        """Store several pieces of content in one transaction and return their IDs in order.
+        
+        Each row holds the keyword arguments of ``store_embedding``.
+        """
+        if not rows:
+            return []
+        async with self._pool.acquire() as conn:
+            try:
+                async with conn.transaction():
+                    chunk_ids = []
+                    for row in rows:
+                        metadata = row.get("metadata")
+                        chunk_ids.append(await conn.fetchval(
+                            """
+                            INSERT INTO content_chunks 
+                            (story_id, content_type, content_subtype, title, content, metadata, 
+                             embedding, chapter_number, scene_number)
+                            VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
+                            RETURNING id
+                            """,
+                            row["story_id"], row["content_type"], row.get("content_subtype"), row.get("title"),
+                            row["content"], json.dumps(metadata) if metadata else None,
+                            row["embedding"], row.get("chapter_number"), row.get("scene_number")
+                        ))
+                logger.debug(f"Stored {len(chunk_ids)} embeddings in one transaction")
+                return chunk_ids
+            except Exception as e:
+                logger.error(f"Failed to store embeddings: {e}")
+                raise StorageError(f"Failed to store embeddings: {e}")
+    
     async def search_similar(
         self,
         query_embedding: List[float],
@@ -284,6 +315,34 @@ class PgVectorStore:
                 logger.error(f"Failed to get story content: {e}")
                 raise StorageError(f"Failed to get story content: {e}")
     
+    async def count_content_by_type_and_metadata(
+        self,
+        story_id: int,
+        content_type: str,
+        metadata_filters: Optional[Dict[str, Any]] = None
+    ) -> int:
+        """Count content chunks by type and optional metadata filters."""
+        async with self._pool.acquire() as conn:
+            try:
+                query_parts = [
+                    "SELECT COUNT(*) FROM content_chunks WHERE story_id = $1 AND content_type = $2"
+                ]
+                params = [story_id, content_type]
+                param_count = 2
+                
+                # Add metadata filters if provided
+                if metadata_filters:
+                    for key, value in metadata_filters.items():
+                        param_count += 1
+                        query_parts.append(f"AND metadata->>'{key}' = ${param_count}")
+                        params.append(str(value))
+                
+                return await conn.fetchval(" ".join(query_parts), *params)
+                
+            except Exception as e:
+                logger.error(f"Failed to count {content_type} content for story {story_id}: {e}")
+                raise StorageError(f"Failed to count {content_type} content for story {story_id}: {e}")
+    
     async def delete_content_by_type_and_metadata(
         self,
         story_id: int,
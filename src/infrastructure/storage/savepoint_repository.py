@@ -1,13 +1,22 @@
 """Filesystem savepoint repository implementation."""
 
 import asyncio
+import os
 import yaml
 import re
 from pathlib import Path
-from typing import Optional, Any, Dict, Union
+from typing import Optional, Any, Dict, Set, Union
 from domain.repositories.savepoint_repository import SavepointRepository
 from domain.exceptions import StorageError
 
+# Prefer the libyaml-backed emitter/parser when PyYAML was built with it;
+# savepoint bodies can be whole chapters, where the pure-Python codec dominates.
+_YAML_DUMPER = getattr(yaml, "CDumper", yaml.Dumper)
+_YAML_SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# fdatasync skips the metadata flush where the platform has it (not macOS/Windows)
+_FDATASYNC = getattr(os, "fdatasync", os.fsync)
+
 
 class FilesystemSavepointRepository(SavepointRepository):
     """Filesystem-based savepoint repository implementation."""
@@ -16,6 +25,8 @@ class FilesystemSavepointRepository(SavepointRepository):
         self.base_path = Path(base_path)
         self.base_path.mkdir(exist_ok=True)
         self._current_story_dir: Optional[Path] = None
+        # Files written since the last flush_savepoints() call
+        self._unflushed: Set[Path] = set()
     
     def set_story_directory(self, prompt_filename: str) -> None:
         """Set the savepoint directory for the current story based on prompt filename."""
@@ -130,18 +141,18 @@ class FilesystemSavepointRepository(SavepointRepository):
                     body = data["_body"]
                     
                     # Convert frontmatter to YAML
-                    yaml_frontmatter = yaml.dump(frontmatter, default_flow_style=False, allow_unicode=True)
+                    yaml_frontmatter = yaml.dump(frontmatter, Dumper=_YAML_DUMPER, default_flow_style=False, allow_unicode=True)
                     
                     # Format the body content
                     if isinstance(body, str):
                         body_content = body
                     else:
-                        body_content = yaml.dump(body, default_flow_style=False, allow_unicode=True)
+                        body_content = yaml.dump(body, Dumper=_YAML_DUMPER, default_flow_style=False, allow_unicode=True)
                     
                     content = f"---\n{yaml_frontmatter}---\n\n# Savepoint: {step_name}\n\n{body_content}"
                 else:
                     # Handle regular complex data types
-                    yaml_data = yaml.dump(data, default_flow_style=False, allow_unicode=True)
+                    yaml_data = yaml.dump(data, Dumper=_YAML_DUMPER, default_flow_style=False, allow_unicode=True)
                     content = f"---\n{yaml_data}---\n\n# Savepoint: {step_name}\n\nData saved in YAML frontmatter above."
             
             # Save as markdown
@@ -150,9 +161,34 @@ class FilesystemSavepointRepository(SavepointRepository):
                 content,
                 encoding='utf-8'
             )
+            self._unflushed.add(savepoint_path)
         except Exception as e:
             raise StorageError(f"Failed to save savepoint {step_name}: {e}") from e
     
+    async def flush_savepoints(self) -> None:
+        """Sync every savepoint file written since the last flush, in one worker-thread hop."""
+        if not self._unflushed:
+            return
+        
+        pending, self._unflushed = self._unflushed, set()
+        
+        def _sync_all() -> None:
+            for path in pending:
+                try:
+                    fd = os.open(path, os.O_RDONLY)
+                except FileNotFoundError:
+                    # Deleted since it was written; nothing to make durable
+                    continue
+                try:
+                    _FDATASYNC(fd)
+                finally:
+                    os.close(fd)
+        
+        try:
+            await asyncio.to_thread(_sync_all)
+        except Exception as e:
+            raise StorageError(f"Failed to flush savepoints: {e}") from e
+    
     async def load_savepoint(self, step_name: str) -> Optional[Any]:
         """Load data from a savepoint."""
         try:
@@ -174,7 +210,7 @@ class FilesystemSavepointRepository(SavepointRepository):
                 if frontmatter_match:
                     yaml_content = frontmatter_match.group(1)
                     try:
-                        frontmatter_data = yaml.safe_load(yaml_content)
+                        frontmatter_data = yaml.load(yaml_content, Loader=_YAML_SAFE_LOADER)
                         
                         # Check if this is our new savepoint structure with _frontmatter and _body
                         if isinstance(frontmatter_data, dict) and "_frontmatter" in frontmatter_data and "_body" in frontmatter_data:
@@ -216,7 +252,7 @@ class FilesystemSavepointRepository(SavepointRepository):
                 if frontmatter_match:
                     yaml_content = frontmatter_match.group(1)
                     try:
-                        frontmatter_data = yaml.safe_load(yaml_content)
+                        frontmatter_data = yaml.load(yaml_content, Loader=_YAML_SAFE_LOADER)
                         
                         # Check if this is our new savepoint structure with _frontmatter and _body
                         if isinstance(frontmatter_data, dict) and "_frontmatter" in frontmatter_data and "_body" in frontmatter_data:
@@ -254,6 +290,29 @@ class FilesystemSavepointRepository(SavepointRepository):
         except Exception as e:
             raise StorageError(f"Failed to check savepoint existence {step_name}: {e}") from e
     
+    async def list_step_names(self, prefix: str = "") -> Set[str]:
+        """List the step names stored directly under a step prefix (e.g. 'chapter_1')."""
+        if not self._current_story_dir:
+            return set()
+        
+        directory = self._current_story_dir.joinpath(*[part for part in prefix.replace('\\', '/').split('/') if part])
+        
+        def _scan() -> Set[str]:
+            # One directory read instead of a stat() per candidate step
+            try:
+                with os.scandir(directory) as entries:
+                    return {
+                        entry.name[:-3] for entry in entries
+                        if entry.name.endswith(".md") and entry.is_file()
+                    }
+            except FileNotFoundError:
+                return set()
+        
+        try:
+            return await asyncio.to_thread(_scan)
+        except Exception as e:
+            raise StorageError(f"Failed to list savepoints under {prefix}: {e}") from e
+    
     async def delete_savepoint(self, step_name: str) -> bool:
         """Delete a savepoint."""
         try:
@@ -1,6 +1,9 @@
 """Main CLI entry point."""
 
 import asyncio
+import logging
+import logging.handlers
+import queue
 import sys
 import time
 from pathlib import Path
@@ -71,6 +74,8 @@ class CLIApplication:
         # Get services from container
         story_service = self.container.story_generation_service()
         generation_settings = self.config_loader.get_generation_settings()
+        if generation_settings.debug:
+            logging.getLogger("application.strategies").setLevel(logging.DEBUG)
         
         # Extract prompt filename for savepoints
         prompt_filename = Path(args.prompt).name
@@ -110,10 +115,38 @@ class CLIApplication:
         print(f"⏱️  Total time: {duration:.2f} seconds")
 
 
+def _install_event_loop_policy() -> None:
+    """Use uvloop's event loop when it is installed; stock asyncio otherwise."""
+    try:
+        import uvloop
+    except ImportError:
+        return
+    uvloop.install()
+
+
+def _configure_logging() -> logging.handlers.QueueListener:
+    """Route progress logging through a queue so the event loop never blocks on stdout."""
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    root = logging.getLogger()
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    logging.getLogger("application.strategies").setLevel(logging.INFO)
+
+    console = logging.StreamHandler(sys.stdout)
+    console.setFormatter(logging.Formatter("%(message)s"))
+    listener = logging.handlers.QueueListener(log_queue, console, respect_handler_level=True)
+    listener.start()
+    return listener
+
+
 def main():
     """Main CLI entry point."""
-    app = CLIApplication()
-    asyncio.run(app.run())
+    _install_event_loop_policy()
+    listener = _configure_logging()
+    try:
+        app = CLIApplication()
+        asyncio.run(app.run())
+    finally:
+        listener.stop()
 
 
 if __name__ == "__main__":
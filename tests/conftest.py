@@ -0,0 +1,7 @@
+"""Shared pytest configuration."""
+
+import sys
+from pathlib import Path
+
+# Application modules import each other relative to src (e.g. ``from domain.exceptions import ...``)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
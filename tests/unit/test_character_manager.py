@@ -0,0 +1,89 @@
+"""Unit tests for CharacterManager."""
+
+import asyncio
+import json
+
+import pytest
+
+character_manager = pytest.importorskip("application.strategies.outline_chapter.character_manager")
+
+from domain.value_objects.generation_settings import GenerationSettings
+from infrastructure.prompts.prompt_handler import PromptHandler
+from infrastructure.prompts.prompt_loader import PromptLoader
+from infrastructure.savepoints.savepoint_decorator import SavepointManager
+from infrastructure.storage.savepoint_repository import FilesystemSavepointRepository
+
+PROMPTS_DIR = "src/application/strategies/outline_chapter/prompts"
+
+
+class StubProvider:
+    """Model provider returning one fixed response and recording each call."""
+
+    def __init__(self, response: str):
+        self.response = response
+        self.calls = []
+
+    async def generate_text(self, messages, model_config, **kwargs):
+        self.calls.append(messages)
+        return self.response
+
+
+def make_manager(tmp_path, provider, **config):
+    repo = FilesystemSavepointRepository(tmp_path)
+    handler = PromptHandler(provider, PromptLoader(PROMPTS_DIR), repo)
+    config.setdefault("models", {"logical_model": "ollama://stub", "initial_outline_writer": "ollama://stub"})
+    manager = character_manager.CharacterManager(
+        model_provider=provider,
+        config=config,
+        prompt_handler=handler,
+        system_message="",
+        savepoint_manager=SavepointManager(repo, "story.txt")
+    )
+    return manager
+
+
+class TestFusedCharacterChunks:
+    """Test cases for writing every character chunk with one structured call."""
+
+    def test_fused_chunks_saved_from_one_call(self, tmp_path):
+        """A seven-key JSON response saves every chunk without any per-chunk prompt."""
+        chunks = {chunk_type.removesuffix("_chunk"): f"{chunk_type} text" for chunk_type in character_manager._CHARACTER_CHUNK_TYPES}
+        provider = StubProvider(json.dumps(chunks))
+        manager = make_manager(tmp_path, provider, fuse_character_chunks=True)
+        conversation = [{"role": "user", "content": "sheet"}, {"role": "assistant", "content": "Ada's sheet"}]
+
+        async def run():
+            await manager._generate_character_chunks("Ada Lovelace", conversation, GenerationSettings())
+            await asyncio.gather(*manager._background_tasks)
+            return {
+                chunk_type: await manager.savepoint_manager.load_step(f"characters/Ada Lovelace/{chunk_type}")
+                for chunk_type in character_manager._CHARACTER_CHUNK_TYPES
+            }
+
+        saved = asyncio.run(run())
+
+        assert len(provider.calls) == 1
+        assert saved == {chunk_type: f"{chunk_type} text" for chunk_type in character_manager._CHARACTER_CHUNK_TYPES}
+
+
+class TestExtractionCache:
+    """Test cases for reusing name extractions across chapters."""
+
+    def test_cache_hit_saves_chapter_step(self, tmp_path):
+        """Names reused for an identical synopsis are saved as that chapter's step."""
+        provider = StubProvider('["Ada Lovelace", "Charles Babbage"]')
+        manager = make_manager(tmp_path, provider)
+        settings = GenerationSettings()
+
+        async def run():
+            first = await manager.extract_chapter_characters("The engine is unveiled.", 1, settings)
+            calls = len(provider.calls)
+            second = await manager.extract_chapter_characters("The engine is unveiled.", 2, settings)
+            saved = await manager.savepoint_manager.load_step("chapter_2/characters")
+            return first, second, calls, saved
+
+        first, second, calls, saved = asyncio.run(run())
+
+        assert first == second == ["Ada Lovelace", "Charles Babbage"]
+        assert len(provider.calls) == calls
+        assert json.loads(saved) == ["Ada Lovelace", "Charles Babbage"]
@@ -61,6 +61,18 @@ class TestModelConfig:
         assert config.name == "llama3:70b"
         assert config.provider == "ollama"
     
+    def test_create_from_mapping(self):
+        """Test parsing a config's models section by role."""
+        configs = ModelConfig.from_mapping({
+            "logical_model": "ollama://llama3:70b?temperature=0",
+            "scene_writer": "google://gemini-1.5-pro"
+        })
+        
+        assert set(configs) == {"logical_model", "scene_writer"}
+        assert configs["logical_model"].parameters["temperature"] == 0
+        assert configs["scene_writer"].provider == "google"
+        assert ModelConfig.from_mapping({}) == {}
+    
     def test_invalid_provider(self):
         """Test validation of invalid provider."""
         with pytest.raises(ValidationError, match="Invalid provider"):
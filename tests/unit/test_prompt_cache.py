@@ -0,0 +1,140 @@
+"""Unit tests for the persistent prompt response cache."""
+
+import asyncio
+
+from domain.value_objects.model_config import ModelConfig
+from infrastructure.prompts.prompt_cache import PromptCache
+from infrastructure.prompts.prompt_handler import PromptHandler, PromptRequest
+from infrastructure.prompts.prompt_loader import PromptLoader
+from infrastructure.prompts.prompt_wrapper import execute_prompt
+
+MESSAGES = [
+    {"role": "system", "content": "You are a novelist."},
+    {"role": "user", "content": "Write chapter one."},
+]
+
+
+class TestPromptCacheKey:
+    """Test cases for hashing requests into cache keys."""
+
+    def test_same_request_same_key(self):
+        """Equal requests hash to the same key, independent of dict key order."""
+        model = ModelConfig.from_string("ollama://llama3:70b")
+        reordered = [{"content": m["content"], "role": m["role"]} for m in MESSAGES]
+
+        assert PromptCache.make_key(MESSAGES, model, seed=1) == PromptCache.make_key(reordered, model, seed=1)
+
+    def test_every_input_changes_key(self):
+        """Messages, model, seed and format type all take part in the key."""
+        model = ModelConfig.from_string("ollama://llama3:70b")
+        base = PromptCache.make_key(MESSAGES, model, seed=1, format_type=None)
+        variants = [
+            PromptCache.make_key(MESSAGES[:1], model, seed=1),
+            PromptCache.make_key(list(reversed(MESSAGES)), model, seed=1),
+            PromptCache.make_key(MESSAGES, ModelConfig.from_string("ollama://llama3:8b"), seed=1),
+            PromptCache.make_key(MESSAGES, ModelConfig.from_string("ollama://llama3:70b?temperature=0"), seed=1),
+            PromptCache.make_key(MESSAGES, model, seed=2),
+            PromptCache.make_key(MESSAGES, model, seed=1, format_type="json"),
+        ]
+
+        assert len({base, *variants}) == len(variants) + 1
+
+
+class TestPromptCacheStorage:
+    """Test cases for storing and reading entries."""
+
+    def test_round_trip(self, tmp_path):
+        """A stored entry is returned unchanged, including non-ASCII text."""
+        cache = PromptCache(tmp_path / "cache.db")
+        entry = {"content": "Ça commence — chapter one", "tokens": 12}
+
+        cache.put("key", entry)
+
+        assert cache.get("key") == entry
+        cache.close()
+
+    def test_missing_key(self, tmp_path):
+        """An unknown key is a miss."""
+        cache = PromptCache(tmp_path / "cache.db")
+
+        assert cache.get("missing") is None
+        cache.close()
+
+    def test_put_replaces(self, tmp_path):
+        """Storing a key again replaces the previous entry."""
+        cache = PromptCache(tmp_path / "cache.db")
+
+        cache.put("key", {"content": "first"})
+        cache.put("key", {"content": "second"})
+
+        assert cache.get("key") == {"content": "second"}
+        cache.close()
+
+    def test_entries_persist_across_instances(self, tmp_path):
+        """Entries survive closing the cache and reopening the same file."""
+        path = tmp_path / "nested" / "cache.db"
+        cache = PromptCache(path)
+        cache.put("key", {"content": "kept"})
+        cache.close()
+
+        reopened = PromptCache(path)
+
+        assert reopened.get("key") == {"content": "kept"}
+        reopened.close()
+
+
+class StubProvider:
+    """Model provider returning one fixed response and counting calls."""
+
+    def __init__(self, response: str):
+        self.response = response
+        self.calls = 0
+
+    async def generate_text(self, messages, model_config, **kwargs):
+        self.calls += 1
+        return self.response
+
+
+def make_handler(tmp_path, provider):
+    (tmp_path / "greet.md").write_text("Greet {name}", encoding="utf-8")
+    return PromptHandler(provider, PromptLoader(str(tmp_path)), prompt_cache=PromptCache(tmp_path / "cache.db"))
+
+
+class TestPromptHandlerCache:
+    """Test cases for serving repeated prompts from the cache."""
+
+    def test_cache_hit_reported(self, tmp_path):
+        """A repeated request skips the model and is reported as cached."""
+        provider = StubProvider("<output>Hello Ada</output>")
+        handler = make_handler(tmp_path, provider)
+        request = PromptRequest(
+            prompt_id="greet", variables={"name": "Ada"}, model_config=ModelConfig.from_string("ollama://stub")
+        )
+
+        async def run():
+            return await handler.execute_prompt(request), await handler.execute_prompt(request)
+
+        fresh, cached = asyncio.run(run())
+
+        assert provider.calls == 1
+        assert not fresh.was_cached
+        assert cached.was_cached and cached.from_prompt_cache
+        assert cached.content == fresh.content
+        handler.prompt_cache.close()
+
+    def test_cache_hit_still_unwrapped(self, tmp_path):
+        """A cached answer holds the raw model output, so its output tags are still removed."""
+        provider = StubProvider("<output>Hello Ada</output>")
+        handler = make_handler(tmp_path, provider)
+        model_config = ModelConfig.from_string("ollama://stub")
+
+        async def run():
+            first = await execute_prompt(handler, "greet", {"name": "Ada"}, model_config=model_config)
+            second = await execute_prompt(handler, "greet", {"name": "Ada"}, model_config=model_config)
+            return first, second
+
+        first, second = asyncio.run(run())
+
+        assert provider.calls == 1
+        assert first.content == second.content == "Hello Ada"
+        handler.prompt_cache.close()
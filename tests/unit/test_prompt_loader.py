@@ -0,0 +1,70 @@
+"""Unit tests for PromptLoader."""
+
+import pytest
+
+from domain.exceptions import ConfigurationError
+from infrastructure.prompts.prompt_loader import PromptLoader
+
+
+def make_loader(tmp_path, **prompts):
+    """Write each prompt to a markdown file and return a loader for the directory."""
+    for name, text in prompts.items():
+        (tmp_path / f"{name}.md").write_text(text, encoding="utf-8")
+    return PromptLoader(str(tmp_path))
+
+
+class TestCompilePrompt:
+    """Test cases for rendering prompt slots."""
+
+    def test_fills_single_and_double_brace_slots(self, tmp_path):
+        """Both {{name}} and {name} slots are replaced, every time they appear."""
+        loader = make_loader(tmp_path, greet="Hello {{name}}, welcome to {place}. Bye {{name}}.")
+
+        render = loader.compile_prompt("greet")
+
+        assert render({"name": "Ada", "place": "London"}) == "Hello Ada, welcome to London. Bye Ada."
+
+    def test_missing_variables_left_as_written(self, tmp_path):
+        """Slots without a supplied variable keep their original braces."""
+        loader = make_loader(tmp_path, greet="Hello {{name}}, welcome to {place}.")
+
+        render = loader.compile_prompt("greet")
+
+        assert render({"name": "Ada"}) == "Hello Ada, welcome to {place}."
+        assert render({}) == "Hello {{name}}, welcome to {place}."
+
+    def test_values_converted_to_text(self, tmp_path):
+        """Non-string values are rendered with str()."""
+        loader = make_loader(tmp_path, chapter="Chapter {number} of {total}")
+
+        assert loader.compile_prompt("chapter")({"number": 3, "total": 12}) == "Chapter 3 of 12"
+
+    def test_values_not_rendered_again(self, tmp_path):
+        """A value that looks like a slot is inserted literally."""
+        loader = make_loader(tmp_path, quote="{first} then {second}")
+
+        assert loader.compile_prompt("quote")({"first": "{second}", "second": "B"}) == "{second} then B"
+
+    def test_compiled_once(self, tmp_path):
+        """The same renderer is reused until the cache is cleared."""
+        loader = make_loader(tmp_path, greet="Hello {name}")
+
+        render = loader.compile_prompt("greet")
+
+        assert loader.compile_prompt("greet") is render
+        loader.clear_cache()
+        assert loader.compile_prompt("greet") is not render
+
+    def test_load_prompt_matches_renderer(self, tmp_path):
+        """load_prompt renders through the compiled template, or returns it as is."""
+        loader = make_loader(tmp_path, greet="  Hello {{name}}\n")
+
+        assert loader.load_prompt("greet", {"name": "Ada"}) == "Hello Ada"
+        assert loader.load_prompt("greet") == "Hello {{name}}"
+
+    def test_missing_prompt_file(self, tmp_path):
+        """An unknown prompt name raises a configuration error."""
+        loader = make_loader(tmp_path)
+
+        with pytest.raises(ConfigurationError):
+            loader.compile_prompt("absent")
@@ -0,0 +1,103 @@
+"""Unit tests for the prompt wrapper's retry of transient provider failures."""
+
+import asyncio
+
+import pytest
+
+from domain.exceptions import ModelProviderError
+from infrastructure.prompts.prompt_wrapper import _is_transient, with_retry
+
+
+def wrapped(cause: BaseException) -> ModelProviderError:
+    """Wrap an error the way the providers do."""
+    try:
+        raise cause
+    except BaseException as e:
+        try:
+            raise ModelProviderError(f"generation failed: {e}") from e
+        except ModelProviderError as wrapper:
+            return wrapper
+
+
+class ReadTimeout(Exception):
+    """Stands in for an HTTP client's own timeout type (e.g. httpx.ReadTimeout)."""
+
+
+class ResponseError(Exception):
+    """Stands in for an HTTP client's status error (e.g. ollama.ResponseError)."""
+
+    def __init__(self, status_code: int):
+        super().__init__(f"status {status_code}")
+        self.status_code = status_code
+
+
+class TestIsTransient:
+    """Test cases for classifying provider failures."""
+
+    @pytest.mark.parametrize("cause", [
+        ConnectionRefusedError("refused"),
+        TimeoutError("timed out"),
+        asyncio.TimeoutError(),
+        ReadTimeout("read timed out"),
+        ResponseError(429),
+        ResponseError(503),
+    ])
+    def test_transient_causes(self, cause):
+        """Connection failures, timeouts, rate limits and server errors are retried."""
+        assert _is_transient(wrapped(cause))
+
+    @pytest.mark.parametrize("cause", [
+        ResponseError(404),
+        ResponseError(400),
+        FileNotFoundError("model not found"),
+        ValueError("Failed to parse JSON response"),
+    ])
+    def test_permanent_causes(self, cause):
+        """Missing models, bad requests and unparseable output are not retried."""
+        assert not _is_transient(wrapped(cause))
+
+    def test_bare_provider_error_is_permanent(self):
+        """The wrapper class alone does not make an error transient."""
+        assert not _is_transient(ModelProviderError("No embedding returned from Ollama API"))
+
+    def test_provider_error_status_code(self):
+        """A status code on the provider error itself decides."""
+        assert _is_transient(ModelProviderError("llama.cpp API error: 502", status_code=502))
+        assert not _is_transient(ModelProviderError("llama.cpp API error: 404", status_code=404))
+
+
+class TestWithRetry:
+    """Test cases for the with_retry decorator."""
+
+    def make_call(self, errors):
+        """Return a retried coroutine function raising the given errors in turn, then succeeding."""
+        calls = []
+
+        @with_retry(max_attempts=3, base_delay=0, jitter=0)
+        async def call():
+            calls.append(None)
+            if len(calls) <= len(errors):
+                raise errors[len(calls) - 1]
+            return "done"
+
+        return call, calls
+
+    def test_retries_transient_failure(self):
+        """A transient failure is retried until the call succeeds."""
+        call, calls = self.make_call([wrapped(ConnectionResetError()), wrapped(ResponseError(503))])
+        assert asyncio.run(call()) == "done"
+        assert len(calls) == 3
+
+    def test_permanent_failure_not_retried(self):
+        """A permanent failure is raised after the first attempt."""
+        call, calls = self.make_call([wrapped(ResponseError(404))])
+        with pytest.raises(ModelProviderError):
+            asyncio.run(call())
+        assert len(calls) == 1
+
+    def test_gives_up_after_max_attempts(self):
+        """The last transient failure is raised once the attempts run out."""
+        call, calls = self.make_call([wrapped(TimeoutError())] * 3)
+        with pytest.raises(ModelProviderError):
+            asyncio.run(call())
+        assert len(calls) == 3
@@ -0,0 +1,98 @@
+"""Unit tests for FilesystemSavepointRepository."""
+
+import asyncio
+
+from infrastructure.storage.savepoint_repository import FilesystemSavepointRepository
+
+
+def make_repository(tmp_path):
+    repository = FilesystemSavepointRepository(tmp_path)
+    repository.set_story_directory("story.txt")
+    return repository
+
+
+class TestListStepNames:
+    """Test cases for listing the steps saved under a prefix."""
+
+    def test_lists_steps_directly_under_prefix(self, tmp_path):
+        """Only the files in the prefix directory are listed, not nested steps."""
+        repository = make_repository(tmp_path)
+
+        async def run():
+            await repository.save_savepoint("chapter_1/outline", "outline")
+            await repository.save_savepoint("chapter_1/characters", ["Ada"])
+            await repository.save_savepoint("chapter_1/scenes/scene_1", "scene")
+            await repository.save_savepoint("chapter_2/outline", "outline")
+            await repository.save_savepoint("title", "Title")
+            return (
+                await repository.list_step_names("chapter_1"),
+                await repository.list_step_names("chapter_1/scenes"),
+                await repository.list_step_names(""),
+            )
+
+        chapter, scenes, top = asyncio.run(run())
+
+        assert chapter == {"outline", "characters"}
+        assert scenes == {"scene_1"}
+        assert top == {"title"}
+
+    def test_ignores_non_savepoint_files(self, tmp_path):
+        """Files without the savepoint extension are not steps."""
+        repository = make_repository(tmp_path)
+        (tmp_path / "story" / "notes.txt").write_text("notes", encoding="utf-8")
+
+        assert asyncio.run(repository.list_step_names()) == set()
+
+    def test_missing_prefix_is_empty(self, tmp_path):
+        """A prefix with nothing saved under it lists no steps."""
+        repository = make_repository(tmp_path)
+
+        assert asyncio.run(repository.list_step_names("chapter_9")) == set()
+
+    def test_without_story_directory_is_empty(self, tmp_path):
+        """Before a story directory is set there is nothing to list."""
+        repository = FilesystemSavepointRepository(tmp_path)
+
+        assert asyncio.run(repository.list_step_names("chapter_1")) == set()
+
+
+class TestFlushSavepoints:
+    """Test cases for syncing written savepoints to disk."""
+
+    def test_flush_clears_pending_writes(self, tmp_path):
+        """Every file written since the last flush is synced once, then forgotten."""
+        repository = make_repository(tmp_path)
+
+        async def run():
+            await repository.save_savepoint("chapter_1/outline", "outline")
+            await repository.save_savepoint("title", "Title")
+            pending = set(repository._unflushed)
+            await repository.flush_savepoints()
+            return pending
+
+        pending = asyncio.run(run())
+
+        assert pending == {tmp_path / "story" / "chapter_1" / "outline.md", tmp_path / "story" / "title.md"}
+        assert repository._unflushed == set()
+        assert asyncio.run(repository.load_savepoint("title")) == "Title"
+
+    def test_flush_skips_deleted_files(self, tmp_path):
+        """A savepoint deleted before the flush does not fail it."""
+        repository = make_repository(tmp_path)
+
+        async def run():
+            await repository.save_savepoint("title", "Title")
+            await repository.delete_savepoint("title")
+            await repository.flush_savepoints()
+
+        asyncio.run(run())
+
+        assert repository._unflushed == set()
+
+    def test_flush_without_writes(self, tmp_path):
+        """Flushing with nothing written is a no-op."""
+        repository = make_repository(tmp_path)
+
+        asyncio.run(repository.flush_savepoints())
+
+        assert repository._unflushed == set()
@@ -0,0 +1,83 @@
+"""Unit tests for SemanticCache."""
+
+import asyncio
+
+import pytest
+
+semantic_cache = pytest.importorskip("application.services.semantic_cache")
+SemanticCache = semantic_cache.SemanticCache
+
+
+class StubEmbeddingProvider:
+    """Embedding provider returning fixed vectors by text and counting calls."""
+
+    def __init__(self, vectors):
+        self.vectors = vectors
+        self.calls = 0
+
+    async def get_single_embedding(self, text):
+        self.calls += 1
+        return self.vectors[text]
+
+
+class FailingEmbeddingProvider:
+    """Embedding provider whose every call fails."""
+
+    async def get_single_embedding(self, text):
+        raise ConnectionError("embedding service unavailable")
+
+
+class TestSemanticCache:
+    """Test cases for exact and near-identical lookups."""
+
+    def test_exact_match_hit(self):
+        """Identical text returns the stored result without embedding."""
+        provider = StubEmbeddingProvider({})
+        cache = SemanticCache(embedding_provider=provider)
+        cache.put("Chapter one synopsis", ["Ada"])
+
+        result, embedding = asyncio.run(cache.get("Chapter one synopsis"))
+
+        assert result == ["Ada"]
+        assert embedding is None
+        assert provider.calls == 0
+
+    def test_similar_text_above_threshold_hits(self):
+        """Near-identical text returns the result stored for the closest entry."""
+        provider = StubEmbeddingProvider({"stored": [1.0, 0.0], "query": [0.99, 0.1]})
+        cache = SemanticCache(embedding_provider=provider, similarity_threshold=0.95)
+
+        _, stored_embedding = asyncio.run(cache.get("stored"))
+        cache.put("stored", ["Ada"], stored_embedding)
+        result, embedding = asyncio.run(cache.get("query"))
+
+        assert result == ["Ada"]
+        assert embedding == [0.99, 0.1]
+
+    def test_dissimilar_text_below_threshold_misses(self):
+        """Text below the similarity threshold is a miss, but its embedding is returned for put."""
+        provider = StubEmbeddingProvider({"stored": [1.0, 0.0], "query": [0.6, 0.8]})
+        cache = SemanticCache(embedding_provider=provider, similarity_threshold=0.95)
+
+        _, stored_embedding = asyncio.run(cache.get("stored"))
+        cache.put("stored", ["Ada"], stored_embedding)
+        result, embedding = asyncio.run(cache.get("query"))
+
+        assert result is None
+        assert embedding == [0.6, 0.8]
+
+    def test_without_provider_only_exact_matches(self):
+        """With no embedding provider, only identical text is served."""
+        cache = SemanticCache()
+        cache.put("Chapter one synopsis", ["Ada"])
+
+        assert asyncio.run(cache.get("Chapter one synopsis")) == (["Ada"], None)
+        assert asyncio.run(cache.get("Chapter one synopsis, revised")) == (None, None)
+
+    def test_failing_provider_falls_back_to_exact_matches(self):
+        """An embedding failure is a miss rather than an error."""
+        cache = SemanticCache(embedding_provider=FailingEmbeddingProvider())
+        cache.put("Chapter one synopsis", ["Ada"])
+
+        assert asyncio.run(cache.get("Chapter one synopsis")) == (["Ada"], None)
+        assert asyncio.run(cache.get("Chapter two synopsis")) == (None, None)
@@ -0,0 +1,127 @@
+"""Unit tests for the token-bucket throttle shared by concurrent model calls."""
+
+import asyncio
+
+import pytest
+
+from infrastructure.providers import throttled_provider
+from infrastructure.providers.throttled_provider import TokenThrottle, estimate_tokens
+
+
+class FakeClock:
+    """Monotonic clock that only moves when the throttle sleeps."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    async def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(throttled_provider, "time", clock)
+    monkeypatch.setattr(throttled_provider.asyncio, "sleep", clock.sleep)
+    return clock
+
+
+class TestEstimateTokens:
+    """Test cases for the rough token estimate."""
+
+    def test_four_characters_per_token(self):
+        """Text lengths are summed and divided by four."""
+        assert estimate_tokens(["abcd" * 10, "abcd" * 5]) == 15
+        assert estimate_tokens([]) == 0
+
+
+class TestTokenThrottle:
+    """Test cases for reserving and refilling the request and token budgets."""
+
+    def test_full_bucket_grants_immediately(self, clock):
+        """A fresh throttle grants a reservation within budget without waiting."""
+        throttle = TokenThrottle(requests_per_minute=60, tokens_per_minute=1000)
+
+        asyncio.run(throttle.acquire(100))
+
+        assert clock.sleeps == []
+        assert throttle._tokens == 900
+        assert throttle._requests == 59
+
+    def test_waits_for_token_refill(self, clock):
+        """An exhausted token budget waits exactly as long as the refill needs."""
+        throttle = TokenThrottle(tokens_per_minute=600)
+
+        async def run():
+            await throttle.acquire(600)
+            await throttle.acquire(300)
+
+        asyncio.run(run())
+
+        # 600 tokens per minute refill at 10 per second
+        assert clock.sleeps == [pytest.approx(30)]
+        assert throttle._tokens == pytest.approx(0)
+
+    def test_waits_for_request_slot(self, clock):
+        """Once every request slot is taken, the next call waits for one to refill."""
+        throttle = TokenThrottle(requests_per_minute=2)
+
+        async def run():
+            for _ in range(3):
+                await throttle.acquire(0)
+
+        asyncio.run(run())
+
+        assert clock.sleeps == [pytest.approx(30)]
+
+    def test_refill_capped_at_budget(self, clock):
+        """Idle time never banks more than one minute's budget."""
+        throttle = TokenThrottle(tokens_per_minute=600)
+
+        async def run():
+            await throttle.acquire(600)
+            clock.now += 3600
+            await throttle.acquire(600)
+            await throttle.acquire(60)
+
+        asyncio.run(run())
+
+        assert clock.sleeps == [pytest.approx(6)]
+
+    def test_oversized_call_waits_for_full_bucket(self, clock):
+        """A call larger than the whole budget is granted once the bucket is full."""
+        throttle = TokenThrottle(tokens_per_minute=100)
+
+        asyncio.run(throttle.acquire(500))
+
+        assert clock.sleeps == []
+        assert throttle._tokens == 0
+
+    def test_refund_returns_and_charges_tokens(self, clock):
+        """Refunds return unused tokens up to the budget; negative refunds charge more."""
+        throttle = TokenThrottle(tokens_per_minute=1000)
+        asyncio.run(throttle.acquire(400))
+
+        throttle.refund(100)
+        assert throttle._tokens == 700
+        throttle.refund(-200)
+        assert throttle._tokens == 500
+        throttle.refund(10000)
+        assert throttle._tokens == 1000
+
+    def test_no_limits_never_waits(self, clock):
+        """Without configured budgets every call is granted at once."""
+        throttle = TokenThrottle()
+
+        async def run():
+            for _ in range(100):
+                await throttle.acquire(10000)
+
+        asyncio.run(run())
+
+        assert clock.sleeps == []